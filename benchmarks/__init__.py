@@ -0,0 +1,9 @@
+"""
+Headless benchmarks for pgzhelper.
+
+Run them from the repository root with:
+
+    python -m benchmarks
+
+The benchmarks run under SDL's dummy video driver, so they work without a window or a webcam. Results are written as JSON and checked against thresholds.json.
+"""
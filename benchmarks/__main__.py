@@ -0,0 +1,72 @@
+"""
+Runs the pgzhelper benchmarks.
+
+    python -m benchmarks [--output results.json] [--thresholds benchmarks/thresholds.json] [--frames 300] [--only draw.]
+
+Exits with 1 when a result is over its threshold.
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import sys
+from . import _harness
+from ._harness import BENCHMARKS
+from . import bench_import, bench_draw, bench_shapes, bench_camera, bench_runner, bench_record
+
+def check_thresholds(results: dict[str, dict[str, float]], thresholds: dict[str, dict[str, float]]) -> list[str]:
+    """
+    Compares the results with the thresholds.
+
+    :param results: The results, by benchmark name.
+    :param thresholds: The highest allowed value of each result, by benchmark name.
+
+    :return list[str]: A message for every result that is over its threshold.
+    """
+    failures = []
+    for name, limits in thresholds.items():
+        for key, limit in limits.items():
+            value = results.get(name, {}).get(key)
+            if value is not None and value > limit:
+                failures.append(f"{name} {key} = {value:.3f} (threshold {limit})")
+    return failures
+
+def main(argv: list[str] = None) -> int:
+    """
+    Runs the benchmarks, prints and saves the results, and checks the thresholds.
+
+    :param argv: The command line arguments. Defaults to sys.argv[1:].
+
+    :return int: 0 when every result is under its threshold, otherwise 1.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Headless benchmarks for pgzhelper.")
+    parser.add_argument("--output", default="bench_output.json", help="Where to write the JSON results.")
+    parser.add_argument("--thresholds", default=os.path.join(os.path.dirname(__file__), "thresholds.json"), help="The JSON thresholds to check against. Use an empty string to skip the check.")
+    parser.add_argument("--frames", type=int, default=_harness.FRAMES, help="How many frames the runner benchmarks run.")
+    parser.add_argument("--only", default="", help="Only run benchmarks whose name starts with this.")
+    args = parser.parse_args(argv)
+    _harness.FRAMES = args.frames
+
+    results = {}
+    for name, func in BENCHMARKS.items():
+        if not name.startswith(args.only):
+            continue
+        results[name] = func()
+        summary = ", ".join(f"{key}={value:.3f}" for key, value in results[name].items()) or "skipped"
+        print(f"{name}: {summary}")
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+
+    if args.thresholds:
+        with open(args.thresholds, encoding="utf-8") as file:
+            failures = check_thresholds(results, json.load(file))
+        for failure in failures:
+            print(f"REGRESSION: {failure}")
+        if failures:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Headless harness for the pgzhelper benchmarks: a dummy display, a simulated clock, synthetic camera frames and timing helpers."""
+
+from __future__ import annotations
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+import pygame
+import pgzero.screen
+from typing import Callable, Optional
+from pgzhelper import _core, _runner, _camera
+from pgzhelper._sources import ArraySource
+
+BENCHMARKS = {}
+"""Every registered benchmark, by name."""
+
+FRAMES = 300
+"""How many frames run_loop() runs by default. Set by the --frames option."""
+
+def benchmark(name: str) -> Callable[[Callable[[], dict[str, float]]], Callable[[], dict[str, float]]]:
+    """
+    Registers a benchmark. The benchmark function returns a dict of results (in milliseconds unless the key says otherwise).
+
+    :param name: The name of the benchmark, like "draw.text".
+
+    :return Callable: The decorator.
+    """
+    def register(func: Callable[[], dict[str, float]]) -> Callable[[], dict[str, float]]:
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+class SimulatedClock:
+    """A clock whose sleeps return straight away but still move time forward, so pacing code runs at full speed."""
+    def __init__(self) -> None:
+        """Creates a new SimulatedClock."""
+        self.offset = 0.0
+        """How much time has been slept, in seconds."""
+
+    def now(self) -> float:
+        """
+        Gets the current simulated time.
+
+        :return float: The real time plus the time slept, in seconds.
+        """
+        return time.perf_counter() + self.offset
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Moves time forward without sleeping.
+
+        :param seconds: How long to sleep, in seconds.
+        """
+        self.offset += seconds
+
+def make_screen(size: tuple[int, int] = (800, 600)) -> pgzero.screen.Screen:
+    """
+    Opens a dummy display and initializes pgzhelper's Screen with it.
+
+    :param size: The size of the display. Defaults to (800, 600).
+
+    :return pgzero.screen.Screen: The pgzero screen.
+    """
+    pygame.init()
+    screen = pgzero.screen.Screen(pygame.display.set_mode(size))
+    _core._init(screen)
+    return screen
+
+def measure(func: Callable[[], object], repeat: int = 200, warmup: int = 10, interval: float = 0) -> dict[str, float]:
+    """
+    Times a function.
+
+    :param func: The function to time.
+    :param repeat: How many timed calls to make. Defaults to 200.
+    :param warmup: How many untimed calls to make first. Defaults to 10.
+    :param interval: How long to wait (untimed) between calls, in seconds, like the gap between frames. Defaults to 0.
+
+    :return dict[str, float]: The mean, p50 and p95 time of one call, in milliseconds.
+    """
+    for _ in range(warmup):
+        func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+        if interval:
+            time.sleep(interval)
+    times.sort()
+    return {
+        "mean_ms": sum(times) / len(times) * 1000,
+        "p50_ms": times[len(times) // 2] * 1000,
+        "p95_ms": times[min(len(times) - 1, int(len(times) * 0.95))] * 1000,
+    }
+
+def run_loop(functions: dict[str, Callable], frames: Optional[int] = None, size: tuple[int, int] = (800, 600)) -> dict[str, float]:
+    """
+    Runs frames the way pgzhelper_run.go() does, but without pgzero's loop and with a simulated clock.
+
+    :param functions: The user's functions by name (draw, update, on_mouse_move, ...).
+    :param frames: How many frames to run. Defaults to None (FRAMES).
+    :param size: The size of the display. Defaults to (800, 600).
+
+    :return dict[str, float]: The p50 and p95 time of each part of the frame, in milliseconds, and the simulated frames per second.
+    """
+    if frames is None:
+        frames = FRAMES
+    clock = SimulatedClock()
+    namespace = {"__name__": "__main__", "screen": make_screen(size)}
+    _runner._install(namespace, functions, clock=clock.now, sleep=clock.sleep)
+    _core._frame_profiler.reset()
+    start = clock.now()
+    for _ in range(frames):
+        namespace["update"]()
+        namespace["draw"]()
+    elapsed = clock.now() - start
+    results = {"simulated_fps": frames / elapsed}
+    for phase, times in _core._frame_profiler.get_summary().items():
+        results[f"{phase}_p50_ms"] = times["p50"]
+        results[f"{phase}_p95_ms"] = times["p95"]
+    return results
+
+def synthetic_frame(width: int, height: int, index: int) -> np.ndarray:
+    """
+    Makes a BGR camera frame: a gradient background with a moving "person" blob.
+
+    :param width: The width of the frame.
+    :param height: The height of the frame.
+    :param index: The frame number. The blob moves with it.
+
+    :return np.ndarray: The frame, shape (height, width, 3), dtype uint8.
+    """
+    y, x = np.mgrid[0:height, 0:width]
+    frame = np.empty((height, width, 3), np.uint8)
+    frame[..., 0] = (x * 255 // max(width - 1, 1)).astype(np.uint8)
+    frame[..., 1] = (y * 255 // max(height - 1, 1)).astype(np.uint8)
+    frame[..., 2] = 128
+    cx = width // 2 + int(width / 4 * np.sin(index / 15))
+    blob = (x - cx) ** 2 + (y - height // 2) ** 2 < (height // 4) ** 2
+    frame[blob] = (60, 90, 200)
+    return frame
+
+def synthetic_mask(width: int, height: int, index: int) -> np.ndarray:
+    """
+    Makes the true mask of synthetic_frame()'s "person" blob.
+
+    :param width: The width of the frame.
+    :param height: The height of the frame.
+    :param index: The frame number.
+
+    :return np.ndarray: 1 inside the blob and 0 outside, shape (height, width), dtype float32.
+    """
+    y, x = np.mgrid[0:height, 0:width]
+    cx = width // 2 + int(width / 4 * np.sin(index / 15))
+    return ((x - cx) ** 2 + (y - height // 2) ** 2 < (height // 4) ** 2).astype(np.float32)
+
+def load_synthetic_camera(width: int = 640, height: int = 480, segmenter: Optional[object] = None, fps: float = 0, threaded: bool = False, count: int = 30, default: bool = True) -> _camera.Camera:
+    """
+    Loads a pgzhelper Camera with synthetic frames instead of a webcam.
+
+    :param width: The width of the frames. Defaults to 640.
+    :param height: The height of the frames. Defaults to 480.
+    :param segmenter: The MediaPipe segmenter to use for background removal. Defaults to None (background removal is not available).
+    :param fps: How many frames per second the fake camera delivers. Defaults to 0 (as fast as they are read).
+    :param threaded: Whether to read frames on a background thread, like load_camera(threaded=True). Defaults to False.
+    :param count: How many different frames to loop through. 1 is a camera pointed at a still scene. Defaults to 30.
+    :param default: Whether the camera becomes the one used by load_camera() and the other camera functions. Defaults to True.
+
+    :return Camera: The camera. Its capture is an ArraySource of synthetic frames.
+    """
+    if segmenter is not None:
+        _camera._segmenter = segmenter
+    frames = np.stack([synthetic_frame(width, height, i) for i in range(count)])
+    camera = _camera.Camera(ArraySource(frames, fps, "realtime" if fps else "fast"), threaded)
+    if default:
+        _camera._set_default_camera(camera)
+    return camera
+
+def load_segmenter() -> Optional[object]:
+    """
+    Creates a MediaPipe segmenter from the model bundled with pgzhelper.
+
+    :return object: The segmenter.
+    :return None: When MediaPipe is not installed.
+    """
+    try:
+        return _camera._create_segmenter()
+    except ImportError:
+        return None
+
+def unload_camera() -> None:
+    """Closes every synthetic camera and forgets the segmenter, so later benchmarks run without them."""
+    for camera in _camera.get_cameras():
+        camera.close()
+    _camera._segmenter = None
@@ -0,0 +1,377 @@
+"""Benchmarks for the camera pipeline, using synthetic frames instead of a webcam."""
+
+from __future__ import annotations
+import os
+import tempfile
+import time
+import tracemalloc
+import cv2
+import numpy as np
+from ._harness import benchmark, load_synthetic_camera, load_segmenter, make_screen, measure, synthetic_frame, synthetic_mask, unload_camera
+from pgzhelper import _camera
+from pgzhelper._compositor import Compositor
+from pgzhelper._layout import CameraLayout
+from pgzhelper._sources import VideoFileSource
+from pgzhelper._sharing import FramePublisher, FrameReader
+from pgzhelper._segmentation import BACKENDS, open_backend
+
+@benchmark("camera.update")
+def bench_camera_update() -> dict[str, float]:
+    load_synthetic_camera()
+    try:
+        return measure(_camera.camera_update_func, repeat=100)
+    finally:
+        unload_camera()
+
+@benchmark("camera.update_allocations")
+def bench_camera_update_allocations() -> dict[str, float]:
+    load_synthetic_camera()
+    try:
+        for _ in range(10):
+            _camera.camera_update_func()
+        frames = 100
+        tracemalloc.start()
+        try:
+            start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            for _ in range(frames):
+                _camera.camera_update_func()
+            end, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return {
+            "net_bytes_per_frame": (end - start) / frames,
+            "peak_kb": (peak - start) / 1024,
+        }
+    finally:
+        unload_camera()
+
+@benchmark("camera.update_video_file")
+def bench_camera_update_video_file() -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "clip.avi")
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 30, (640, 480))
+        for index in range(30):
+            writer.write(synthetic_frame(640, 480, index))
+        writer.release()
+        camera = _camera.Camera(VideoFileSource(path, "fast", loop=True), threaded=False)
+        _camera._set_default_camera(camera)
+        try:
+            return measure(_camera.camera_update_func, repeat=100)
+        finally:
+            unload_camera()
+
+@benchmark("camera.update_blocking_30fps")
+def bench_camera_update_blocking() -> dict[str, float]:
+    load_synthetic_camera(fps=30)
+    try:
+        return measure(_camera.camera_update_func, repeat=30, warmup=2)
+    finally:
+        unload_camera()
+
+@benchmark("camera.update_threaded_30fps")
+def bench_camera_update_threaded() -> dict[str, float]:
+    load_synthetic_camera(fps=30, threaded=True)
+    try:
+        results = measure(_camera.camera_update_func, repeat=60, warmup=2, interval=1 / 60)
+        results.update(_camera.get_stats())
+        return results
+    finally:
+        unload_camera()
+
+@benchmark("camera.latency_threaded_30fps")
+def bench_camera_latency_threaded() -> dict[str, float]:
+    screen = make_screen((640, 480))
+    camera = load_synthetic_camera(fps=30, threaded=True)
+
+    def frame() -> None:
+        camera.update()
+        camera.draw(screen)
+
+    try:
+        measure(frame, repeat=90, warmup=2, interval=1 / 60)
+        latencies = camera.get_latency_percentiles()
+        return {"latency_p50_ms": latencies["p50"], "latency_p95_ms": latencies["p95"]}
+    finally:
+        unload_camera()
+
+@benchmark("camera.update_zoom")
+def bench_camera_update_zoom() -> dict[str, float]:
+    load_synthetic_camera()
+    _camera.set_zoom_factor(2)
+    try:
+        return measure(_camera.camera_update_func, repeat=100)
+    finally:
+        unload_camera()
+
+@benchmark("camera.update_ptz")
+def bench_camera_update_ptz() -> dict[str, float]:
+    camera = load_synthetic_camera()
+    try:
+        frame = synthetic_frame(640, 480, 0)
+        resized = np.empty_like(frame)
+        rgb = np.empty_like(frame)
+
+        def legacy() -> None:
+            camera.capture.read(frame)
+            crop = frame[120:360, 160:480]
+            cv2.resize(crop, (640, 480), dst=resized)
+            cv2.cvtColor(resized, cv2.COLOR_BGR2RGB, dst=rgb)
+
+        results = {"legacy_zoom2_p50_ms": measure(legacy, repeat=100)["p50_ms"]}
+        camera.set_zoom_factor(2)
+        results["zoom2_p50_ms"] = measure(camera.update, repeat=100)["p50_ms"]
+        camera.set_region((300, 200, 40, 30))
+        results["small_region_p50_ms"] = measure(camera.update, repeat=100)["p50_ms"]
+        results["static_crops_built"] = camera.ptz.crops_built
+        camera.set_region((0, 0, 320, 240), duration=10, tween="linear")
+        results["moving_p50_ms"] = measure(camera.update, repeat=100)["p50_ms"]
+        return results
+    finally:
+        unload_camera()
+
+@benchmark("camera.publish")
+def bench_camera_publish() -> dict[str, float]:
+    camera = load_synthetic_camera()
+    try:
+        results = {"update_p50_ms": measure(camera.update, repeat=200)["p50_ms"]}
+        publisher = FramePublisher(camera.width, camera.height)
+        try:
+            frame = camera._rgb_buffer
+            results["idle_publish_us"] = measure(lambda: publisher.publish(frame), repeat=1000)["mean_ms"] * 1000
+            camera.start_publishing()
+            results["idle_update_p50_ms"] = measure(camera.update, repeat=200)["p50_ms"]
+            reader = FrameReader(camera.publisher.name)
+            results["read_update_p50_ms"] = measure(lambda: (camera.update(), reader.latest()), repeat=200)["p50_ms"]
+            results["frames_published"] = camera.publisher.frames_published
+            reader.close()
+        finally:
+            publisher.close()
+        return results
+    finally:
+        unload_camera()
+
+@benchmark("camera.update_remove_background")
+def bench_camera_update_remove_background() -> dict[str, float]:
+    segmenter = load_segmenter()
+    if segmenter is None:
+        return {}
+    load_synthetic_camera(segmenter=segmenter)
+    _camera.remove_background((0, 255, 0))
+    try:
+        return measure(_camera.camera_update_func, repeat=30, warmup=3)
+    finally:
+        unload_camera()
+        segmenter.close()
+
+@benchmark("camera.update_remove_background_async")
+def bench_camera_update_remove_background_async() -> dict[str, float]:
+    segmenter = load_segmenter()
+    if segmenter is None:
+        return {}
+    load_synthetic_camera(segmenter=segmenter, fps=30, threaded=True)
+    _camera.remove_background((0, 255, 0), asynchronous=True, max_mask_age=0.2)
+    try:
+        results = measure(_camera.camera_update_func, repeat=60, warmup=3, interval=1 / 60)
+        results.update(_camera.get_stats())
+        return results
+    finally:
+        unload_camera()
+        segmenter.close()
+
+@benchmark("camera.update_static_scene")
+def bench_camera_update_static_scene() -> dict[str, float]:
+    segmenter = load_segmenter()
+    if segmenter is None:
+        return {}
+    load_synthetic_camera(segmenter=segmenter, count=1)
+    _camera.remove_background((0, 255, 0))
+    _camera.set_motion_threshold(1.0)
+    try:
+        results = measure(_camera.camera_update_func, repeat=100, warmup=3)
+        results.update(_camera.get_stats())
+        return results
+    finally:
+        unload_camera()
+        segmenter.close()
+
+@benchmark("camera.composite")
+def bench_camera_composite() -> dict[str, float]:
+    frame = cv2.cvtColor(synthetic_frame(640, 480, 0), cv2.COLOR_BGR2RGB)
+    y, x = np.mgrid[0:480, 0:640]
+    mask = np.clip(1.5 - np.hypot(x - 320, y - 240) / 120, 0, 1).astype(np.float32)
+    image = synthetic_frame(800, 600, 15)
+    work = frame.copy()
+
+    def legacy() -> None:
+        background = np.zeros_like(frame)
+        background[:] = (0, 255, 0)
+        np.where((mask > 0.5)[..., None], frame, background)
+
+    compositor = Compositor(640, 480)
+    results = {"legacy_p50_ms": measure(legacy, repeat=50)["p50_ms"]}
+    for name, setup, feather in (
+        ("color", lambda: compositor.set_color((0, 255, 0)), 0),
+        ("image", lambda: compositor.set_image(image), 0),
+        ("blur", lambda: compositor.set_blur(15), 0),
+        ("color_feather", lambda: compositor.set_color((0, 255, 0)), 4),
+    ):
+        setup()
+        results[f"{name}_p50_ms"] = measure(lambda: (np.copyto(work, frame), compositor.composite(work, mask, feather)), repeat=50)["p50_ms"]
+    results["planes_built"] = compositor.planes_built
+    return results
+
+MASK_SCALES = (1.0, 0.75, 0.5, 0.25)
+"""The mask scales compared by camera.mask_scale."""
+
+def _edge_error(mask: np.ndarray, truth: np.ndarray) -> float:
+    """
+    Measures how far a mask is from the true mask around its edge, where scaling a mask up goes wrong.
+
+    :param mask: The mask, from 0 to 1.
+    :param truth: The true mask, 0 or 1.
+
+    :return float: The mean absolute difference within 4 pixels of the true edge.
+    """
+    kernel = np.ones((9, 9), np.uint8)
+    band = cv2.dilate(truth, kernel) != cv2.erode(truth, kernel)
+    return float(np.abs(mask - truth)[band].mean())
+
+def _person_frame(width: int, height: int, index: int) -> np.ndarray:
+    """
+    Makes an RGB frame with a drawn head and shoulders, which MediaPipe finds as a person, unlike synthetic_frame()'s blob.
+
+    :param width: The width of the frame.
+    :param height: The height of the frame.
+    :param index: The frame number. The person moves with it.
+
+    :return np.ndarray: The frame, shape (height, width, 3), dtype uint8.
+    """
+    frame = np.empty((height, width, 3), np.uint8)
+    frame[...] = (170, 175, 180)
+    cx = width // 2 + int(width / 8 * np.sin(index / 15))
+    cy = height * 2 // 5
+    cv2.ellipse(frame, (cx, height), (width * 13 // 40, height * 13 // 30), 0, 180, 360, (40, 60, 120), -1)
+    cv2.rectangle(frame, (cx - width // 30, cy + height // 8), (cx + width // 30, height * 3 // 4), (195, 150, 120), -1)
+    cv2.ellipse(frame, (cx, cy), (width * 13 // 110, height * 13 // 60), 0, 0, 360, (205, 160, 130), -1)
+    cv2.ellipse(frame, (cx, cy - height * 13 // 80), (width * 13 // 100, height * 13 // 140), 0, 180, 360, (50, 35, 30), -1)
+    for eye_x in (cx - width // 30, cx + width // 30):
+        cv2.circle(frame, (eye_x, cy - height // 30), max(1, width // 128), (40, 30, 30), -1)
+    cv2.ellipse(frame, (cx, cy + height // 14), (width // 40, height // 80), 0, 0, 180, (150, 60, 60), -1)
+    return frame
+
+def _iou(mask: np.ndarray, reference: np.ndarray) -> float:
+    """
+    Measures how much two masks agree, as the intersection over union of where each is over 0.5.
+
+    :param mask: The mask, from 0 to 1.
+    :param reference: The mask it is compared to, from 0 to 1.
+
+    :return float: The intersection over union, from 0 to 1. 1 when both masks are empty.
+    """
+    mask, reference = mask > 0.5, reference > 0.5
+    union = np.count_nonzero(mask | reference)
+    return np.count_nonzero(mask & reference) / union if union else 1.0
+
+@benchmark("camera.mask_scale")
+def bench_camera_mask_scale() -> dict[str, float]:
+    indices = range(0, 70, 7)
+    frames = [cv2.cvtColor(synthetic_frame(640, 480, index), cv2.COLOR_BGR2RGB) for index in indices]
+    truths = [synthetic_mask(640, 480, index) for index in indices]
+    results = {}
+    for scale in MASK_SCALES[1:]:
+        size = (round(640 * scale), round(480 * scale))
+        smalls = [cv2.resize(frame, size, interpolation=cv2.INTER_AREA) for frame in frames]
+        masks = [cv2.resize(truth, size, interpolation=cv2.INTER_AREA) for truth in truths]
+        name = f"s{scale:g}"
+        for method, edge_aware in (("bilinear", False), ("refined", True)):
+            errors = [_edge_error(_camera._upsample_mask(mask, small, frame, edge_aware), truth) for mask, small, frame, truth in zip(masks, smalls, frames, truths)]
+            results[f"{name}_{method}_edge_error"] = float(np.mean(errors))
+            results[f"{name}_{method}_ms"] = measure(lambda: _camera._upsample_mask(masks[0], smalls[0], frames[0], edge_aware), repeat=50)["p50_ms"]
+        results[f"{name}_refined_vs_bilinear"] = results[f"{name}_refined_edge_error"] / results[f"{name}_bilinear_edge_error"]
+
+    camera = load_synthetic_camera()
+    camera.backend = open_backend("mog2")
+    try:
+        for scale in MASK_SCALES:
+            camera.mask_scale = scale
+            results[f"s{scale:g}_ms"] = measure(lambda: camera._segment_scaled(frames[0]), repeat=50, warmup=5)["p50_ms"]
+    finally:
+        camera.backend.close()
+        unload_camera()
+
+    segmenter = load_segmenter()
+    if segmenter is None:
+        return results
+    people = [_person_frame(1280, 720, index) for index in indices]
+    camera = load_synthetic_camera(1280, 720, segmenter=segmenter)
+    try:
+        references = [camera._segment_scaled(person).copy() for person in people]
+        for scale in MASK_SCALES:
+            camera.mask_scale = scale
+            name = f"mediapipe_s{scale:g}"
+            results[f"{name}_ms"] = measure(lambda: camera._segment_scaled(people[0]), repeat=50, warmup=5)["p50_ms"]
+            results[f"{name}_iou"] = float(np.mean([_iou(camera._segment_scaled(person), reference) for person, reference in zip(people, references)]))
+        return results
+    finally:
+        unload_camera()
+        segmenter.close()
+
+@benchmark("camera.backends")
+def bench_camera_backends() -> dict[str, float]:
+    frames = [cv2.cvtColor(synthetic_frame(640, 480, index), cv2.COLOR_BGR2RGB) for index in range(30)]
+    results = {}
+    for name in BACKENDS:
+        for scale in (1, 0.5):
+            try:
+                backend = load_segmenter() if name == "mediapipe" else open_backend(name)
+            except ImportError:
+                backend = None
+            if backend is None:
+                break
+            scaled = [cv2.resize(frame, (round(640 * scale), round(480 * scale)), interpolation=cv2.INTER_AREA) for frame in frames]
+            try:
+                for frame in scaled[:5]:
+                    backend.segment(frame)
+                times = []
+                for frame in scaled:
+                    start = time.perf_counter()
+                    backend.segment(frame)
+                    times.append(time.perf_counter() - start)
+                results[f"{name}_s{scale:g}_p50_ms"] = sorted(times)[len(times) // 2] * 1000
+            finally:
+                backend.close()
+    return results
+
+@benchmark("camera.draw")
+def bench_camera_draw() -> dict[str, float]:
+    screen = make_screen((640, 480))
+    load_synthetic_camera()
+    _camera.camera_update_func()
+    try:
+        return measure(lambda: _camera.camera_draw_func(screen), repeat=500)
+    finally:
+        unload_camera()
+
+def _bench_layout(mode: str) -> dict[str, float]:
+    screen = make_screen((800, 600))
+    cameras = [load_synthetic_camera(default=False), load_synthetic_camera(320, 240, default=False)]
+    layout = CameraLayout(cameras, (800, 600), mode)
+
+    def frame() -> None:
+        for camera in cameras:
+            camera.update()
+        layout.draw(screen)
+
+    try:
+        return measure(frame, repeat=200)
+    finally:
+        unload_camera()
+
+@benchmark("camera.layout_grid")
+def bench_camera_layout_grid() -> dict[str, float]:
+    return _bench_layout("grid")
+
+@benchmark("camera.layout_pip")
+def bench_camera_layout_pip() -> dict[str, float]:
+    return _bench_layout("pip")
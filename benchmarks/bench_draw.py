@@ -0,0 +1,113 @@
+"""Benchmarks for the Screen.draw functions."""
+
+from __future__ import annotations
+from ._harness import benchmark, make_screen, measure
+from pgzhelper import Screen, Rect, Polygon
+from pgzhelper import _core, DisplayList
+
+@benchmark("draw.text")
+def bench_text() -> dict[str, float]:
+    make_screen()
+    return measure(lambda: Screen.draw.text("Score: 12345", topleft=(10, 10), fontsize=32, color="white"))
+
+@benchmark("draw.text_changing")
+def bench_text_changing() -> dict[str, float]:
+    make_screen()
+    counter = iter(range(10 ** 9))
+    return measure(lambda: Screen.draw.text(f"Score: {next(counter)}", topleft=(10, 10), fontsize=32, color="white"))
+
+@benchmark("draw.text_cache")
+def bench_text_cache() -> dict[str, float]:
+    make_screen()
+    style = dict(fontsize=32, color="white", background="black", bold=False, italic=False, underline=False, owidth=1, ocolor="blue", shadow=(1, 1))
+    box = Rect(10, 100, 300, 120)
+    Screen.text_cache.invalidate()
+    _core._text_cache.reset_stats()
+    results = {f"legacy_{key}": value for key, value in measure(lambda: _core._drawer.text("Main menu: press space", topleft=(10, 10), **style)).items()}
+    results.update(measure(lambda: Screen.draw.text("Main menu: press space", topleft=(10, 10), **style)))
+    results["legacy_textbox_p50_ms"] = measure(lambda: _core._drawer.textbox("Press space to start the game", box, color="white"))["p50_ms"]
+    results["textbox_p50_ms"] = measure(lambda: Screen.draw.textbox("Press space to start the game", box, color="white"))["p50_ms"]
+    results["hit_rate"] = Screen.text_cache.get_stats()["hit_rate"]
+    return results
+
+@benchmark("draw.dynamic_text")
+def bench_dynamic_text() -> dict[str, float]:
+    make_screen()
+    counter = iter(range(10 ** 9))
+    results = {}
+    for name, style in (("plain", {}), ("outline", {"owidth": 1, "ocolor": "black"})):
+        Screen.text_cache.invalidate()
+        results[f"legacy_{name}_p50_ms"] = measure(lambda: Screen.draw.text(f"Score: {next(counter)}", topleft=(10, 10), fontsize=32, color="white", **style))["p50_ms"]
+        results[f"{name}_p50_ms"] = measure(lambda: Screen.draw.dynamic_text(f"Score: {next(counter)}", topleft=(10, 10), fontsize=32, color="white", **style))["p50_ms"]
+    return results
+
+@benchmark("draw.rect")
+def bench_rect() -> dict[str, float]:
+    make_screen()
+    rect = Rect(50, 50, 300, 200)
+    return measure(lambda: Screen.draw.rect(rect, (255, 0, 0), 3), repeat=1000)
+
+@benchmark("draw.filled_rect")
+def bench_filled_rect() -> dict[str, float]:
+    make_screen()
+    rect = Rect(50, 50, 300, 200)
+    return measure(lambda: Screen.draw.filled_rect(rect, (255, 0, 0)), repeat=1000)
+
+@benchmark("draw.polygon")
+def bench_polygon() -> dict[str, float]:
+    make_screen()
+    polygon = Polygon([(100, 100), (300, 120), (350, 300), (200, 380), (90, 250)])
+    return measure(lambda: Screen.draw.polygon(polygon.points, (0, 255, 0), 2), repeat=1000)
+
+@benchmark("draw.circle")
+def bench_circle() -> dict[str, float]:
+    make_screen()
+    return measure(lambda: Screen.draw.circle((400, 300), 120, (0, 0, 255), 4), repeat=1000)
+
+def _legacy_gradient_line(start_pos: tuple[int, int], end_pos: tuple[int, int], start_color: tuple[int, int, int], end_color: tuple[int, int, int], thickness: int) -> None:
+    x1, y1 = start_pos
+    dx, dy = end_pos[0] - x1, end_pos[1] - y1
+    steps = max(abs(dx), abs(dy))
+    for i in range(int(steps) + 1):
+        t = i / steps
+        color = Screen.lerp_color(start_color, end_color, t)
+        Screen.draw.filled_rect(Rect((int(x1 + t * dx), int(y1 + t * dy)), (thickness, thickness)), color)
+
+@benchmark("draw.gradient_line")
+def bench_gradient_line() -> dict[str, float]:
+    make_screen()
+    results = {"legacy_p50_ms": measure(lambda: _legacy_gradient_line((0, 0), (799, 599), (255, 0, 0), (0, 0, 255), 4), repeat=20, warmup=2)["p50_ms"]}
+    results.update(measure(lambda: Screen.draw.gradient_line((0, 0), (799, 599), (255, 0, 0), (0, 0, 255), 4)))
+    results["antialias_p50_ms"] = measure(lambda: Screen.draw.gradient_line((0, 0), (799, 599), (255, 0, 0), (0, 0, 255), 4, antialias=True))["p50_ms"]
+    results["thick_p50_ms"] = measure(lambda: Screen.draw.gradient_line((0, 0), (799, 599), (255, 0, 0), (0, 0, 255), 20))["p50_ms"]
+    return results
+
+def _scene(x: int) -> None:
+    Screen.fill((20, 30, 40))
+    for i in range(20):
+        Screen.draw.rect(Rect(10 + i * 30, 10, 25, 25), (255, 0, 0), 2)
+        Screen.draw.filled_circle((20 + i * 30, 100), 10, (0, 0, 255))
+    Screen.draw.circle((x, 300), 30, (255, 255, 255), 2)
+    Screen.draw.text("Main menu", topleft=(10, 500), fontsize=32, color="white")
+
+@benchmark("draw.display_list")
+def bench_display_list() -> dict[str, float]:
+    screen = make_screen()
+    screen_rect = screen.surface.get_rect()
+    results = {"direct_p50_ms": measure(lambda: _scene(100))["p50_ms"]}
+
+    def record() -> DisplayList:
+        display_list = Screen.display_list.begin()
+        _scene(100)
+        return Screen.display_list.end()
+
+    results["record_p50_ms"] = measure(record)["p50_ms"]
+    previous, current = record(), record()
+    current.commands[-2] = ("circle", (130, 300), 30, (255, 255, 255, 255), 2)
+    results["replay_p50_ms"] = measure(lambda: Screen.display_list.replay(current))["p50_ms"]
+    results["diff_p50_ms"] = measure(lambda: current.diff(previous, screen_rect))["p50_ms"]
+    changed = current.diff(previous, screen_rect)
+    results["changed_rects"] = len(changed)
+    results["partial_replay_p50_ms"] = measure(lambda: [Screen.display_list.replay(current, rect) for rect in changed])["p50_ms"]
+    return results
+
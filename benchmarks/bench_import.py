@@ -0,0 +1,42 @@
+"""Benchmarks for how long `import pgzhelper` takes, and a check that drawing does not import the camera stack."""
+
+from __future__ import annotations
+import json
+import os
+import subprocess
+import sys
+from ._harness import benchmark
+
+HEAVY_MODULES = ("cv2", "mediapipe", "collide_circle")
+"""Modules that should only be imported when the camera (or the feature that needs them) is used."""
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import pgzhelper
+import_ms = (time.perf_counter() - start) * 1000
+from pgzhelper import Screen, _core
+import pygame, pgzero.screen
+pygame.init()
+_core._init(pgzero.screen.Screen(pygame.display.set_mode((200, 200))))
+Screen.fill("black")
+Screen.draw.rect(pgzhelper.Rect(10, 10, 50, 50), "red", 2)
+Screen.draw.circle((100, 100), 20, "blue")
+Screen.draw.text("hello", topleft=(5, 5))
+print(json.dumps({"import_ms": import_ms, "heavy_modules": [name for name in %r if name in sys.modules]}))
+"""
+
+@benchmark("import.pgzhelper")
+def bench_import() -> dict[str, float]:
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env = dict(os.environ, PYTHONPATH=src + os.pathsep + os.environ.get("PYTHONPATH", ""), SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    times = []
+    heavy = []
+    for _ in range(3):
+        output = subprocess.run([sys.executable, "-c", _SCRIPT % (HEAVY_MODULES,)], env=env, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        times.append(result["import_ms"])
+        heavy = result["heavy_modules"]
+    if heavy:
+        print(f"import.pgzhelper: drawing imported {', '.join(heavy)}")
+    return {"import_ms": min(times), "heavy_modules_count": len(heavy)}
@@ -0,0 +1,73 @@
+"""Benchmarks for recording the screen, writing to a temporary folder."""
+
+from __future__ import annotations
+import os
+import tempfile
+import time
+import pygame
+import numpy as np
+from ._harness import benchmark, make_screen, measure
+from pgzhelper._recorder import Recorder
+
+def _fill(surface: pygame.Surface, index: int) -> None:
+    """
+    Draws something different on the surface each frame, so the encoder has real work.
+
+    :param surface: The surface.
+    :param index: The frame number.
+    """
+    surface.fill((index * 3 % 256, 40, 90))
+    pygame.draw.circle(surface, (255, 255, 255), (index * 7 % surface.get_width(), 300), 40)
+
+@benchmark("record.submit_surface")
+def bench_record_submit_surface() -> dict[str, float]:
+    screen = make_screen()
+    surface = screen.surface
+    legacy = measure(lambda: np.ascontiguousarray(pygame.surfarray.pixels3d(surface).swapaxes(0, 1)), repeat=30, warmup=2)
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = Recorder(os.path.join(directory, "screen.avi"), fps=60, policy="drop", fourcc="MJPG")
+        index = 0
+
+        def frame() -> float:
+            nonlocal index
+            _fill(surface, index)
+            index += 1
+            start = time.perf_counter()
+            recorder.submit_surface(surface)
+            return time.perf_counter() - start
+
+        for _ in range(5):
+            frame()
+        times = []
+        for _ in range(120):
+            times.append(frame())
+            time.sleep(1 / 60)
+        recorder.stop()
+        times.sort()
+        stats = recorder.get_stats()
+        return {
+            "p50_ms": times[len(times) // 2] * 1000,
+            "p95_ms": times[int(len(times) * 0.95)] * 1000,
+            "legacy_copy_p50_ms": legacy["p50_ms"],
+            "frames_written": stats["frames_written"],
+            "dropped_fraction": stats["frames_dropped"] / stats["frames_submitted"],
+        }
+
+@benchmark("record.block")
+def bench_record_block() -> dict[str, float]:
+    screen = make_screen()
+    surface = screen.surface
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = Recorder(os.path.join(directory, "screen.avi"), fps=60, queue_size=4, policy="block", fourcc="MJPG")
+        start = time.perf_counter()
+        for index in range(60):
+            _fill(surface, index)
+            recorder.submit_surface(surface)
+        recorder.stop()
+        elapsed = time.perf_counter() - start
+        stats = recorder.get_stats()
+        return {
+            "ms_per_frame": elapsed * 1000 / 60,
+            "blocked_ms": stats["blocked_ms"],
+            "frames_lost": stats["frames_submitted"] - stats["frames_written"],
+        }
@@ -0,0 +1,65 @@
+"""Benchmarks for whole frames run the way pgzhelper_run.go() runs them."""
+
+from __future__ import annotations
+from ._harness import benchmark, make_screen, measure, run_loop
+from pgzhelper import Screen, Rect, _core
+from pgzhelper.utilities import pygame
+
+@benchmark("runner.empty_frame")
+def bench_empty_frame() -> dict[str, float]:
+    return run_loop({"draw": lambda: None, "update": lambda: None})
+
+@benchmark("runner.simple_scene")
+def bench_simple_scene() -> dict[str, float]:
+    def draw() -> None:
+        Screen.fill((30, 30, 60))
+        for i in range(20):
+            Screen.draw.filled_circle((40 * i + 20, 300), 15, (255, 200, 0))
+        Screen.draw.text("pgzhelper", center=(400, 50), fontsize=40, color="white")
+    return run_loop({"draw": draw, "update": lambda: None})
+
+@benchmark("runner.dirty_rects")
+def bench_dirty_rects() -> dict[str, float]:
+    screen = make_screen((1280, 720))
+    screen_rect = screen.surface.get_rect()
+    dirty = _core._dirty_rects
+    counter = iter(range(10 ** 9))
+
+    def draw() -> None:
+        frame = next(counter)
+        Screen.draw.filled_circle((100 + frame % 1000, 400), 20, (255, 200, 0))
+        Screen.draw.dynamic_text(f"Score: {frame}", topleft=(10, 10), fontsize=32, color="white")
+
+    results = {"full_present_p50_ms": measure(pygame.display.flip)["p50_ms"]}
+    Screen.dirty_rects.enable()
+    try:
+        results["partial_frame_p50_ms"] = measure(lambda: (draw(), dirty.present()))["p50_ms"]
+        stats = Screen.dirty_rects.get_stats()
+        results["rects_per_frame"] = stats["rects_per_frame"]
+        results["coverage"] = stats["coverage"]
+        Screen.dirty_rects.disable()
+        results["untracked_frame_p50_ms"] = measure(lambda: (draw(), dirty.present()))["p50_ms"]
+        scattered = [Rect(i * 37 % 1240, i * 53 % 680, 30, 30) for i in range(100)]
+        results["merge_100_p50_ms"] = measure(lambda: dirty.merge(scattered, screen_rect))["p50_ms"]
+    finally:
+        Screen.dirty_rects.disable()
+    return results
+
+@benchmark("runner.stats_overlay")
+def bench_stats_overlay() -> dict[str, float]:
+    screen = make_screen((800, 600))
+    profiler = _core._frame_profiler
+    for frame in range(profiler.size):
+        for phase in ("draw", "update", "events", "sleep"):
+            profiler.add(phase, (frame % 7 + 1) / 1000)
+        profiler.end_frame()
+    interval = profiler.overlay_interval
+    try:
+        profiler.overlay_interval = 0
+        results = {"every_frame_p50_ms": measure(lambda: profiler.draw_overlay(screen.surface))["p50_ms"]}
+        profiler.overlay_interval = interval
+        results["p50_ms"] = measure(lambda: profiler.draw_overlay(screen.surface))["p50_ms"]
+    finally:
+        profiler.overlay_interval = interval
+        profiler.reset()
+    return results
@@ -0,0 +1,27 @@
+"""Benchmarks for the shapes transforms and collisions."""
+
+from __future__ import annotations
+from ._harness import benchmark, measure
+from pgzhelper import Triangle, EquilateralTriangle, Circle, HRect
+
+@benchmark("shapes.triangle_rotate")
+def bench_triangle_rotate() -> dict[str, float]:
+    triangle = Triangle((100, 100), (200, 120), (150, 220))
+    return measure(lambda: triangle.rotate(15), repeat=2000)
+
+@benchmark("shapes.triangle_move")
+def bench_triangle_move() -> dict[str, float]:
+    triangle = EquilateralTriangle((100, 100), 80)
+    return measure(lambda: triangle.move_right(5).move_down(5), repeat=2000)
+
+@benchmark("shapes.circle_collisions")
+def bench_circle_collisions() -> dict[str, float]:
+    circle = Circle((100, 100), 40)
+    other = Circle((150, 120), 30)
+    rect = HRect((110, 90), (60, 40))
+
+    def collide() -> None:
+        circle.collidepoint(120, 110)
+        circle.colliderect(rect)
+        circle.collidecircle(other)
+    return measure(collide, repeat=2000)
@@ -1,101 +1,704 @@
 from __future__ import annotations
 from .utilities import *
+from ._capture import CaptureThread
+from ._segmentation import AsyncSegmenter, SegmentationBackend, MediaPipeBackend, open_backend
+from ._motion import MotionDetector
+from ._compositor import Compositor
+from ._recorder import Recorder
+from ._sources import FrameSource, open_source
+from ._ptz import PanTiltZoom
+from ._sharing import FramePublisher
+from ._dirty import mark_drawn
 
-_camera_loaded = False
+_cameras = []
+"""Every loaded Camera, in the order they were loaded. pgzhelper_run.go() updates and draws each of them."""
 
-def load_camera(camera_number: int = 0) -> None:
+_default_camera = None
+"""The Camera used by load_camera() and the other camera functions. None when load_camera() has not been called."""
+
+_segmenter = None
+"""The MediaPipeBackend used for removing the background when a camera is not given another backend. Shared by every Camera, and only created when the background is first removed."""
+
+_GUIDE_RADIUS = 1
+"""The radius (in pixels of the downscaled frame) of the guided filter used to upscale the mask. Bigger radii blur the edge the filter is meant to sharpen."""
+
+_GUIDE_EPS = 3e-5
+"""How much the guided filter smooths the mask, as a variance of the frame's brightness (from 0 to 1). 3e-5 is a standard deviation of about 1.4 of 255 brightness levels, so low contrast edges are still followed, while camera noise mostly is not."""
+
+_LATENCY_SAMPLES = 120
+"""How many capture-to-draw latencies each Camera keeps for its percentiles."""
+
+def _create_segmenter() -> MediaPipeBackend:
     """
-    Loads a camera.
+    Creates the shared MediaPipe backend with the bundled model.
 
-    :param camera_number: If you have more than 1 camera, then 0 will be one of the cameras and 1 will be the other one.
+    Not meant for user use.
+
+    :return MediaPipeBackend: The backend.
     """
-    global _cap, _width, _height, _camera_surface, _zoom_factor, _remove_bg, _options, _segmenter, _bg_color, _camera_loaded
-    _cap = cv2.VideoCapture(camera_number)
-    _width = int(_cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-    _height = int(_cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    return MediaPipeBackend()
 
-    _camera_surface = pygame.Surface((_width, _height))
+def _segment(frame: np.ndarray) -> np.ndarray:
+    """
+    Makes the mask for a frame with the shared MediaPipe backend.
 
-    _zoom_factor = 1
+    Not meant for user use.
 
-    _remove_bg = False
+    :param frame: The RGB frame.
 
-    _BaseOptions = python.BaseOptions
-    _ImageSegmenter = vision.ImageSegmenter
-    _VisionRunningMode = vision.RunningMode
+    :return np.ndarray: The confidence (0 to 1) that each pixel is a person, shape (height, width).
+    """
+    return _segmenter.segment(frame)
 
-    _options = vision.ImageSegmenterOptions(
-        base_options=_BaseOptions(model_asset_path="/Users/gootyboy/projects/python__coding/pgz_camera/image_segmenter.tflite"),
-        running_mode=_VisionRunningMode.IMAGE
-    )
+def _upsample_mask(mask: np.ndarray, small: np.ndarray, frame: np.ndarray, edge_aware: bool = True) -> np.ndarray:
+    """
+    Scales a mask made from a downscaled frame back up to the frame's size.
 
-    _segmenter = _ImageSegmenter.create_from_options(_options)
+    When edge_aware, this uses a fast guided filter: a local linear model from the small frame's brightness to the mask is fitted at the small size, then scaled up and applied to the full frame's brightness, so the mask's edges follow the edges in the frame instead of being blurry.
 
-    _bg_color = (255, 255, 255)
+    Not meant for user use.
 
-    _camera_loaded = True
+    :param mask: The mask of the small frame, shape (small height, small width).
+    :param small: The downscaled RGB frame the mask was made from.
+    :param frame: The full-size RGB frame.
+    :param edge_aware: Whether to use the guided filter. When False, the mask is scaled up bilinearly, which is faster. Defaults to True.
 
-def set_zoom_factor(factor: float) -> None:
+    :return np.ndarray: The mask, shape (height, width), from 0 to 1.
     """
-    Sets the camera zoom factor
+    height, width = frame.shape[:2]
+    if not edge_aware:
+        return cv2.resize(mask, (width, height), interpolation=cv2.INTER_LINEAR)
+    size = (2 * _GUIDE_RADIUS + 1, 2 * _GUIDE_RADIUS + 1)
+    guide = cv2.cvtColor(small, cv2.COLOR_RGB2GRAY).astype(np.float32) / 255
+    mask = mask.astype(np.float32, copy=False)
+    mean_guide = cv2.boxFilter(guide, -1, size)
+    mean_mask = cv2.boxFilter(mask, -1, size)
+    variance = cv2.boxFilter(guide * guide, -1, size) - mean_guide * mean_guide
+    covariance = cv2.boxFilter(guide * mask, -1, size) - mean_guide * mean_mask
+    a = covariance / (variance + _GUIDE_EPS)
+    b = mean_mask - a * mean_guide
+    a = cv2.resize(cv2.boxFilter(a, -1, size), (width, height), interpolation=cv2.INTER_LINEAR)
+    b = cv2.resize(cv2.boxFilter(b, -1, size), (width, height), interpolation=cv2.INTER_LINEAR)
+    full_guide = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY).astype(np.float32) / 255
+    return np.clip(a * full_guide + b, 0, 1, out=a)
+
+def _load_background_image(image: Union[str, pygame.Surface]) -> np.ndarray:
+    """
+    Gets the pixels of a background image.
+
+    Not meant for user use.
+
+    :param image: The pygame Surface, or the file name or path of the image. File names are searched in the images directory.
 
-    :param factor: How zoomed in it should be. 1 means it shows the full camera view. 2 means it zooms into the center of the camera by a factor of 2.
+    :return np.ndarray: The RGB pixels, shape (height, width, 3).
+
+    :raise ImageLoadError: When the image cannot be found or loaded.
     """
-    global _zoom_factor
-    _zoom_factor = factor
+    if isinstance(image, str):
+        path = image if os.path.exists(image) else os.path.join("images", image)
+        if not os.path.exists(path):
+            raise ImageLoadError(f"Error: Background image not found at {path}")
+        try:
+            image = pygame.image.load(path)
+        except pygame.error as e:
+            raise ImageLoadError(f"Error loading background image: {e}")
+    return np.ascontiguousarray(pygame.surfarray.pixels3d(image).swapaxes(0, 1))
 
-def camera_update_func() -> None:
+class Camera:
+    """A camera, with its own capture thread, zoom and background settings. Every Camera shares one segmentation model, so you can have more than one camera at a time."""
+    def __init__(self, camera_number: Union[int, str, np.ndarray, list, Iterable, Callable, FrameSource] = 0, threaded: bool = True, pos: tuple[int, int] = (0, 0), visible: bool = True, capture: Optional[object] = None, width: Optional[int] = None, height: Optional[int] = None, fps: Optional[float] = None, fourcc: Optional[str] = None, buffer_size: Optional[int] = 1, pacing: str = "realtime") -> None:
+        """
+        Loads a camera.
+
+        :param camera_number: If you have more than 1 camera, then 0 will be one of the cameras and 1 will be the other one. Can also be something to read frames from instead of a camera: the path of a video file or a folder of images, an array (or list) of BGR frames, a generator (or a function returning one) of BGR frames, or a FrameSource.
+        :param threaded: Whether to read frames on a background thread. When True, the update function only picks up the newest frame instead of waiting for the camera. Defaults to True.
+        :param pos: The topleft position pgzhelper_run.go() draws the camera at. Defaults to (0, 0).
+        :param visible: Whether pgzhelper_run.go() draws the camera. Set it to False when the camera is drawn by a CameraLayout. Defaults to True.
+        :param capture: Something to read frames from instead of camera_number, with the same read(), get() and release() as a cv2.VideoCapture. Defaults to None (open camera_number).
+        :param width: The width to ask the camera for. The camera may pick the nearest size it has. Only used for cameras. Defaults to None (the camera's default).
+        :param height: The height to ask the camera for. Defaults to None (the camera's default).
+        :param fps: The frames per second to ask the camera for, or to play any other source at. Defaults to None (the camera's or video's own, or 30).
+        :param fourcc: The pixel format to ask the camera for, like "MJPG" (compressed, allows bigger sizes at full speed) or "YUYV". Defaults to None (the camera's default).
+        :param buffer_size: How many frames the camera driver may keep waiting. 1 means every frame read is the newest one, instead of one that has waited in the driver. Not every driver supports this. Defaults to 1.
+        :param pacing: For sources that are not cameras, "realtime" to hand out frames at fps like a camera, or "fast" to hand them out as quickly as they are read (for profiling). Defaults to "realtime".
+
+        :raise CameraError: When fourcc is not four letters, the source cannot be opened, or pacing is not "realtime" or "fast".
+        """
+        self.pos = pos
+        """The topleft position pgzhelper_run.go() draws the camera at."""
+
+        self.visible = visible
+        """Whether pgzhelper_run.go() draws the camera."""
+
+        if capture is None:
+            capture = open_source(camera_number, width, height, fps, fourcc, buffer_size, pacing)
+
+        self.capture = capture
+        """The FrameSource (or cv2.VideoCapture) that frames are read from."""
+
+        self.width = int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        """The width of the camera output (in pixels)."""
+
+        self.height = int(self.capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        """The height of the camera output (in pixels)."""
+
+        self.fps = self.capture.get(cv2.CAP_PROP_FPS)
+        """The frames per second the camera reports. 0 when it does not say."""
+
+        self.frame_timestamp = 0.0
+        """When the frame in the camera output was read from the camera (time.perf_counter() time)."""
+
+        self.latency = 0.0
+        """How long (in seconds) the newest drawn frame took from being read from the camera to being drawn."""
+
+        self.zoom_factor = 1
+        """How zoomed in the camera is (or is moving to). 1 shows the full camera view."""
+
+        self.ptz = PanTiltZoom(self.width, self.height)
+        """The region of the camera's view that is shown, for digital pan, tilt and zoom."""
+
+        self.remove_bg = False
+        """Whether the background is removed."""
+
+        self.max_mask_age = 0.1
+        """How much older (in seconds) than the current frame a background mask can be before a new one is made straight away."""
+
+        self.mask_scale = 1.0
+        """How much smaller than the camera output the frame given to the segmenter is. 1 segments the full frame."""
+
+        self.refine_edges = False
+        """Whether a mask made from a downscaled frame is scaled back up with the guided filter instead of bilinearly."""
+
+        self.backend = None
+        """The SegmentationBackend that finds the person. None uses the MediaPipe backend shared by every Camera."""
+
+        self.motion_threshold = 0.0
+        """How different (mean color difference, 0 to 255) a frame must be from the last shown one to be processed."""
+
+        self.mask_motion_threshold = 0.0
+        """How different a frame must be from the frame of the last mask for a new mask to be made."""
+
+        self.frames_processed = 0
+        """How many frames have been shown."""
+
+        self.frames_unchanged = 0
+        """How many frames were skipped because they hardly changed."""
+
+        self.masks_reused = 0
+        """How many frames reused the last background mask instead of making a new one."""
+
+        self.motion_score = 0.0
+        """How different the last frame was from the last shown one."""
+
+        self.compositor = Compositor(self.width, self.height)
+        """The Compositor that replaces the background."""
+
+        self.recorder = None
+        """The Recorder the camera is recorded with. None when it is not being recorded."""
+
+        self.record_raw = False
+        """Whether the recording has the frames straight from the camera, instead of the camera output."""
+
+        self.publisher = None
+        """The FramePublisher that shares the camera's frames with other processes. None when they are not shared."""
+
+        self._rgb_buffer = np.zeros((self.height, self.width, 3), np.uint8)
+        self._resize_buffer = np.zeros((self.height, self.width, 3), np.uint8)
+        self._read_buffer = None
+        self._small_buffer = None
+        self._last_mask = None
+        self._latencies = [0.0] * _LATENCY_SAMPLES
+        self._latency_count = 0
+        self._drawn_frame = 0
+
+        self.surface = pygame.image.frombuffer(self._rgb_buffer, (self.width, self.height), "RGB")
+        """The camera output. It shares its pixels with the camera's buffer, so it is the same Surface every frame."""
+
+        self._capture_thread = None
+        self._async_segmenter = None
+        self._motion_detector = None
+        if threaded:
+            self._capture_thread = CaptureThread(self.capture)
+            self._capture_thread.start()
+        self._loaded = True
+        _cameras.append(self)
+
+    def _segment_scaled(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Makes the mask for a frame, segmenting a copy downscaled by mask_scale and scaling the mask back up, when the backend gets cheaper on smaller frames. Above a mask_scale of 0.5 the frame is scaled down bilinearly, since OpenCV's area averaging is several times slower for sizes that do not divide the frame evenly, and for backends that scale the frame again themselves (like MediaPipe) it is scaled down with nearest neighbour.
+
+        Not meant for user use.
+
+        :param frame: The RGB frame.
+
+        :return np.ndarray: The confidence (0 to 1) that each pixel is a person, shape (height, width).
+        """
+        backend = self.backend or _segmenter
+        if self.mask_scale >= 1 or not backend.scales_with_size:
+            return backend.segment(frame)
+        height, width = frame.shape[:2]
+        small_size = (max(1, round(width * self.mask_scale)), max(1, round(height * self.mask_scale)))
+        if self._small_buffer is None or self._small_buffer.shape[1::-1] != small_size:
+            self._small_buffer = np.empty((small_size[1], small_size[0], 3), np.uint8)
+        if backend.resizes_frames:
+            interpolation = cv2.INTER_NEAREST
+        else:
+            interpolation = cv2.INTER_LINEAR if self.mask_scale > 0.5 else cv2.INTER_AREA
+        cv2.resize(frame, small_size, dst=self._small_buffer, interpolation=interpolation)
+        return _upsample_mask(backend.segment(self._small_buffer), self._small_buffer, frame, self.refine_edges)
+
+    def _reset_motion(self) -> None:
+        """
+        Forgets the reference frames and the last mask, so the next frame is fully processed. Called when a setting changes the camera output.
+
+        Not meant for user use.
+        """
+        if self._motion_detector is not None:
+            self._motion_detector.reset()
+        self._last_mask = None
+
+    def _stop_async_segmenter(self) -> None:
+        """
+        Stops the background segmentation thread, if there is one.
+
+        Not meant for user use.
+        """
+        if self._async_segmenter is not None:
+            self._async_segmenter.stop()
+            self._async_segmenter = None
+
+    def set_zoom_factor(self, factor: float, center: Optional[tuple[float, float]] = None, duration: float = 0, tween: str = "accel_decel") -> None:
+        """
+        Sets the camera zoom factor
+
+        :param factor: How zoomed in it should be. 1 means it shows the full camera view. 2 means it zooms into the center of the camera by a factor of 2.
+        :param center: The (x, y) point of the camera's view to zoom into, in camera pixels. Defaults to None (the center of the camera's view).
+        :param duration: How long (in seconds) to move smoothly from the current view. 0 jumps straight there. Defaults to 0.
+        :param tween: How the move speeds up and slows down, like pgzero's animate(): "linear", "accel_decel", "bounce_end" and so on. Defaults to "accel_decel".
+
+        :raise CameraError: When tween is not one of pgzero's tweens.
+        """
+        if factor <= 1:
+            self.ptz.set_region((0, 0, self.width, self.height), duration, tween)
+        else:
+            self.ptz.set_zoom(factor, center or (self.width / 2, self.height / 2), duration, tween)
+        self.zoom_factor = self.width / self.ptz.target[2]
+
+    def set_region(self, region: tuple[float, float, float, float], duration: float = 0, tween: str = "accel_decel") -> None:
+        """
+        Shows only a region of the camera's view, scaled up to the camera size. This is digital pan, tilt and zoom: move the region to pan and tilt, and make it smaller to zoom in.
+
+        :param region: The (x, y, width, height) of the region, in camera pixels. It is grown to the camera's shape around its center, so the picture is not stretched, and kept inside the camera's view.
+        :param duration: How long (in seconds) to move smoothly from the current region. 0 jumps straight there. Defaults to 0.
+        :param tween: How the move speeds up and slows down, like pgzero's animate(): "linear", "accel_decel", "bounce_end" and so on. Defaults to "accel_decel".
+
+        :raise CameraError: When tween is not one of pgzero's tweens.
+        """
+        self.ptz.set_region(region, duration, tween)
+        self.zoom_factor = self.width / self.ptz.target[2]
+
+    def get_region(self) -> tuple[int, int, int, int]:
+        """
+        Gets the region of the camera's view shown in the last frame.
+
+        :return tuple[int, int, int, int]: The (x, y, width, height), in camera pixels.
+        """
+        left, top, right, bottom = self.ptz.crop
+        return (left, top, right - left, bottom - top)
+
+    def set_motion_threshold(self, threshold: Optional[float], mask_threshold: Optional[float] = None) -> None:
+        """
+        Lets the camera skip work when the picture has hardly changed. Each frame is scaled down and compared with the last frame that was shown.
+
+        :param threshold: How different (the mean color difference, from 0 to 255) a frame must be to be shown. Frames that are less different keep the last camera output. None turns this off, so every frame is processed.
+        :param mask_threshold: When the background is removed, how different a frame must be from the frame of the last mask for a new mask to be made. Frames that are less different are shown with the last mask. Defaults to 4 times threshold.
+        """
+        if threshold is None:
+            self._motion_detector = None
+        elif self._motion_detector is None:
+            self._motion_detector = MotionDetector()
+        self.motion_threshold = threshold or 0.0
+        self.mask_motion_threshold = mask_threshold if mask_threshold is not None else self.motion_threshold * 4
+        self._reset_motion()
+
+    def remove_background(self, color = (255, 255, 255), asynchronous: bool = False, max_mask_age: float = 0.1, mask_scale: float = 1.0, refine_edges: bool = False, image: Optional[Union[str, pygame.Surface]] = None, blur: int = 0, feather: int = 0, backend: Optional[Union[str, SegmentationBackend]] = None) -> None:
+        """
+        Removes the camera output's background
+
+        :param color: The color to replace the background with. Defaults to (255, 255, 255).
+        :param asynchronous: Whether to find the background on a background thread. The camera then shows each frame with the newest mask that is ready, instead of waiting for the segmenter. Defaults to False.
+        :param max_mask_age: When asynchronous, how much older (in seconds) than the frame the newest mask can be. When it is older, a new mask is made straight away. Defaults to 0.1.
+        :param mask_scale: How much to scale the frame down by before finding the background, from 0 (not included) to 1. 0.5 finds the background on a frame half the width and height, which is less exact. The "mog2", "knn" and "chroma" backends get much faster; MediaPipe scales every frame to its model's own size, so it saves little, and at 0.75 can even be slower. Defaults to 1.
+        :param refine_edges: When mask_scale is less than 1, whether to scale the mask back up along the edges in the frame (with a guided filter) instead of smoothly. The edges are closer to the full size mask's, but this is slower. Defaults to False.
+        :param image: An image to replace the background with instead of a color: a pygame Surface, or the file name or path of the image (file names are searched in the images directory). It is scaled to the camera size. Defaults to None.
+        :param blur: When more than 0 (and there is no image), the background is blurred by this many pixels instead of replaced. Defaults to 0.
+        :param feather: How wide (in pixels) the soft edge between the person and the background is. 0 is a hard edge. Defaults to 0.
+        :param backend: How the person is found: "mediapipe" (the most exact and the slowest), "mog2" or "knn" (OpenCV background subtraction, for a camera that does not move: its cost falls with mask_scale much more than MediaPipe's), "chroma" (a green screen: the cheapest), or a SegmentationBackend like MediaPipeBackend("my_model.tflite") or ChromaKeyBackend((0, 0, 255)). Defaults to None ("mediapipe").
+
+        :raise CameraError: When mask_scale is not more than 0 and at most 1, or backend is not one of the names above.
+        :raise ImageLoadError: When the image cannot be found or loaded.
+        """
+        global _segmenter
+        if not 0 < mask_scale <= 1:
+            raise CameraError(f"mask_scale must be more than 0 and at most 1, not {mask_scale}")
+        if backend is None or backend == "mediapipe":
+            if _segmenter is None:
+                _segmenter = _create_segmenter()
+            self.backend = None
+        else:
+            self.backend = open_backend(backend)
+        if asynchronous and self._async_segmenter is None:
+            self._async_segmenter = AsyncSegmenter(lambda frame: self._segment_scaled(frame).copy())
+        elif not asynchronous:
+            self._stop_async_segmenter()
+        self.max_mask_age = max_mask_age
+        self.mask_scale = mask_scale
+        self.refine_edges = refine_edges
+        if image is not None:
+            self.compositor.set_image(_load_background_image(image))
+        elif blur > 0:
+            self.compositor.set_blur(blur)
+        else:
+            self.compositor.set_color(color)
+        self.compositor.feather = feather
+        self.remove_bg = True
+        self._reset_motion()
+
+    def start_recording(self, path: str, fps: Optional[float] = None, queue_size: int = 8, policy: str = "drop", fourcc: str = "mp4v", raw: bool = False) -> Recorder:
+        """
+        Starts recording the camera, stopping any recording of it that was already running. The frames are written on a background thread.
+
+        :param path: The video file to write (like "camera.mp4"), or a folder to write PNG images into (a path with no extension).
+        :param fps: The frames per second of the video. Defaults to None (the camera's frames per second, or 30 when it does not say).
+        :param queue_size: How many frames can wait to be written. Defaults to 8.
+        :param policy: "drop" to skip frames when too many are waiting, or "block" to wait for them. Defaults to "drop".
+        :param fourcc: The four letter video codec, like "mp4v" or "MJPG". Defaults to "mp4v".
+        :param raw: Whether to record every frame straight from the camera (before zooming and removing the background) instead of the camera output. Defaults to False.
+
+        :return Recorder: The Recorder, for its counters.
+
+        :raise RecordingError: When policy is not "drop" or "block", or fourcc is not four letters.
+        """
+        self.stop_recording()
+        self.recorder = Recorder(path, fps or self.fps or 30, queue_size, policy, fourcc)
+        self.record_raw = raw
+        return self.recorder
+
+    def stop_recording(self) -> None:
+        """
+        Stops recording the camera and waits for the waiting frames to be written. Does nothing when the camera is not being recorded.
+
+        :raise RecordingError: When the recording could not be written, and the error has not been raised yet.
+        """
+        recorder, self.recorder = self.recorder, None
+        if recorder is not None:
+            recorder.stop()
+
+    def start_publishing(self, name: Optional[str] = None, slots: int = 3) -> str:
+        """
+        Shares the camera's frames (and background masks) with other processes through shared memory. The frames are from before the background is replaced. Other processes read them with FrameReader(name). Frames are only copied while a reader is attached.
+
+        :param name: The name of the shared memory. Defaults to None (a name made from the process id).
+        :param slots: How many frames the shared memory holds. Defaults to 3.
+
+        :return str: The name readers open the shared memory by.
+
+        :raise CameraError: When slots is less than 2.
+        :raise FileExistsError: When shared memory with the name already exists.
+        """
+        self.stop_publishing()
+        self.publisher = FramePublisher(self.width, self.height, name, slots)
+        return self.publisher.name
+
+    def stop_publishing(self) -> None:
+        """Stops sharing the camera's frames and removes the shared memory. Does nothing when they are not shared."""
+        if self.publisher is not None:
+            self.publisher.close()
+            self.publisher = None
+
+    def update(self) -> None:
+        """
+        Picks up the newest frame and makes the camera output. pgzhelper_run.go() calls this for every camera.
+
+        :raise CameraNotLoadedError: When the camera has been closed.
+        """
+        if not self._loaded:
+            raise CameraNotLoadedError("camera is closed")
+
+        if self._capture_thread is not None:
+            frame = self._capture_thread.latest()
+            if frame is None:
+                return
+            timestamp = self._capture_thread.timestamp
+        else:
+            ret, frame = self.capture.read(self._read_buffer)
+            if not ret:
+                return
+            self._read_buffer = frame
+            timestamp = time.perf_counter()
+
+        recorder = self.recorder
+        if recorder is not None and self.record_raw:
+            recorder.submit(frame, "BGR")
+
+        width, height = self.width, self.height
+        if frame.shape[0] != height or frame.shape[1] != width:
+            frame = cv2.resize(frame, (width, height), dst=self._resize_buffer)
+
+        ptz = self.ptz
+        if ptz.update():
+            self._reset_motion()
+            if self.backend is not None:
+                self.backend.reset()
+        if not ptz.full:
+            left, top, right, bottom = ptz.crop
+            frame = frame[top:bottom, left:right]
+
+        motion_detector = self._motion_detector
+        if motion_detector is not None:
+            motion_detector.update(frame)
+            self.motion_score = motion_detector.difference("surface")
+            if self.motion_score < self.motion_threshold:
+                self.frames_unchanged += 1
+                if recorder is not None and not self.record_raw:
+                    recorder.submit(self._rgb_buffer, "RGB")
+                return
+            motion_detector.accept("surface")
+
+        if ptz.full:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+        else:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=ptz.crop_buffer)
+            frame = cv2.resize(ptz.crop_buffer, (width, height), dst=self._rgb_buffer, interpolation=cv2.INTER_LINEAR)
+
+        if self.remove_bg:
+            if self._last_mask is not None and motion_detector.difference("mask") < self.mask_motion_threshold:
+                mask = self._last_mask
+                self.masks_reused += 1
+            elif self._async_segmenter is not None:
+                self._async_segmenter.submit(frame, timestamp)
+                mask, mask_timestamp = self._async_segmenter.latest()
+                if mask is None or timestamp - mask_timestamp > self.max_mask_age:
+                    mask = self._async_segmenter.segment_now(frame, timestamp)
+            else:
+                mask = self._segment_scaled(frame)
+
+            if motion_detector is not None and mask is not self._last_mask:
+                self._last_mask = mask.copy()
+                motion_detector.accept("mask")
+
+            if self.publisher is not None:
+                self.publisher.publish(frame, mask, timestamp)
+            self.compositor.composite(frame, mask)
+        elif self.publisher is not None:
+            self.publisher.publish(frame, None, timestamp)
+
+        self.frame_timestamp = timestamp
+        self.frames_processed += 1
+        if recorder is not None and not self.record_raw:
+            recorder.submit(frame, "RGB")
+
+    def draw(self, screen: object) -> None:
+        """
+        Draws the camera output at pos. pgzhelper_run.go() calls this for every visible camera.
+
+        :param screen: The pgzero screen (or a pygame Surface) to draw on.
+        """
+        if screen:
+            screen.blit(self.surface, self.pos)
+            if self._drawn_frame != self.frames_processed:
+                self._drawn_frame = self.frames_processed
+                mark_drawn(screen, pygame.Rect(self.pos, self.surface.get_size()))
+                self.latency = time.perf_counter() - self.frame_timestamp
+                self._latencies[self._latency_count % _LATENCY_SAMPLES] = self.latency
+                self._latency_count += 1
+
+    def get_fourcc(self) -> str:
+        """
+        Gets the pixel format the camera is using.
+
+        :return str: The four letter format, like "MJPG" or "YUYV". Empty when the camera does not say.
+        """
+        code = int(self.capture.get(cv2.CAP_PROP_FOURCC))
+        return "".join(chr((code >> shift) & 0xFF) for shift in (0, 8, 16, 24)).strip("\x00")
+
+    def get_latency_percentiles(self) -> dict[str, float]:
+        """
+        Gets the p50 and p95 of how long the last few drawn frames took from being read from the camera to being drawn. Each frame is counted the first time it is drawn.
+
+        :return dict[str, float]: The latencies in milliseconds, keyed "p50" and "p95". 0 when no frame has been drawn.
+        """
+        latencies = sorted(self._latencies[:min(self._latency_count, _LATENCY_SAMPLES)])
+        if not latencies:
+            return {"p50": 0.0, "p95": 0.0}
+        return {
+            "p50": latencies[len(latencies) // 2] * 1000,
+            "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+        }
+
+    def close(self) -> None:
+        """Stops the camera's threads and releases the camera. The camera cannot be used after this."""
+        global _default_camera
+        if not self._loaded:
+            return
+        self._loaded = False
+        if self._capture_thread is not None:
+            self._capture_thread.stop(release=True)
+            self._capture_thread = None
+        else:
+            self.capture.release()
+        self._stop_async_segmenter()
+        self.stop_publishing()
+        try:
+            self.stop_recording()
+        finally:
+            if self in _cameras:
+                _cameras.remove(self)
+            if _default_camera is self:
+                _default_camera = None
+
+    def is_loaded(self) -> bool:
+        """
+        Checks if the camera is loaded.
+
+        :return True: When the camera is loaded.
+        :return False: When the camera has been closed.
+        """
+        return self._loaded
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Gets the camera counters. Capture counters are only counted when the camera reads frames on a background thread, segmentation counters when the background is removed asynchronously, latencies once a frame has been drawn, and skip counters when a motion threshold is set.
+
+        :return dict[str, float]: The frames captured, delivered (picked up by the update function) and dropped (replaced by a newer frame first), the age (ms) of the last delivered frame, the segmentation counters, the backend's cost (frames, last and mean ms) while the background is removed, the capture-to-draw latency (ms) of the newest drawn frame with its p50 and p95, the frames skipped because they hardly changed, the masks reused and the last motion score, the recording counters (prefixed "recording_") while the camera is being recorded, and the publishing counters (prefixed "publishing_") while its frames are shared.
+        """
+        stats = {}
+        if self._capture_thread is not None:
+            stats.update(self._capture_thread.get_stats())
+        if self._async_segmenter is not None:
+            stats.update(self._async_segmenter.get_stats())
+        if self.remove_bg:
+            stats.update((self.backend or _segmenter).get_stats())
+        if self._latency_count:
+            latencies = self.get_latency_percentiles()
+            stats["latency_ms"] = self.latency * 1000
+            stats["latency_p50_ms"] = latencies["p50"]
+            stats["latency_p95_ms"] = latencies["p95"]
+        if self._motion_detector is not None:
+            stats["frames_unchanged"] = self.frames_unchanged
+            stats["masks_reused"] = self.masks_reused
+            stats["motion_score"] = self.motion_score
+        if self.recorder is not None:
+            stats.update({f"recording_{name}": value for name, value in self.recorder.get_stats().items()})
+        if self.publisher is not None:
+            stats.update({f"publishing_{name}": value for name, value in self.publisher.get_stats().items()})
+        return stats
+
+def _set_default_camera(camera: Camera) -> None:
     """
-    Call this function in your update() function. You do not need to do this if you call pgzhelper_run.go() instead of pgzrun.go()
+    Closes the default camera and replaces it.
+
+    Not meant for user use.
+
+    :param camera: The new default camera.
+    """
+    global _default_camera
+    if _default_camera is not None:
+        _default_camera.close()
+    _default_camera = camera
+
+def _get_default_camera() -> Camera:
+    """
+    Gets the default camera.
+
+    Not meant for user use.
+
+    :return Camera: The camera loaded with load_camera().
 
     :raise CameraNotLoadedError: When the camera is not loaded.
     """
-    global _camera_surface, _zoom_factor, _remove_bg
-    if not _camera_loaded:
+    if _default_camera is None:
         raise CameraNotLoadedError("camera is not loaded. Load it using load_camera()")
+    return _default_camera
+
+def get_cameras() -> tuple[Camera, ...]:
+    """
+    Gets every loaded camera.
+
+    :return tuple[Camera, ...]: The cameras, in the order they were loaded.
+    """
+    return tuple(_cameras)
+
+def load_camera(camera_number: Union[int, str, np.ndarray, list, Iterable, Callable, FrameSource] = 0, threaded: bool = True, width: Optional[int] = None, height: Optional[int] = None, fps: Optional[float] = None, fourcc: Optional[str] = None, buffer_size: Optional[int] = 1, pacing: str = "realtime") -> None:
+    """
+    Loads a camera. See Camera() for the parameters.
+
+    :raise CameraError: When fourcc is not four letters, the source cannot be opened, or pacing is not "realtime" or "fast".
+    """
+    _set_default_camera(Camera(camera_number, threaded, width=width, height=height, fps=fps, fourcc=fourcc, buffer_size=buffer_size, pacing=pacing))
+
+def set_zoom_factor(factor: float, center: Optional[tuple[float, float]] = None, duration: float = 0, tween: str = "accel_decel") -> None:
+    """
+    Sets the camera zoom factor. See Camera.set_zoom_factor() for the parameters.
+
+    :raise CameraNotLoadedError: When the camera is not loaded.
+    :raise CameraError: When tween is not one of pgzero's tweens.
+    """
+    _get_default_camera().set_zoom_factor(factor, center, duration, tween)
+
+def set_region(region: tuple[float, float, float, float], duration: float = 0, tween: str = "accel_decel") -> None:
+    """
+    Shows only a region of the camera's view. See Camera.set_region() for the parameters.
+
+    :raise CameraNotLoadedError: When the camera is not loaded.
+    :raise CameraError: When tween is not one of pgzero's tweens.
+    """
+    _get_default_camera().set_region(region, duration, tween)
 
-    ret, frame = _cap.read()
-    if not ret:
-        return
+def start_publishing(name: Optional[str] = None, slots: int = 3) -> str:
+    """
+    Shares the camera's frames with other processes. See Camera.start_publishing() for the parameters.
 
-    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    :return str: The name readers open the shared memory by.
 
-    if _zoom_factor > 1.0:
-        cx, cy = _width // 2, _height // 2
-        nw = int(_width / _zoom_factor)
-        nh = int(_height / _zoom_factor)
-        x1 = max(cx - nw // 2, 0)
-        y1 = max(cy - nh // 2, 0)
-        x2 = min(cx + nw // 2, _width)
-        y2 = min(cy + nh // 2, _height)
-        frame = frame[y1:y2, x1:x2]
+    :raise CameraNotLoadedError: When the camera is not loaded.
+    :raise CameraError: When slots is less than 2.
+    """
+    return _get_default_camera().start_publishing(name, slots)
+
+def stop_publishing() -> None:
+    """
+    Stops sharing the camera's frames.
 
-    frame = cv2.resize(frame, (_width, _height))
+    :raise CameraNotLoadedError: When the camera is not loaded.
+    """
+    _get_default_camera().stop_publishing()
+
+def set_motion_threshold(threshold: Optional[float], mask_threshold: Optional[float] = None) -> None:
+    """
+    Lets the camera skip work when the picture has hardly changed. See Camera.set_motion_threshold() for the parameters.
 
-    if _remove_bg:
-        mp_image = Image(image_format=ImageFormat.SRGB, data=frame)
-        result = _segmenter.segment(mp_image)
-        mask = result.confidence_masks[0].numpy_view().squeeze()
+    :raise CameraNotLoadedError: When the camera is not loaded.
+    """
+    _get_default_camera().set_motion_threshold(threshold, mask_threshold)
 
-        condition = mask > 0.5
-        bg = np.zeros_like(frame)
-        bg[:] = _bg_color
-        output = np.where(condition[..., None], frame, bg)
-    else:
-        output = frame
+def camera_update_func() -> None:
+    """
+    Call this function in your update() function. You do not need to do this if you call pgzhelper_run.go() instead of pgzrun.go()
 
-    pygame_frame = pygame.surfarray.make_surface(np.rot90(output))
-    _camera_surface = pygame.transform.flip(pygame_frame, True, False)
+    :raise CameraNotLoadedError: When the camera is not loaded.
+    """
+    _get_default_camera().update()
 
-def remove_background(color = (255, 255, 255)) -> None:
+def remove_background(color = (255, 255, 255), asynchronous: bool = False, max_mask_age: float = 0.1, mask_scale: float = 1.0, refine_edges: bool = False, image: Optional[Union[str, pygame.Surface]] = None, blur: int = 0, feather: int = 0, backend: Optional[Union[str, SegmentationBackend]] = None) -> None:
     """
-    Removes the camera output's background
+    Removes the camera output's background. See Camera.remove_background() for the parameters.
 
-    :param color: The color to replace the background with. Defaults to (255, 255, 255).
+    :raise CameraNotLoadedError: When the camera is not loaded.
+    :raise CameraError: When mask_scale is not more than 0 and at most 1, or backend is not a known backend name.
+    :raise ImageLoadError: When the image cannot be found or loaded.
     """
-    global _bg_color, _remove_bg
-    _bg_color = color
-    _remove_bg = True
+    _get_default_camera().remove_background(color, asynchronous, max_mask_age, mask_scale, refine_edges, image, blur, feather, backend)
 
 def is_camera_loaded() -> bool:
     """
@@ -104,7 +707,7 @@ def is_camera_loaded() -> bool:
     :return True: When the camera is loaded.
     :return False: When the camera is not loaded.
     """
-    return _camera_loaded
+    return _default_camera is not None
 
 def camera_draw_func(screen):
     """
@@ -112,20 +715,18 @@ def camera_draw_func(screen):
 
     :raise CameraNotLoadedError: When the camera is not loaded.
     """
-    if not _camera_loaded:
-        raise CameraNotLoadedError("camera is not loaded. Load it using load_camera()")
-    if screen:
-        screen.blit(_camera_surface, (0, 0))
+    _get_default_camera().draw(screen)
 
 def camera_on_quit_func():
     """
-    Call this function in your on_quit() function. You do not need to do this if you call pgzhelper_run.go() instead of pgzrun.go()
+    Call this function in your on_quit() function. Closes every camera. You do not need to do this if you call pgzhelper_run.go() instead of pgzrun.go()
 
-    :raise CameraNotLoadedError: When the camera is not loaded.
+    :raise CameraNotLoadedError: When no camera is loaded.
     """
-    if not _camera_loaded:
+    if not _cameras:
         raise CameraNotLoadedError("camera is not loaded. Load it using load_camera()")
-    _cap.release()
+    for camera in get_cameras():
+        camera.close()
     cv2.destroyAllWindows()
 
 def get_camera_width() -> int:
@@ -133,13 +734,27 @@ def get_camera_width() -> int:
     Gets the width of the output of the camera (in pixels).
 
     :return int: The width of the output of the camera.
+
+    :raise CameraNotLoadedError: When the camera is not loaded.
     """
-    return _width
+    return _get_default_camera().width
 
 def get_camera_height():
     """
     Gets the height of the output of the camera (in pixels).
 
     :return int: The height of the output of the camera.
+
+    :raise CameraNotLoadedError: When the camera is not loaded.
+    """
+    return _get_default_camera().height
+
+def get_stats() -> dict[str, float]:
+    """
+    Gets the default camera's counters. See Camera.get_stats().
+
+    :return dict[str, float]: The counters. Empty when the camera is not loaded.
     """
-    return _height
\ No newline at end of file
+    if _default_camera is None:
+        return {}
+    return _default_camera.get_stats()
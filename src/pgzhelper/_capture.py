@@ -0,0 +1,139 @@
+"""Threaded camera capture for pgzhelper. Reads camera frames on a background thread so the game loop never waits for the camera."""
+
+from __future__ import annotations
+from .utilities import time, threading, np, Optional
+
+class CaptureThread:
+    """Reads frames from a cv2.VideoCapture on a background thread into a triple buffer. The game loop only picks up the newest finished frame."""
+    def __init__(self, capture: object) -> None:
+        """
+        Creates a new CaptureThread. Call start() to start reading.
+
+        :param capture: The cv2.VideoCapture (or anything with the same read() and release()).
+        """
+        self.capture = capture
+        """The cv2.VideoCapture that frames are read from."""
+
+        self.frames_captured = 0
+        """How many frames were read from the camera."""
+
+        self.frames_delivered = 0
+        """How many frames were picked up by the game loop."""
+
+        self.frames_dropped = 0
+        """How many frames were replaced by a newer one before the game loop picked them up."""
+
+        self.frame_age = 0.0
+        """How old the last picked up frame was when it was picked up, in seconds."""
+
+        self.timestamp = 0.0
+        """When the last picked up frame was read from the camera (time.perf_counter() time)."""
+
+        self._slots = [None, None, None]
+        self._timestamps = [0.0, 0.0, 0.0]
+        self._write = 0
+        self._ready = 1
+        self._read = 2
+        self._fresh = False
+        self._lock = threading.Lock()
+        self._running = False
+        self._stopping = None
+        self._release_on_exit = False
+        self._thread = None
+
+    def start(self) -> None:
+        """Starts reading frames on the background thread."""
+        if self._running:
+            return
+        self._running = True
+        self._release_on_exit = False
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stopping,), name="pgzhelper-capture", daemon=True)
+        self._thread.start()
+
+    def stop(self, release: bool = False, timeout: float = 1) -> bool:
+        """
+        Stops reading frames and waits for the background thread to finish. The thread can be in the middle of capture.read(), so with release, the thread releases the capture itself once read() returns, and the capture is never released while it is being read.
+
+        :param release: Whether to release the capture once the thread has finished. Defaults to False.
+        :param timeout: How long to wait for the thread, in seconds. Defaults to 1.
+
+        :return True: When the thread has finished.
+        :return False: When the thread was still in capture.read() after timeout. It finishes (and releases the capture, with release) when read() returns.
+        """
+        self._running = False
+        thread = self._thread
+        self._thread = None
+        if thread is None:
+            if release:
+                self.capture.release()
+            return True
+        self._release_on_exit = release
+        self._stopping.set()
+        thread.join(timeout=timeout)
+        return not thread.is_alive()
+
+    def is_running(self) -> bool:
+        """
+        Checks if the background thread is reading frames.
+
+        :return True: When frames are being read.
+        :return False: When the thread is stopped.
+        """
+        return self._running
+
+    def _run(self, stopping: threading.Event) -> None:
+        """
+        Reads frames until stop() is called, then releases the capture if stop() asked for it. Runs on the background thread.
+
+        Not meant for user use.
+
+        :param stopping: Set by stop(). Each thread has its own, so a thread that is still reading after stop() does not carry on when start() is called again.
+        """
+        while not stopping.is_set():
+            ok, frame = self.capture.read(self._slots[self._write])
+            if stopping.is_set():
+                break
+            if not ok or frame is None:
+                time.sleep(0.005)
+                continue
+            self._slots[self._write] = frame
+            self._timestamps[self._write] = time.perf_counter()
+            with self._lock:
+                self._write, self._ready = self._ready, self._write
+                if self._fresh:
+                    self.frames_dropped += 1
+                self._fresh = True
+                self.frames_captured += 1
+        if self._release_on_exit:
+            self.capture.release()
+
+    def latest(self) -> Optional[np.ndarray]:
+        """
+        Picks up the newest finished frame. The frame is only valid until the next call to latest().
+
+        :return np.ndarray: The newest frame, when there is one that has not been picked up yet.
+        :return None: When no new frame has been read since the last call.
+        """
+        with self._lock:
+            if not self._fresh:
+                return None
+            self._read, self._ready = self._ready, self._read
+            self._fresh = False
+        self.timestamp = self._timestamps[self._read]
+        self.frame_age = time.perf_counter() - self.timestamp
+        self.frames_delivered += 1
+        return self._slots[self._read]
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Gets the capture counters.
+
+        :return dict[str, float]: The frames captured, delivered and dropped, and the age (ms) of the last delivered frame.
+        """
+        return {
+            "frames_captured": self.frames_captured,
+            "frames_delivered": self.frames_delivered,
+            "frames_dropped": self.frames_dropped,
+            "frame_age_ms": self.frame_age * 1000,
+        }
@@ -0,0 +1,125 @@
+"""Background replacement for pgzhelper's camera. Puts a color, an image or a blurred copy of the frame behind the person, without making new arrays every frame."""
+
+from __future__ import annotations
+from .utilities import cv2, np, Optional
+
+class Compositor:
+    """Replaces the background of camera frames in place, using buffers made once for the frame size."""
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Creates a new Compositor that replaces the background with white.
+
+        :param width: The width of the frames.
+        :param height: The height of the frames.
+        """
+        self.mode = "color"
+        """What the background is replaced with: "color", "image" or "blur"."""
+
+        self.color = (255, 255, 255)
+        """The color the background is replaced with in "color" mode."""
+
+        self.image = None
+        """The RGB image (shape (height, width, 3)) the background is replaced with in "image" mode. It is scaled to the frame size."""
+
+        self.blur = 0
+        """How far (in pixels) the background is blurred in "blur" mode."""
+
+        self.feather = 0
+        """How wide (in pixels) the soft edge between the person and the background is. 0 is a hard edge."""
+
+        self.planes_built = 0
+        """How many times the background has been rebuilt because the color, image or size changed."""
+
+        self._plane_key = None
+        self.resize(width, height)
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        Makes the buffers for a new frame size.
+
+        :param width: The width of the frames.
+        :param height: The height of the frames.
+        """
+        self.width = width
+        """The width of the frames."""
+
+        self.height = height
+        """The height of the frames."""
+
+        self._plane = np.empty((height, width, 3), np.uint8)
+        self._hard_mask = np.empty((height, width), np.uint8)
+        self._alpha = np.empty((height, width), np.float32)
+        self._inverse_alpha = np.empty((height, width), np.float32)
+        self._plane_key = None
+
+    def set_color(self, color: tuple[int, int, int]) -> None:
+        """
+        Replaces the background with a color.
+
+        :param color: The color.
+        """
+        self.mode = "color"
+        self.color = tuple(color[:3])
+
+    def set_image(self, image: np.ndarray) -> None:
+        """
+        Replaces the background with an image.
+
+        :param image: The RGB image, shape (height, width, 3). It is scaled to the frame size.
+        """
+        self.mode = "image"
+        self.image = image
+        self._plane_key = None
+
+    def set_blur(self, radius: int) -> None:
+        """
+        Replaces the background with a blurred copy of the frame.
+
+        :param radius: How far (in pixels) to blur the background.
+        """
+        self.mode = "blur"
+        self.blur = radius
+
+    def _background(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Gets the background for a frame. Color and image backgrounds are only rebuilt when the color, image or size changes.
+
+        Not meant for user use.
+
+        :param frame: The RGB frame.
+
+        :return np.ndarray: The background, shape (height, width, 3).
+        """
+        if self.mode == "blur":
+            size = 2 * max(1, int(self.blur)) + 1
+            self._plane_key = None
+            return cv2.blur(frame, (size, size), dst=self._plane)
+        key = (self.mode, self.color if self.mode == "color" else id(self.image), self.width, self.height)
+        if key != self._plane_key:
+            if self.mode == "image":
+                cv2.resize(np.ascontiguousarray(self.image[..., :3]), (self.width, self.height), dst=self._plane, interpolation=cv2.INTER_AREA)
+            else:
+                self._plane[:] = self.color
+            self._plane_key = key
+            self.planes_built += 1
+        return self._plane
+
+    def composite(self, frame: np.ndarray, mask: np.ndarray, feather: Optional[int] = None) -> None:
+        """
+        Replaces the background of a frame, changing the frame.
+
+        :param frame: The RGB frame, shape (height, width, 3).
+        :param mask: The confidence (0 to 1) that each pixel is a person, shape (height, width). Pixels above 0.5 are kept.
+        :param feather: How wide (in pixels) the soft edge is. Defaults to None (the feather attribute).
+        """
+        background = self._background(frame)
+        feather = self.feather if feather is None else feather
+        if feather <= 0:
+            cv2.compare(mask, 0.5, cv2.CMP_LE, dst=self._hard_mask)
+            cv2.copyTo(background, self._hard_mask, frame)
+            return
+        size = 2 * int(feather) + 1
+        cv2.threshold(mask, 0.5, 1.0, cv2.THRESH_BINARY, dst=self._alpha)
+        cv2.blur(self._alpha, (size, size), dst=self._alpha)
+        np.subtract(1.0, self._alpha, out=self._inverse_alpha)
+        cv2.blendLinear(frame, background, self._alpha, self._inverse_alpha, dst=frame)
@@ -1,6 +1,21 @@
 from __future__ import annotations
 from .utilities import *
-from .utilities import _pgzero_screen, _pygame_cursor, _camera
+from .utilities import _pgzero_screen, _pygame_cursor, _camera, _recorder
+from ._pacing import PacingConfig, UNLIMITED
+from ._dispatch import InputCoalescer
+from ._stats import FrameProfiler, PHASES
+from ._camera import Camera
+from ._layout import CameraLayout
+from ._recorder import Recorder
+from ._sources import FrameSource, DeviceSource, VideoFileSource, ImageFolderSource, ArraySource, GeneratorSource
+from ._sharing import FrameReader
+from ._text import TextCache, TEXT_ANCHORS, _text_cache, get_textbox_key
+from ._glyphs import GlyphAtlas, get_atlas, clear_atlases
+from ._display_list import DisplayList, get_recording, set_recording
+from ._segmentation import SegmentationBackend, MediaPipeBackend, BackgroundSubtractorBackend, ChromaKeyBackend
+from ._dirty import DirtyRects, _dirty_rects
+from ._gradient import draw_gradient_line
+from pgzero import loaders
 
 _drawer = None
 """The pgzero drawer."""
@@ -8,47 +23,117 @@ _drawer = None
 _screen = None
 """The pgzero screen."""
 
-_draw_fps = 60
-"""The draw function's frames per second."""
+_pacing_config = PacingConfig()
+"""The frames per second for every function. Shared with the runner, which reads it every frame."""
 
-_update_fps = 60
-"""The updates function's frames per second."""
+_input_coalescer = InputCoalescer()
+"""Holds the mouse events until the runner hands them to the user's functions."""
 
-_on_mouse_down_fps = 60
-"""The on_mouse_down function's frames per second."""
-
-_on_mouse_move_fps = 60
-"""The on_mouse_move function's frames per second."""
-
-_on_mouse_up_fps = 60
-"""The on_mouse_up function's frames per second."""
+_frame_profiler = FrameProfiler()
+"""Times each part of every frame. Filled in by the runner."""
 
 _inited = False
 """If _init() is called yet."""
 
-def load_camera(camera_number: int = 0) -> None:
+def load_camera(camera_number: Union[int, str, np.ndarray, list, Iterable, Callable, FrameSource] = 0, threaded: bool = True, width: Optional[int] = None, height: Optional[int] = None, fps: Optional[float] = None, fourcc: Optional[str] = None, buffer_size: Optional[int] = 1, pacing: str = "realtime") -> None:
     """
     Loads a camera.
 
-    :param camera_number: If you have more than 1 camera, then 0 will be one of the cameras and 1 will be the other one.
+    :param camera_number: If you have more than 1 camera, then 0 will be one of the cameras and 1 will be the other one. Can also be something to read frames from instead of a camera: the path of a video file (like "clip.mp4") or a folder of images, an array (or list) of BGR frames, a generator (or a function returning one) of BGR frames, or a FrameSource.
+    :param threaded: Whether to read frames on a background thread. When True, the update function only picks up the newest frame instead of waiting for the camera. Defaults to True.
+    :param width: The width to ask the camera for. The camera may pick the nearest size it has; get_camera_width() gives the size it picked. Only used for cameras. Defaults to None (the camera's default).
+    :param height: The height to ask the camera for. Only used for cameras. Defaults to None (the camera's default).
+    :param fps: The frames per second to ask the camera for, or to play any other source at. Defaults to None (the camera's or video's own, or 30).
+    :param fourcc: The pixel format to ask the camera for, like "MJPG" (compressed, allows bigger sizes at full speed) or "YUYV". Defaults to None (the camera's default).
+    :param buffer_size: How many frames the camera driver may keep waiting. 1 means every frame read is the newest one, instead of one that has waited in the driver. Not every driver supports this. Defaults to 1.
+    :param pacing: For sources that are not cameras, "realtime" to hand out frames at fps like a camera, or "fast" to hand them out as quickly as they are read. Defaults to "realtime".
+
+    :raise CameraError: When fourcc is not four letters, the source cannot be opened, or pacing is not "realtime" or "fast".
+    """
+    _camera.load_camera(camera_number, threaded, width, height, fps, fourcc, buffer_size, pacing)
+
+def get_camera_stats() -> dict[str, float]:
+    """
+    Gets the camera counters. Capture counters are only counted when the camera reads frames on a background thread, segmentation counters when the background is removed asynchronously, latencies once a frame has been drawn, and skip counters when a motion threshold is set.
+
+    :return dict[str, float]: The frames captured, delivered (picked up by the update function) and dropped (replaced by a newer frame first), the age (ms) of the last delivered frame, the segmentation counters, the capture-to-draw latency (ms) of the newest drawn frame with its p50 and p95, the frames skipped because they hardly changed, the masks reused and the last motion score.
     """
-    _camera.load_camera(camera_number)
+    return _camera.get_stats()
 
-def remove_camera_background(color: Union[tuple[float, float, float]] = (255, 255, 255)) -> None:
+def remove_camera_background(color: Union[tuple[float, float, float]] = (255, 255, 255), asynchronous: bool = False, max_mask_age: float = 0.1, mask_scale: float = 1.0, refine_edges: bool = False, image: Optional[Union[str, pygame.Surface]] = None, blur: int = 0, feather: int = 0, backend: Optional[Union[str, SegmentationBackend]] = None) -> None:
     """
     Removes the camera output's background
 
     :param color: The color to replace the background with. Defaults to (255, 255, 255).
+    :param asynchronous: Whether to find the background on a background thread. The camera then shows each frame with the newest mask that is ready, instead of waiting for the segmenter. Defaults to False.
+    :param max_mask_age: When asynchronous, how much older (in seconds) than the frame the newest mask can be. When it is older, a new mask is made straight away. Defaults to 0.1.
+    :param mask_scale: How much to scale the frame down by before finding the background, from 0 (not included) to 1. Smaller is less exact, and faster: much faster for the "mog2", "knn" and "chroma" backends, barely faster for MediaPipe, which scales every frame to its model's own size. Defaults to 1.
+    :param refine_edges: When mask_scale is less than 1, whether to scale the mask back up along the edges in the frame (with a guided filter) instead of smoothly. The edges are closer to the full size mask's, but this is slower. Defaults to False.
+    :param image: An image to replace the background with instead of a color: a pygame Surface, or the file name or path of the image (file names are searched in the images directory). It is scaled to the camera size. Defaults to None.
+    :param blur: When more than 0 (and there is no image), the background is blurred by this many pixels instead of replaced. Defaults to 0.
+    :param feather: How wide (in pixels) the soft edge between the person and the background is. 0 is a hard edge. Defaults to 0.
+    :param backend: How the person is found: "mediapipe" (the most exact and the slowest), "mog2" or "knn" (background subtraction, for a camera that does not move: its cost falls with mask_scale much more than MediaPipe's), "chroma" (a green screen: the cheapest), or a SegmentationBackend like MediaPipeBackend("my_model.tflite"). Defaults to None ("mediapipe").
+
+    :raise CameraError: When mask_scale is not more than 0 and at most 1, or backend is not a known backend name.
+    :raise ImageLoadError: When the image cannot be found or loaded.
+    """
+    _camera.remove_background(color, asynchronous, max_mask_age, mask_scale, refine_edges, image, blur, feather, backend)
+
+def publish_camera_frames(name: Optional[str] = None, slots: int = 3) -> str:
+    """
+    Shares the camera's frames (and background masks) with other processes through shared memory, so they do not have to open the camera themselves. The frames are from before the background is replaced. Another process reads them with FrameReader(name).latest(). Frames are only copied while a reader is attached.
+
+    :param name: The name of the shared memory. Defaults to None (a name made from the process id).
+    :param slots: How many frames the shared memory holds. More slots give slow readers longer before their frame is overwritten. Defaults to 3.
+
+    :return str: The name to give to FrameReader().
+
+    :raise CameraNotLoadedError: When the camera is not loaded.
+    :raise CameraError: When slots is less than 2.
+    """
+    return _camera.start_publishing(name, slots)
+
+def stop_publishing_camera_frames() -> None:
     """
-    _camera.remove_background(color)
+    Stops sharing the camera's frames and removes the shared memory.
 
-def set_camera_zoom_factor(factor: float) -> None:
+    :raise CameraNotLoadedError: When the camera is not loaded.
+    """
+    _camera.stop_publishing()
+
+def set_camera_motion_threshold(threshold: Optional[float], mask_threshold: Optional[float] = None) -> None:
+    """
+    Lets the camera skip work when the picture has hardly changed. Each frame is scaled down and compared with the last frame that was shown.
+
+    :param threshold: How different (the mean color difference, from 0 to 255) a frame must be to be shown. Frames that are less different keep the last camera output. None turns this off, so every frame is processed.
+    :param mask_threshold: When the background is removed, how different a frame must be from the frame of the last mask for a new mask to be made. Frames that are less different are shown with the last mask. Defaults to 4 times threshold.
+    """
+    _camera.set_motion_threshold(threshold, mask_threshold)
+
+def set_camera_zoom_factor(factor: float, center: Optional[tuple[float, float]] = None, duration: float = 0, tween: str = "accel_decel") -> None:
     """
     Sets the camera zoom factor
 
     :param factor: How zoomed in it should be. 1 means it shows the full camera view. 2 means it zooms into the center of the camera by a factor of 2.
+    :param center: The (x, y) point of the camera's view to zoom into, in camera pixels. Defaults to None (the center of the camera's view).
+    :param duration: How long (in seconds) to move smoothly from the current view. 0 jumps straight there. Defaults to 0.
+    :param tween: How the move speeds up and slows down, like pgzero's animate(): "linear", "accel_decel", "bounce_end" and so on. Defaults to "accel_decel".
+
+    :raise CameraError: When tween is not one of pgzero's tweens.
     """
-    _camera.set_zoom_factor(factor)
+    _camera.set_zoom_factor(factor, center, duration, tween)
+
+def set_camera_region(region: tuple[float, float, float, float], duration: float = 0, tween: str = "accel_decel") -> None:
+    """
+    Shows only a region of the camera's view, scaled up to the camera size. This is digital pan, tilt and zoom: move the region to pan and tilt, and make it smaller to zoom in.
+
+    :param region: The (x, y, width, height) of the region, in camera pixels. It is grown to the camera's shape around its center, so the picture is not stretched, and kept inside the camera's view.
+    :param duration: How long (in seconds) to move smoothly from the current region. 0 jumps straight there. Defaults to 0.
+    :param tween: How the move speeds up and slows down, like pgzero's animate(): "linear", "accel_decel", "bounce_end" and so on. Defaults to "accel_decel".
+
+    :raise CameraError: When tween is not one of pgzero's tweens.
+    """
+    _camera.set_region(region, duration, tween)
 
 def _init(surface: _pgzero_screen) -> None:
     """
@@ -129,7 +214,12 @@ class Screen:
         :raise InitError: When screen is not initilized with init(screen).
         """
         _init_check()
-        _screen.fill(color)
+        recording = get_recording()
+        if recording is not None:
+            recording.fill(color)
+            return
+        _screen.surface.fill(_pgzero_screen.make_color(color))
+        _dirty_rects.mark_all()
 
     @staticmethod
     @property
@@ -180,7 +270,12 @@ class Screen:
         :raise InitError: When screen is not initilized with init(screen).
         """
         _init_check()
-        _screen.clear()
+        recording = get_recording()
+        if recording is not None:
+            recording.fill((0, 0, 0))
+            return
+        _screen.surface.fill((0, 0, 0))
+        _dirty_rects.mark_all()
 
     @staticmethod
     def blit(image: str, pos: tuple[float, float] = (0, 0)) -> None:
@@ -193,7 +288,13 @@ class Screen:
         :raise InitError: When screen is not initilized with init(screen).
         """
         _init_check()
-        _screen.blit(image, pos)
+        recording = get_recording()
+        if recording is not None:
+            recording.blit(image, pos)
+            return
+        if isinstance(image, str):
+            image = loaders.images.load(image)
+        _dirty_rects.add(_screen.surface.blit(image, pos))
 
     @staticmethod
     def lerp_color(color1: tuple[float, float, float], color2: tuple[float, float, float], t: int) -> tuple[float, float, float]:
@@ -259,33 +360,57 @@ class Screen:
             :raise InitError: When screen is not initilized with init(screen).
             """
             _init_check()
-            if topleft:
-                _drawer.text(text, fontname=fontname, fontsize=fontsize, sysfontname=sysfontname, antialias=antialias, bold=bold, italic=italic, underline=underline, color=color, background=background, topleft=topleft,
-                width=width, widthem=widthem, lineheight=lineheight, align=align, owidth=owidth, ocolor=ocolor, shadow=shadow, scolor=scolor, gcolor=gcolor, alpha=alpha, anchor=anchor, angle=angle)
-            if bottomleft:
-                _drawer.text(text, fontname=fontname, fontsize=fontsize, sysfontname=sysfontname, antialias=antialias, bold=bold, italic=italic, underline=underline, color=color, background=background, bottomleft=bottomleft,
-                width=width, widthem=widthem, lineheight=lineheight, align=align, owidth=owidth, ocolor=ocolor, shadow=shadow, scolor=scolor, gcolor=gcolor, alpha=alpha, anchor=anchor, angle=angle)
-            if topright:
-                _drawer.text(text, fontname=fontname, fontsize=fontsize, sysfontname=sysfontname, antialias=antialias, bold=bold, italic=italic, underline=underline, color=color, background=background, topright=topright,
-                width=width, widthem=widthem, lineheight=lineheight, align=align, owidth=owidth, ocolor=ocolor, shadow=shadow, scolor=scolor, gcolor=gcolor, alpha=alpha, anchor=anchor, angle=angle)
-            if bottomright:
-                _drawer.text(text, fontname=fontname, fontsize=fontsize, sysfontname=sysfontname, antialias=antialias, bold=bold, italic=italic, underline=underline, color=color, background=background, bottomright=bottomright,
-                width=width, widthem=widthem, lineheight=lineheight, align=align, owidth=owidth, ocolor=ocolor, shadow=shadow, scolor=scolor, gcolor=gcolor, alpha=alpha, anchor=anchor, angle=angle)
-            if midtop:
-                _drawer.text(text, fontname=fontname, fontsize=fontsize, sysfontname=sysfontname, antialias=antialias, bold=bold, italic=italic, underline=underline, color=color, background=background, midtop=midtop,
-                width=width, widthem=widthem, lineheight=lineheight, align=align, owidth=owidth, ocolor=ocolor, shadow=shadow, scolor=scolor, gcolor=gcolor, alpha=alpha, anchor=anchor, angle=angle)
-            if midleft:
-                _drawer.text(text, fontname=fontname, fontsize=fontsize, sysfontname=sysfontname, antialias=antialias, bold=bold, italic=italic, underline=underline, color=color, background=background, midleft=midleft,
-                width=width, widthem=widthem, lineheight=lineheight, align=align, owidth=owidth, ocolor=ocolor, shadow=shadow, scolor=scolor, gcolor=gcolor, alpha=alpha, anchor=anchor, angle=angle)
-            if midbottom:
-                _drawer.text(text, fontname=fontname, fontsize=fontsize, sysfontname=sysfontname, antialias=antialias, bold=bold, italic=italic, underline=underline, color=color, background=background, midbottom=midbottom,
-                width=width, widthem=widthem, lineheight=lineheight, align=align, owidth=owidth, ocolor=ocolor, shadow=shadow, scolor=scolor, gcolor=gcolor, alpha=alpha, anchor=anchor, angle=angle)
-            if midright:
-                _drawer.text(text, fontname=fontname, fontsize=fontsize, sysfontname=sysfontname, antialias=antialias, bold=bold, italic=italic, underline=underline, color=color, background=background, midright=midright,
-                width=width, widthem=widthem, lineheight=lineheight, align=align, owidth=owidth, ocolor=ocolor, shadow=shadow, scolor=scolor, gcolor=gcolor, alpha=alpha, anchor=anchor, angle=angle)
-            if center:
-                _drawer.text(text, fontname=fontname, fontsize=fontsize, sysfontname=sysfontname, antialias=antialias, bold=bold, italic=italic, underline=underline, color=color, background=background, center=center,
-                width=width, widthem=widthem, lineheight=lineheight, align=align, owidth=owidth, ocolor=ocolor, shadow=shadow, scolor=scolor, gcolor=gcolor, alpha=alpha, anchor=anchor, angle=angle)
+            positions = (topleft, bottomleft, topright, bottomright, midtop, midleft, midbottom, midright, center)
+            recording = get_recording()
+            for pos, (hanchor, vanchor) in zip(positions, TEXT_ANCHORS.values()):
+                if pos and recording is not None:
+                    recording.text(pos, text, fontname, fontsize, sysfontname, antialias, bold, italic, underline, color, background, width, widthem,
+                                   lineheight, align, owidth, ocolor, shadow, scolor, gcolor, alpha, angle, hanchor, vanchor)
+                elif pos:
+                    _dirty_rects.add(_text_cache.draw(_screen.surface, pos, text, fontname, fontsize, sysfontname, antialias, bold, italic, underline, color, background, width, widthem,
+                                                      lineheight, align, owidth, ocolor, shadow, scolor, gcolor, alpha, angle, hanchor, vanchor))
+
+        @staticmethod
+        def dynamic_text(text: str, fontname: Optional[str] = None, fontsize: Optional[int] = None, sysfontname: Optional[str] = None, antialias: bool = True, bold: bool = False, italic: bool = False,
+                         color: Union[tuple[int, int, int], str] = "black", topleft: Optional[tuple[int, int]] = None, bottomleft: Optional[tuple[int, int]] = None, topright: Optional[tuple[int, int]] = None,
+                         bottomright: Optional[tuple[int, int]] = None, midtop: Optional[tuple[int, int]] = None, midleft: Optional[tuple[int, int]] = None, midbottom: Optional[tuple[int, int]] = None,
+                         midright: Optional[tuple[int, int]] = None, center: Optional[tuple[int, int]] = None, owidth: Optional[float] = None, ocolor: Union[tuple[int, int, int], str, None] = None,
+                         shadow: Optional[tuple[float, float]] = None, scolor: Union[tuple[int, int, int], str, None] = None) -> None:
+            """
+            Function to draw text that changes every frame, like a score, a timer or an FPS counter, to the Screen. Each glyph of the font, size and style is rendered once (with its outline and shadow) into a glyph atlas, and the text is put together from it, so new text costs a few blits instead of a render. Use Screen.draw.text() for text that does not change, or that needs wrapping, gradients or rotation.
+
+            :param text: The text to be drawn to the screen. Lines are split at "\n".
+            :param fontname: The font name for the text. Font names must be in a font directory and in the .ttf format. Defaults to the sysfontname.
+            :param fontsize: The size of the font to use, in pixels. Defaults to 24.
+            :param sysfontname: The system font name to use if fontname is omitted. Defaults to the system font.
+            :param antialias: Whether to render with antialiasing or not. Defaults to True.
+            :param bold: Whether to make the text bold or not. Defaults to False.
+            :param italic: Whether to make the text italic or not. Defaults to False.
+            :param color: The color of the text to use. Defaults to "black".
+            :param topleft: The topleft position of the text. Only use one of the position arguments. Defaults to None.
+            :param bottomleft: The bottomleft position of the text. Defaults to None.
+            :param topright: The topright position of the text. Defaults to None.
+            :param bottomright: The bottomright position of the text. Defaults to None.
+            :param midtop: The midtop position of the text. Defaults to None.
+            :param midleft: The midleft position of the text. Defaults to None.
+            :param midbottom: The midbottom position of the text. Defaults to None.
+            :param midright: The midright position of the text. Defaults to None.
+            :param center: The center position of the text. Defaults to None.
+            :param owidth: The outline thickness, in outline units (like Screen.draw.text()). Defaults to None (no outline).
+            :param ocolor: The outline color. Defaults to "black".
+            :param shadow: (x,y) values representing the drop shadow offset, in shadow units (like Screen.draw.text()). Defaults to None (No shadow).
+            :param scolor: The shadow color. Defaults to "black".
+
+            :raise InitError: When screen is not initilized with init(screen).
+            """
+            _init_check()
+            recording = get_recording()
+            positions = (topleft, bottomleft, topright, bottomright, midtop, midleft, midbottom, midright, center)
+            for pos, anchor in zip(positions, TEXT_ANCHORS.values()):
+                if pos and recording is not None:
+                    recording.dynamic_text(text, pos, anchor, fontname, fontsize, sysfontname, antialias, bold, italic, color, owidth, ocolor, shadow, scolor)
+                elif pos:
+                    _dirty_rects.add(get_atlas(fontname, fontsize, sysfontname, antialias, bold, italic, color, owidth, ocolor, shadow, scolor).draw(_screen.surface, text, pos, anchor))
 
         @staticmethod
         def textbox(text: str, rect: Rect, fontname: Optional[str] = None, sysfontname: Optional[str] = None, lineheight: Optional[int] = None, anchor: Optional[int] = None, bold: bool = False, italic: bool = False,
@@ -320,8 +445,13 @@ class Screen:
             :raise InitError: When screen is not initilized with init(screen).
             """
             _init_check()
-            _drawer.textbox(text, rect, fontname=fontname, sysfontname=sysfontname, lineheight=lineheight, anchor=anchor, bold=bold, italic=italic, underline=underline, antialias=antialias,
-                                color=color, background=background, widthem=widthem, align=align, owidth=owidth, ocolor=ocolor, shadow=shadow, scolor=scolor, gcolor=gcolor, alpha=alpha, angle=angle)
+            pos, key = get_textbox_key(text, rect, fontname, sysfontname, lineheight, anchor, bold, italic, underline, antialias, color, background, widthem, align,
+                                       owidth, ocolor, shadow, scolor, gcolor, alpha, angle)
+            recording = get_recording()
+            if recording is not None:
+                recording.text(pos, *key)
+                return
+            _dirty_rects.add(_text_cache.draw(_screen.surface, pos, *key))
 
         @staticmethod
         @overload
@@ -368,7 +498,11 @@ class Screen:
                     raise ThicknessError("Cannot draw a circle with 0 thickness")
                 elif width <= 0:
                     raise ThicknessError("Cannot draw a circle with negative thickness")
-                pygame.draw.rect(_screen.surface, args[1], args[0], width)
+                recording = get_recording()
+                if recording is not None:
+                    recording.rect(args[0], args[1], width)
+                    return
+                _dirty_rects.add(pygame.draw.rect(_screen.surface, args[1], args[0], width))
             elif isinstance(args[0], int):
                 if len(args) == 2:
                     width = 1
@@ -378,7 +512,11 @@ class Screen:
                     raise ThicknessError("Cannot draw a circle with 0 thickness")
                 elif width <= 0:
                     raise ThicknessError("Cannot draw a circle with negative thickness")
-                pygame.draw.rect(_screen.surface, args[4], Rect(args[0], args[1], args[2], args[3]), width)
+                recording = get_recording()
+                if recording is not None:
+                    recording.rect(Rect(args[0], args[1], args[2], args[3]), args[4], width)
+                    return
+                _dirty_rects.add(pygame.draw.rect(_screen.surface, args[4], Rect(args[0], args[1], args[2], args[3]), width))
 
         @staticmethod
         @overload
@@ -412,10 +550,18 @@ class Screen:
         @staticmethod
         def filled_rect(*args: Union[Rect, tuple[int, int, int], str, int]) -> None:
             _init_check()
-            if len(args) == 2:
-                _drawer.filled_rect(args[0], args[1])
+            recording = get_recording()
+            if recording is not None:
+                if len(args) == 2:
+                    recording.rect(args[0], args[1], 0)
+                elif len(args) == 5:
+                    recording.rect(Rect(args[0], args[1], args[2], args[3]), args[4], 0)
+            elif len(args) == 2:
+                pygame.draw.rect(_screen.surface, _pgzero_screen.make_color(args[1]), args[0], 0)
+                _dirty_rects.add(Rect(args[0]))
             elif len(args) == 5:
-                _drawer.filled_rect(Rect(args[0], args[1], args[2], args[3]), args[4])
+                pygame.draw.rect(_screen.surface, _pgzero_screen.make_color(args[4]), Rect(args[0], args[1], args[2], args[3]), 0)
+                _dirty_rects.add(Rect(args[0], args[1], args[2], args[3]))
 
         @staticmethod
         def line(start: tuple[int, int], end: tuple[int, int], color: Union[tuple[int, int, int], str], thickness: int = 1) -> Rect:
@@ -432,7 +578,12 @@ class Screen:
             :raise InitError: When the screen is not initialized with init(screen).
             """
             _init_check()
-            return pygame.draw.line(_screen.surface, color, start, end, thickness)
+            recording = get_recording()
+            if recording is not None:
+                return recording.line(start, end, color, thickness)
+            rect = pygame.draw.line(_screen.surface, color, start, end, thickness)
+            _dirty_rects.add(rect)
+            return rect
 
         @staticmethod
         @overload
@@ -470,7 +621,12 @@ class Screen:
             if isinstance(args[0], Polygon):
                 args[0] = args[0].points
 
-            return pygame.draw.polygon(_screen.surface, args[1], args[0], args[2])
+            recording = get_recording()
+            if recording is not None:
+                return recording.polygon(args[0], args[1], args[2])
+            rect = pygame.draw.polygon(_screen.surface, args[1], args[0], args[2])
+            _dirty_rects.add(rect)
+            return rect
 
         @staticmethod
         @overload
@@ -517,7 +673,12 @@ class Screen:
                     raise ThicknessError("Cannot draw a circle with 0 thickness")
                 elif width <= 0:
                     raise ThicknessError("Cannot draw a circle with negative thickness")
-                return pygame.draw.circle(_screen.surface, args[2], args[0], args[1], width)
+                recording = get_recording()
+                if recording is not None:
+                    return recording.circle(args[0], args[1], args[2], width)
+                rect = pygame.draw.circle(_screen.surface, args[2], args[0], args[1], width)
+                _dirty_rects.add(rect)
+                return rect
             elif isinstance(args[0], Circle):
                 if len(args) == 3:
                     width = args[2]
@@ -527,7 +688,12 @@ class Screen:
                     raise ThicknessError("Cannot draw a circle with 0 thickness")
                 elif width <= 0:
                     raise ThicknessError("Cannot draw a circle with negative thickness")
-                return pygame.draw.circle(_screen.surface, args[1], args[0].center, args[0].radius, width)
+                recording = get_recording()
+                if recording is not None:
+                    return recording.circle(args[0].center, args[0].radius, args[1], width)
+                rect = pygame.draw.circle(_screen.surface, args[1], args[0].center, args[0].radius, width)
+                _dirty_rects.add(rect)
+                return rect
 
         @staticmethod
         @overload
@@ -561,35 +727,45 @@ class Screen:
         @staticmethod
         def filled_circle(*args: Union[tuple[int, int], tuple[int, int, int], Circle, str, int]) -> Rect:
             _init_check()
-            if len(args) == 3:
-                return pygame.draw.circle(_screen.surface, args[2], args[0], args[1], 0)
+            recording = get_recording()
+            if recording is not None:
+                if len(args) == 3:
+                    return recording.circle(args[0], args[1], args[2], 0)
+                elif len(args) == 2:
+                    return recording.circle(args[0].center, args[0].radius, args[1], 0)
+            elif len(args) == 3:
+                rect = pygame.draw.circle(_screen.surface, args[2], args[0], args[1], 0)
+                _dirty_rects.add(rect)
+                return rect
             elif len(args) == 2:
-                return pygame.draw.circle(_screen.surface, args[1], args[0].center, args[0].radius, 0)
+                rect = pygame.draw.circle(_screen.surface, args[1], args[0].center, args[0].radius, 0)
+                _dirty_rects.add(rect)
+                return rect
 
         @staticmethod
-        def gradient_line(start_pos: tuple[int, int], end_pos: tuple[int, int], start_color: Union[tuple[float, float, float], str], end_color: Union[tuple[float, float, float], str], thickness: int = 1) -> None:
+        def gradient_line(start_pos: tuple[int, int], end_pos: tuple[int, int], start_color: Union[tuple[float, float, float], str], end_color: Union[tuple[float, float, float], str], thickness: int = 1,
+                          antialias: bool = False) -> Rect:
             """
-            Draws a gradient line onto the screen.
+            Draws a gradient line onto the screen. The line is thickness pixels wide across its direction, centered on the start and end positions.
 
             :param start_pos: The start position of the line.
             :param end_pos: The end position of the line.
             :param start_color: The starting color. This color will be placed at the start_pos.
             :param end_color: The starting color. This color will be placed at the end_pos and a gradient will be drawn between those two points.
-            :param thickness: The thickness of the line.
-            """
-            x1, y1 = start_pos
-            x2, y2 = end_pos
-            dx = x2 - x1
-            dy = y2 - y1
-            steps = max(abs(dx), abs(dy))
-            if steps == 0:
-                return
-            for i in range(int(steps) + 1):
-                t = i / steps
-                current_color = Screen.lerp_color(start_color, end_color, t)
-                current_x = int(x1 + t * dx)
-                current_y = int(y1 + t * dy)
-                Screen.draw.filled_rect(Rect((current_x, current_y), (thickness, thickness)), current_color)
+            :param thickness: The thickness of the line. Defaults to 1.
+            :param antialias: Whether to blend the edges of the line with what is under it, so slanted lines look smooth. Defaults to False.
+
+            :return Rect: The Rect that the line is drawn within.
+
+            :raise InitError: When the screen is not initialized with init(screen).
+            """
+            _init_check()
+            recording = get_recording()
+            if recording is not None:
+                return recording.gradient_line(start_pos, end_pos, start_color, end_color, thickness, antialias)
+            rect = draw_gradient_line(_screen.surface, start_pos, end_pos, start_color, end_color, thickness, antialias)
+            _dirty_rects.add(rect)
+            return rect
   
     class cursor:
         """Class for changing and gettong, the cursor shape on the Screen."""
@@ -659,127 +835,495 @@ class Screen:
         wheel_click = PGZeroMouse.MIDDLE
         """When the scroll wheel is pressed."""
 
+        @staticmethod
+        def set_path_length(length: int) -> None:
+            """
+            Changes how many mouse positions are kept between on_mouse_move calls. on_mouse_move is only called with the newest position, once per frame, so use Screen.mouse.get_path() to get the ones in between.
+
+            :param length: How many positions to keep. 0 keeps none.
+            """
+            _input_coalescer.path_length = length
+
+        @staticmethod
+        def get_path() -> list[tuple[int, int]]:
+            """
+            Gets the mouse positions that were combined into the last on_mouse_move call. Needs Screen.mouse.set_path_length() to be more than 0.
+
+            :return list[tuple[int, int]]: A copy of the positions, oldest first.
+            """
+            return list(_input_coalescer.path)
+
+    class stats:
+        """Class for getting where the frame time goes. The times are only recorded when you run with pgzhelper_run.go()."""
+        phases = PHASES
+        """The parts of a frame that are timed: the user's draw, the camera's draw, copying the screen for Screen.recording, the user's update, the camera's update, the mouse functions, the time spent sleeping and the whole frame."""
+
+        @staticmethod
+        def get_percentiles(phase: str) -> dict[str, float]:
+            """
+            Gets the p50, p95 and p99 time of a part of the frame, over the last 600 frames.
+
+            :param phase: The part of the frame. One of Screen.stats.phases.
+
+            :return dict[str, float]: The times in milliseconds, keyed "p50", "p95" and "p99".
+
+            :raise KeyError: When the phase is not one of Screen.stats.phases.
+            """
+            return _frame_profiler.get_percentiles(phase)
+
+        @staticmethod
+        def get_summary() -> dict[str, dict[str, float]]:
+            """
+            Gets the p50, p95 and p99 time of every part of the frame, over the last 600 frames.
+
+            :return dict[str, dict[str, float]]: For each part, the times in milliseconds.
+            """
+            return _frame_profiler.get_summary()
+
+        @staticmethod
+        def get_frame_count() -> int:
+            """
+            Gets how many frames have been recorded.
+
+            :return int: The number of frames.
+            """
+            return _frame_profiler.frames
+
+        @staticmethod
+        def show_overlay(show: bool = True) -> None:
+            """
+            Shows or hides the stats overlay, drawn on top of everything at the end of every frame. Its numbers are updated four times a second.
+
+            :param show: Whether to show the overlay. Defaults to True.
+            """
+            _frame_profiler.overlay = show
+
+        @staticmethod
+        def is_overlay_shown() -> bool:
+            """
+            Checks if the stats overlay is shown.
+
+            :return True: When the overlay is shown.
+            :return False: When the overlay is hidden.
+            """
+            return _frame_profiler.overlay
+
+        @staticmethod
+        def time_handlers(enabled: bool = True) -> None:
+            """
+            Turns timing every call of your draw, update and mouse functions on or off. The times are given by pgzhelper_run.get_stats(). Off by default, since it adds to every call.
+
+            :param enabled: Whether to time the calls. Defaults to True.
+            """
+            _frame_profiler.time_handlers = enabled
+
+        @staticmethod
+        def dump_csv(path: str) -> None:
+            """
+            Writes the recorded frames to a CSV file, one row per frame and one column per part of the frame (in milliseconds). Useful for comparing builds.
+
+            :param path: The path of the CSV file.
+            """
+            _frame_profiler.dump_csv(path)
+
+        @staticmethod
+        def reset() -> None:
+            """
+            Forgets all of the recorded frames.
+            """
+            _frame_profiler.reset()
+
+    class display_list:
+        """Class for retained drawing. Between begin() and end(), the Screen.draw functions, Screen.fill(), Screen.clear() and Screen.blit() on that thread record into a DisplayList instead of drawing. The list can be drawn later with replay(), and compared with the last frame's with DisplayList.diff() to find what changed. Any thread can record; only replay() must run on the main thread."""
+        @staticmethod
+        def begin(display_list: Optional[DisplayList] = None) -> DisplayList:
+            """
+            Starts recording this thread's drawing into a DisplayList.
+
+            :param display_list: The DisplayList to add to. Defaults to None (a new, empty one).
+
+            :return DisplayList: The DisplayList being recorded into.
+            """
+            if display_list is None:
+                display_list = DisplayList()
+            set_recording(display_list)
+            return display_list
+
+        @staticmethod
+        def end() -> Optional[DisplayList]:
+            """
+            Stops recording this thread's drawing, so the Screen.draw functions draw straight away again.
+
+            :return DisplayList: The DisplayList that was recorded into.
+            :return None: When this thread was not recording.
+            """
+            display_list = get_recording()
+            set_recording(None)
+            return display_list
+
+        @staticmethod
+        def is_recording() -> bool:
+            """
+            Checks if this thread's drawing is being recorded.
+
+            :return True: When it is recorded into a DisplayList.
+            :return False: When it is drawn straight away.
+            """
+            return get_recording() is not None
+
+        @staticmethod
+        def replay(display_list: DisplayList, area: Optional[Rect] = None) -> None:
+            """
+            Draws a DisplayList on the Screen.
+
+            :param display_list: The DisplayList.
+            :param area: Only draw inside this area, skipping the commands that do not touch it. Defaults to None (draw everything).
+
+            :raise InitError: When screen is not initilized with init(screen).
+            """
+            _init_check()
+            display_list.replay(_screen.surface, area)
+            if area is not None:
+                _dirty_rects.add(area)
+            elif _dirty_rects.enabled:
+                for rect in display_list.get_bounds(_screen.surface.get_rect()):
+                    _dirty_rects.add(rect)
+
+        @staticmethod
+        def replay_changes(display_list: DisplayList, previous: Optional[DisplayList]) -> list[Rect]:
+            """
+            Draws only the areas where a DisplayList differs from another, like the last frame's, on a Screen that still shows the other list. With Screen.dirty_rects turned on, only those areas are shown on the window too.
+
+            :param display_list: The DisplayList.
+            :param previous: The DisplayList the Screen shows now. None draws everything.
+
+            :return list[Rect]: The areas that were drawn.
+
+            :raise InitError: When screen is not initilized with init(screen).
+            """
+            _init_check()
+            if previous is None:
+                screen_rect = _screen.surface.get_rect()
+                display_list.replay(_screen.surface)
+                _dirty_rects.mark_all()
+                return [screen_rect]
+            areas = display_list.diff(previous, _screen.surface.get_rect())
+            for area in areas:
+                display_list.replay(_screen.surface, area)
+                _dirty_rects.add(area)
+            return areas
+
+    class text_cache:
+        """Class for the cache of rendered text. Screen.draw.text() and Screen.draw.textbox() keep the Surface of every text they render, so text that does not change (menus, labels, captions) is only blitted. The least recently used Surfaces are dropped when they take up more than the size limit."""
+        @staticmethod
+        def set_max_bytes(max_bytes: int) -> None:
+            """
+            Changes how many bytes of rendered text can be kept. Defaults to 32 MB.
+
+            :param max_bytes: How many bytes can be kept. 0 keeps nothing.
+            """
+            _text_cache.set_max_bytes(max_bytes)
+
+        @staticmethod
+        def set_enabled(enabled: bool) -> None:
+            """
+            Turns the cache on or off. When it is off, text is rendered again every time it is drawn. Turning it off does not drop the kept text; use invalidate() for that.
+
+            :param enabled: Whether rendered text is kept.
+            """
+            _text_cache.enabled = enabled
+
+        @staticmethod
+        def invalidate(fontname: Optional[str] = None) -> None:
+            """
+            Drops kept text and the glyph atlases of Screen.draw.dynamic_text(), so they are rendered again. Call this after a font file changes.
+
+            :param fontname: Only drop text drawn with this fontname or sysfontname. Defaults to None (drop everything).
+            """
+            _text_cache.invalidate(fontname)
+            clear_atlases(fontname)
+
+        @staticmethod
+        def get_stats() -> dict[str, float]:
+            """
+            Gets the cache counters. See TextCache.get_stats().
+
+            :return dict[str, float]: The hits, misses, hit rate, evictions, how many Surfaces are kept and how many bytes they take up.
+            """
+            return _text_cache.get_stats()
+
+    class dirty_rects:
+        """Class for showing only the areas of the screen that were drawn on each frame, instead of the whole screen. The Screen.draw functions, Screen.blit(), cameras, camera layouts, Actor.draw() and pgzero's screen.blit() mark the areas they draw on; Screen.fill(), Screen.clear(), pgzero's screen.fill(), screen.clear() and screen.draw functions mark the whole screen. Drawing on Screen.surface with pygame yourself is not seen, so mark it with Screen.dirty_rects.add() or Screen.dirty_rects.mark_all(), or it is not shown. When the areas cover more of the screen than the coverage threshold, the whole screen is shown instead. Only works when you run with pgzhelper_run.go()."""
+        @staticmethod
+        def enable(coverage_threshold: float = 0.5) -> None:
+            """
+            Turns dirty rectangles on. The next frame still shows the whole screen.
+
+            :param coverage_threshold: How much of the screen (0 to 1) the drawn areas can cover before the whole screen is shown instead. Defaults to 0.5.
+            """
+            _dirty_rects.coverage_threshold = coverage_threshold
+            _dirty_rects.enabled = True
+            _dirty_rects.mark_all()
+
+        @staticmethod
+        def disable() -> None:
+            """
+            Turns dirty rectangles off, so every frame shows the whole screen.
+            """
+            _dirty_rects.enabled = False
+            _dirty_rects.rects = []
+
+        @staticmethod
+        def is_enabled() -> bool:
+            """
+            Checks if dirty rectangles are turned on.
+
+            :return True: When only the drawn areas are shown.
+            :return False: When every frame shows the whole screen.
+            """
+            return _dirty_rects.enabled
+
+        @staticmethod
+        def add(rect: Union[Rect, tuple[int, int, int, int]]) -> None:
+            """
+            Marks an area as drawn on. Use this after drawing on Screen.surface with pygame yourself, since only pgzhelper's and pgzero's drawing functions mark their areas.
+
+            :param rect: The area.
+            """
+            _dirty_rects.add(rect)
+
+        @staticmethod
+        def mark_all() -> None:
+            """
+            Shows the whole screen this frame.
+            """
+            _dirty_rects.mark_all()
+
+        @staticmethod
+        def get_stats() -> dict[str, float]:
+            """
+            Gets the presentation counters. See DirtyRects.get_stats().
+
+            :return dict[str, float]: The frames that showed only the drawn areas, the whole screen or nothing, the mean number of areas of a partial frame, and how much of the screen last frame's areas covered.
+            """
+            return _dirty_rects.get_stats()
+
+    class recording:
+        """Class for recording the screen to a video, or to a folder of PNG images. The frames are written on a background thread. The screen is only recorded when you run with pgzhelper_run.go()."""
+        @staticmethod
+        def start(path: str, fps: Optional[float] = None, queue_size: int = 8, policy: str = "drop", fourcc: str = "mp4v") -> Recorder:
+            """
+            Starts recording the screen at the end of every frame, after the camera and the stats overlay are drawn. Stops any recording that was already running.
+
+            :param path: The video file to write (like "game.mp4"), or a folder to write PNG images into (a path with no extension).
+            :param fps: The frames per second of the video. Defaults to None (the draw function's frames per second, or 60 when it is unlimited).
+            :param queue_size: How many frames can wait to be written. Defaults to 8.
+            :param policy: "drop" to skip frames when too many are waiting, so the game never slows down, or "block" to wait for them, so every frame is kept. Defaults to "drop".
+            :param fourcc: The four letter video codec, like "mp4v" or "MJPG". Defaults to "mp4v".
+
+            :return Recorder: The Recorder, for its counters.
+
+            :raise RecordingError: When policy is not "drop" or "block", or fourcc is not four letters.
+            """
+            if fps is None:
+                fps = _pacing_config.draw_fps or 60
+            return _recorder.start_screen_recording(path, fps, queue_size, policy, fourcc)
+
+        @staticmethod
+        def stop() -> None:
+            """
+            Stops recording the screen and waits for the waiting frames to be written. pgzhelper_run.go() also does this when the game closes.
+
+            :raise RecordingError: When the recording could not be written (like a folder that cannot be made, or a codec that is not available), and the error was not raised while recording.
+            """
+            _recorder.stop_screen_recording()
+
+        @staticmethod
+        def is_recording() -> bool:
+            """
+            Checks if the screen is being recorded.
+
+            :return True: When the screen is being recorded.
+            :return False: When it is not.
+            """
+            return _recorder.get_screen_recorder() is not None
+
+        @staticmethod
+        def get_stats() -> dict[str, float]:
+            """
+            Gets the recording counters. See Recorder.get_stats().
+
+            :return dict[str, float]: The counters. Empty when the screen is not being recorded.
+            """
+            recorder = _recorder.get_screen_recorder()
+            if recorder is None:
+                return {}
+            return recorder.get_stats()
+
     @staticmethod
-    def set_draw_fps(frames_per_second: int) -> None:
+    def set_draw_fps(frames_per_second: Optional[int]) -> None:
         """
-        Changes the frames per second for the draw function.
+        Changes the frames per second for the draw function. Takes effect on the next frame.
 
-        :param frames_per_second: The frames per second for the draw function.
+        :param frames_per_second: The frames per second for the draw function. Use UNLIMITED for no limit.
 
         :raise InitError: When the screen is not initialized with init(screen).
         :raise FPSError: When the frames per second is less than nonpositive (<= 0).
         """
-        global _draw_fps
         _init_check()
-        if frames_per_second <= 0:
+        if frames_per_second is not UNLIMITED and frames_per_second <= 0:
             raise FPSError("Frames per second must be greater than 0.")
-        _draw_fps = frames_per_second
+        _pacing_config.draw_fps = frames_per_second
 
     @staticmethod
-    def set_update_fps(frames_per_second: int) -> None:
+    def set_update_fps(frames_per_second: Optional[int]) -> None:
         """
-        Changes the frames per second for the update function.
+        Changes the frames per second for the update function. Takes effect on the next frame.
 
-        :param frames_per_second: The frames per second for the update function.
+        :param frames_per_second: The frames per second for the update function. Use UNLIMITED for no limit.
 
         :raise InitError: When the screen is not initialized with init(screen).
         :raise FPSError: When the frames per second is less than nonpositive (<= 0).
         """
-        global _update_fps
         _init_check()
-        if frames_per_second <= 0:
+        if frames_per_second is not UNLIMITED and frames_per_second <= 0:
             raise FPSError("Frames per second must be greater than 0.")
-        _update_fps = frames_per_second
+        _pacing_config.update_fps = frames_per_second
 
     @staticmethod
-    def set_on_mouse_down_fps(frames_per_second: int) -> None:
+    def set_on_mouse_down_fps(frames_per_second: Optional[int]) -> None:
         """
-        Changes the frames per second for the on_mouse_down function.
+        Changes the frames per second for the on_mouse_down function. Takes effect on the next frame. Events that come in faster are held until the function can be called again.
 
-        :param frames_per_second: The frames per second for the on_mouse_down function.
+        :param frames_per_second: The frames per second for the on_mouse_down function. Use UNLIMITED for no limit.
 
         :raise InitError: When the screen is not initialized with init(screen).
         :raise FPSError: When the frames per second is less than nonpositive (<= 0).
         """
-        global _on_mouse_down_fps
         _init_check()
-        if frames_per_second <= 0:
+        if frames_per_second is not UNLIMITED and frames_per_second <= 0:
             raise FPSError("Frames per second must be greater than 0.")
-        _on_mouse_down_fps = frames_per_second
+        _pacing_config.on_mouse_down_fps = frames_per_second
 
     @staticmethod
-    def set_on_mouse_move_fps(frames_per_second: int) -> None:
+    def set_on_mouse_move_fps(frames_per_second: Optional[int]) -> None:
         """
-        Changes the frames per second for the on_mouse_move function.
+        Changes the frames per second for the on_mouse_move function. Takes effect on the next frame. Events that come in faster are held until the function can be called again (only the newest position is kept).
 
-        :param frames_per_second: The frames per second for the on_mouse_move function.
+        :param frames_per_second: The frames per second for the on_mouse_move function. Use UNLIMITED for no limit.
 
         :raise InitError: When the screen is not initialized with init(screen).
         :raise FPSError: When the frames per second is less than nonpositive (<= 0).
         """
-        global _on_mouse_move_fps
         _init_check()
-        if frames_per_second <= 0:
+        if frames_per_second is not UNLIMITED and frames_per_second <= 0:
             raise FPSError("Frames per second must be greater than 0.")
-        _on_mouse_move_fps = frames_per_second
+        _pacing_config.on_mouse_move_fps = frames_per_second
 
     @staticmethod
-    def set_on_mouse_up_fps(frames_per_second: int) -> None:
+    def set_on_mouse_up_fps(frames_per_second: Optional[int]) -> None:
         """
-        Changes the frames per second for the on_mouse_up function.
+        Changes the frames per second for the on_mouse_up function. Takes effect on the next frame. Events that come in faster are held until the function can be called again.
 
-        :param frames_per_second: The frames per second for the on_mouse_up function.
+        :param frames_per_second: The frames per second for the on_mouse_up function. Use UNLIMITED for no limit.
 
         :raise InitError: When the screen is not initialized with init(screen).
         :raise FPSError: When the frames per second is less than nonpositive (<= 0).
         """
-        global _on_mouse_up_fps
         _init_check()
-        if frames_per_second <= 0:
+        if frames_per_second is not UNLIMITED and frames_per_second <= 0:
             raise FPSError("Frames per second must be greater than 0.")
-        _on_mouse_up_fps = frames_per_second
+        _pacing_config.on_mouse_up_fps = frames_per_second
 
     @staticmethod
-    def get_draw_fps() -> int:
+    def get_draw_fps() -> Optional[int]:
         """
         Gets the draw function's frames per second.
 
         :return int: The frames per second.
+        :return None: When there is no limit (UNLIMITED).
         """
-        return _draw_fps
+        return _pacing_config.draw_fps
 
     @staticmethod
-    def get_update_fps() -> int:
+    def get_update_fps() -> Optional[int]:
         """
         Gets the update function's frames per second.
 
         :return int: The frames per second.
+        :return None: When there is no limit (UNLIMITED).
         """
-        return _update_fps
+        return _pacing_config.update_fps
 
     @staticmethod
-    def get_on_mouse_down_fps() -> int:
+    def get_on_mouse_down_fps() -> Optional[int]:
         """
         Gets the update on_mouse_down's frames per second.
 
         :return int: The frames per second.
+        :return None: When there is no limit (UNLIMITED).
         """
-        return _on_mouse_down_fps
+        return _pacing_config.on_mouse_down_fps
 
     @staticmethod
-    def get_on_mouse_up_fps() -> int:
+    def get_on_mouse_up_fps() -> Optional[int]:
         """
         Gets the update on_mouse_up's frames per second.
 
         :return int: The frames per second.
+        :return None: When there is no limit (UNLIMITED).
         """
-        return _on_mouse_up_fps
+        return _pacing_config.on_mouse_up_fps
 
     @staticmethod
-    def get_on_mouse_move_fps() -> int:
+    def get_on_mouse_move_fps() -> Optional[int]:
         """
         Gets the update on_mouse_move's frames per second.
 
         :return int: The frames per second.
+        :return None: When there is no limit (UNLIMITED).
+        """
+        return _pacing_config.on_mouse_move_fps
+
+    @staticmethod
+    def set_fixed_update(fixed: bool) -> None:
+        """
+        Changes whether the update function runs with a fixed timestep. With a fixed timestep, update runs as many times per frame as needed to keep its frames per second, even when drawing is slower.
+
+        :param fixed: Whether to use a fixed timestep.
+        """
+        _pacing_config.fixed_update = fixed
+
+    @staticmethod
+    def is_update_fixed() -> bool:
+        """
+        Checks if the update function runs with a fixed timestep.
+
+        :return True: When the update function runs with a fixed timestep.
+        :return False: When the update function runs at most once per frame.
+        """
+        return _pacing_config.fixed_update
+
+    @staticmethod
+    def pause_update() -> None:
+        """
+        Pauses the update function. Drawing and the camera keep running.
+        """
+        _pacing_config.update_paused = True
+
+    @staticmethod
+    def resume_update() -> None:
+        """
+        Resumes the update function after Screen.pause_update().
+        """
+        _pacing_config.update_paused = False
+
+    @staticmethod
+    def is_update_paused() -> bool:
+        """
+        Checks if the update function is paused.
+
+        :return True: When the update function is paused.
+        :return False: When the update function is running.
         """
-        return _on_mouse_move_fps
+        return _pacing_config.update_paused
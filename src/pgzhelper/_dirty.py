@@ -0,0 +1,224 @@
+"""Dirty rectangle presentation for pgzhelper. Collects the areas of the screen drawn on during a frame, and shows only those areas on the window instead of the whole screen."""
+
+from __future__ import annotations
+from .utilities import pygame, Callable, Optional, Union, _pgzero_screen
+from pgzero import loaders
+
+_PAINTER_METHODS = ("line", "circle", "filled_circle", "rect", "filled_rect", "text", "textbox")
+"""The drawing functions of pgzero's screen.draw. They do not say where they drew, so they mark the whole screen."""
+
+class DirtyRects:
+    """The areas of the screen drawn on since the last frame was shown. When the merged areas cover more of the screen than coverage_threshold, the whole screen is shown instead, since updating many areas costs more than one full flip."""
+    def __init__(self, coverage_threshold: float = 0.5, merge_gap: int = 8) -> None:
+        """
+        Creates a new DirtyRects that is turned off.
+
+        :param coverage_threshold: How much of the screen (0 to 1) the areas can cover before the whole screen is shown instead. Defaults to 0.5.
+        :param merge_gap: How close (in pixels) two areas must be to be merged into one. Defaults to 8.
+        """
+        self.enabled = False
+        """Whether only the drawn areas are shown. When False, every frame shows the whole screen."""
+
+        self.coverage_threshold = coverage_threshold
+        """How much of the screen (0 to 1) the areas can cover before the whole screen is shown instead."""
+
+        self.merge_gap = merge_gap
+        """How close (in pixels) two areas must be to be merged into one."""
+
+        self.rects = []
+        """The areas drawn on this frame, not merged yet."""
+
+        self.full = True
+        """Whether the whole screen has to be shown this frame, like after Screen.fill() or on the first frame."""
+
+        self.frames_partial = 0
+        """How many frames showed only the drawn areas."""
+
+        self.frames_full = 0
+        """How many frames showed the whole screen."""
+
+        self.frames_skipped = 0
+        """How many frames had nothing drawn, so nothing was shown."""
+
+        self.rects_shown = 0
+        """How many merged areas were shown, over all of the partial frames."""
+
+        self.last_coverage = 0.0
+        """How much of the screen (0 to 1) the merged areas covered last frame."""
+
+        self._surface = None
+
+    def add(self, rect: Optional[pygame.Rect]) -> None:
+        """
+        Marks an area as drawn on. Does nothing when turned off.
+
+        :param rect: The area. None does nothing.
+        """
+        if self.enabled and rect is not None:
+            self.rects.append(pygame.Rect(rect))
+
+    def mark_all(self) -> None:
+        """Marks the whole screen as drawn on, so the whole screen is shown this frame."""
+        self.full = True
+
+    def merge(self, rects: list[pygame.Rect], screen_rect: pygame.Rect) -> list[pygame.Rect]:
+        """
+        Clips areas to the screen, and merges the ones that overlap or are within merge_gap of each other, until none do.
+
+        :param rects: The areas.
+        :param screen_rect: The Rect of the screen.
+
+        :return list[pygame.Rect]: The merged areas.
+        """
+        gap = self.merge_gap
+        merged = []
+        for rect in rects:
+            rect = rect.clip(screen_rect)
+            if not rect.width or not rect.height:
+                continue
+            grown = rect.inflate(gap * 2, gap * 2)
+            index = grown.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                grown = rect.inflate(gap * 2, gap * 2)
+                index = grown.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def present(self, flip: Optional[Callable[[], None]] = None) -> Optional[list[pygame.Rect]]:
+        """
+        Shows this frame on the window: only the merged drawn areas, or the whole screen when it was filled, the window changed, when the areas cover more than coverage_threshold, or when turned off. Then starts a new frame.
+
+        :param flip: The function that shows the whole screen. Defaults to None (pygame.display.flip).
+
+        :return list[pygame.Rect]: The areas shown, when only some were.
+        :return None: When the whole screen was shown.
+        """
+        flip = flip or pygame.display.flip
+        surface = pygame.display.get_surface()
+        rects, full = self.rects, self.full or surface is not self._surface
+        self.rects, self.full, self._surface = [], False, surface
+        merged = None
+        if self.enabled and not full and surface is not None:
+            screen_rect = surface.get_rect()
+            merged = self.merge(rects, screen_rect)
+            coverage = sum(rect.width * rect.height for rect in merged) / (screen_rect.width * screen_rect.height)
+            if coverage > self.coverage_threshold:
+                merged = None
+        if merged is None:
+            self.frames_full += 1
+            self.last_coverage = 1.0
+            flip()
+            return None
+        self.last_coverage = coverage
+        if not merged:
+            self.frames_skipped += 1
+            return merged
+        self.frames_partial += 1
+        self.rects_shown += len(merged)
+        pygame.display.update(merged)
+        return merged
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Gets the presentation counters.
+
+        :return dict[str, float]: The frames that showed only the drawn areas, the whole screen or nothing, the mean number of areas of a partial frame, and how much of the screen (0 to 1) last frame's areas covered.
+        """
+        return {
+            "frames_partial": self.frames_partial,
+            "frames_full": self.frames_full,
+            "frames_skipped": self.frames_skipped,
+            "rects_per_frame": self.rects_shown / self.frames_partial if self.frames_partial else 0.0,
+            "coverage": self.last_coverage,
+        }
+
+_dirty_rects = DirtyRects()
+"""The DirtyRects the Screen functions mark the areas they draw on in."""
+
+_flip = None
+"""pygame.display.flip as it was before install_flip() replaced it. None when it is not replaced."""
+
+_pgzero_methods = {}
+"""pgzero's screen functions as they were before install_flip() replaced them, by (class, name)."""
+
+def _present_flip() -> None:
+    """
+    Shows the frame through _dirty_rects. Replaces pygame.display.flip while pgzhelper_run.go() runs, since pgzero calls it after every draw.
+
+    Not meant for user use.
+    """
+    _dirty_rects.present(_flip)
+
+def _tracked_blit(screen: _pgzero_screen.Screen, image: Union[pygame.Surface, str], pos: object) -> None:
+    """
+    Replaces pgzero's screen.blit() (which Actor.draw() uses) while pgzhelper_run.go() runs, and marks the area it draws on.
+
+    Not meant for user use.
+
+    :param screen: The pgzero screen.
+    :param image: A Surface or the name of an image.
+    :param pos: The top left of the image, or a Rect.
+    """
+    if isinstance(image, str):
+        image = loaders.images.load(image)
+    mark_drawn(screen, screen.surface.blit(image, pos))
+
+def _marks_all(method: Callable) -> Callable:
+    """
+    Wraps one of pgzero's screen functions, so it marks the whole screen when it draws on the window.
+
+    Not meant for user use.
+
+    :param method: The function.
+
+    :return Callable: The wrapped function.
+    """
+    def tracked(self: object, *args: object, **kwargs: object) -> object:
+        result = method(self, *args, **kwargs)
+        if _dirty_rects.enabled and getattr(self, "_screen", self).surface is pygame.display.get_surface():
+            _dirty_rects.mark_all()
+        return result
+    return tracked
+
+def install_flip() -> None:
+    """
+    Replaces pygame.display.flip with one that shows only the drawn areas when dirty rectangles are turned on. pgzero's screen functions are replaced too, so what they draw is shown: screen.blit() (and so Actor.draw()) marks the area it draws on, and screen.fill(), screen.clear() and screen.draw mark the whole screen. Drawing on the Surface with pygame is not seen.
+
+    Not meant for user use.
+    """
+    global _flip
+    if _flip is None:
+        _flip = pygame.display.flip
+        pygame.display.flip = _present_flip
+        _pgzero_methods[(_pgzero_screen.Screen, "blit")] = _pgzero_screen.Screen.blit
+        _pgzero_methods[(_pgzero_screen.Screen, "fill")] = _pgzero_screen.Screen.fill
+        _pgzero_methods.update(((_pgzero_screen.SurfacePainter, name), getattr(_pgzero_screen.SurfacePainter, name)) for name in _PAINTER_METHODS)
+        for (cls, name), method in _pgzero_methods.items():
+            setattr(cls, name, _tracked_blit if name == "blit" else _marks_all(method))
+
+def uninstall_flip() -> None:
+    """
+    Puts pygame.display.flip and pgzero's screen functions back.
+
+    Not meant for user use.
+    """
+    global _flip
+    if _flip is not None:
+        pygame.display.flip = _flip
+        _flip = None
+        for (cls, name), method in _pgzero_methods.items():
+            setattr(cls, name, method)
+        _pgzero_methods.clear()
+
+def mark_drawn(screen: object, rect: Optional[pygame.Rect]) -> None:
+    """
+    Marks an area as drawn on when the screen is the window's Surface (or the pgzero screen of it).
+
+    Not meant for user use.
+
+    :param screen: The pgzero screen or pygame Surface that was drawn on.
+    :param rect: The area.
+    """
+    if _dirty_rects.enabled and getattr(screen, "surface", screen) is pygame.display.get_surface():
+        _dirty_rects.add(rect)
@@ -0,0 +1,225 @@
+"""Event dispatch for pgzhelper. Used by pgzhelper_run.go() to call the user's functions with only the arguments they take."""
+
+from __future__ import annotations
+from collections import deque
+from .utilities import time, inspect, Callable, Optional
+from ._pacing import FrameScheduler
+
+def _count_parameters(func: Callable) -> Optional[int]:
+    """
+    Counts how many positional arguments a function takes.
+
+    Not meant for user use.
+
+    :param func: The function.
+
+    :return int: The number of positional arguments.
+    :return None: When the function takes *args (any number of arguments).
+    """
+    count = 0
+    for parameter in inspect.signature(func).parameters.values():
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            return None
+        if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD):
+            count += 1
+    return count
+
+def _make_trampoline(func: Callable, arity: int) -> Callable:
+    """
+    Makes a function that takes arity arguments and passes func only as many as it takes.
+
+    Not meant for user use.
+
+    :param func: The user's function.
+    :param arity: How many arguments the trampoline is called with.
+
+    :return Callable: The trampoline.
+    """
+    count = _count_parameters(func)
+    if count is None or count >= arity:
+        return func
+    if arity == 1:
+        return lambda a: func()
+    if arity == 2:
+        if count == 0:
+            return lambda a, b: func()
+        return lambda a, b: func(a)
+    return lambda *args: func(*args[:count])
+
+class Handler:
+    """One of the user's functions (draw, update, on_mouse_down, ...), with a trampoline built once for how it is called."""
+    def __init__(self, func: Callable, arity: int) -> None:
+        """
+        Creates a new Handler.
+
+        :param func: The user's function.
+        :param arity: How many arguments the handler is called with. The user's function can take fewer.
+        """
+        self.arity = arity
+        """How many arguments the handler is called with."""
+
+        self.calls = 0
+        """How many times the handler has been called."""
+
+        self.total_time = 0.0
+        """The total time spent in the handler, in seconds."""
+
+        self.rebuilds = 0
+        """How many times the trampoline has been built."""
+
+        self.timed = False
+        """Whether each call is timed into total_time. When False, calls are only counted."""
+
+        self.func = None
+        """The user's function."""
+
+        self._code = None
+        self._trampoline = None
+        self.set(func)
+
+    def set(self, func: Callable) -> None:
+        """
+        Changes the user's function. The trampoline is only rebuilt when the function is a different object, or its code was replaced.
+
+        :param func: The user's function.
+        """
+        if func is self.func and getattr(func, '__code__', None) is self._code:
+            return
+        self.func = func
+        self._build()
+
+    def _build(self) -> None:
+        """
+        Builds the trampoline for the current function.
+
+        Not meant for user use.
+        """
+        self._code = getattr(self.func, '__code__', None)
+        self._trampoline = _make_trampoline(self.func, self.arity)
+        self.rebuilds += 1
+
+    def __call__(self, *args: object) -> object:
+        """
+        Calls the user's function with the arguments it takes.
+
+        :param args: The arguments, arity of them.
+
+        :return object: What the user's function returned.
+        """
+        self.calls += 1
+        if not self.timed:
+            return self._trampoline(*args)
+        start = time.perf_counter()
+        try:
+            return self._trampoline(*args)
+        finally:
+            self.total_time += time.perf_counter() - start
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Gets how often the handler is called and how long it takes.
+
+        :return dict[str, float]: The calls, total time (ms), mean time (ms) and rebuilds.
+        """
+        return {
+            "calls": self.calls,
+            "total_ms": self.total_time * 1000,
+            "mean_ms": self.total_time * 1000 / self.calls if self.calls else 0.0,
+            "rebuilds": self.rebuilds,
+        }
+
+class InputCoalescer:
+    """Holds mouse events from pgzero's event loop and hands them to the user's functions once per frame, at most at their frames per second. Events are handed over in the order they came in; mouse moves that come in one after another are combined into one on_mouse_move."""
+    def __init__(self, path_length: int = 0, clock: Callable[[], float] = time.perf_counter) -> None:
+        """
+        Creates a new InputCoalescer.
+
+        :param path_length: How many of the mouse positions between deliveries to keep. 0 keeps none. Defaults to 0.
+        :param clock: The function used to get the current time, in seconds. Defaults to time.perf_counter.
+        """
+        self.path_length = path_length
+        """How many of the mouse positions between deliveries to keep. 0 keeps none."""
+
+        self.clock = clock
+        """The function used to get the current time, in seconds."""
+
+        self.path = ()
+        """The mouse positions that were coalesced into the last delivered on_mouse_move, oldest first."""
+
+        self.moves_received = 0
+        """How many on_mouse_move events came in from pgzero."""
+
+        self.moves_delivered = 0
+        """How many on_mouse_move calls were made to the user's function."""
+
+        self._events = deque()
+        self._schedulers = {}
+
+    def push_move(self, pos: tuple[int, int]) -> None:
+        """
+        Keeps the latest mouse position. When the last event waiting is also a move, it is replaced, so only the newest position is delivered.
+
+        :param pos: The position of the mouse.
+        """
+        self.moves_received += 1
+        if self._events and self._events[-1][0] == 'on_mouse_move':
+            path = self._events[-1][2]
+            self._events[-1] = ('on_mouse_move', pos, path)
+        else:
+            path = deque(maxlen=self.path_length) if self.path_length else None
+            self._events.append(('on_mouse_move', pos, path))
+        if path is not None:
+            path.append(pos)
+
+    def push_button(self, name: str, pos: tuple[int, int], button: object) -> None:
+        """
+        Queues a mouse button event. Button events are never dropped, only delayed.
+
+        :param name: The name of the function, "on_mouse_down" or "on_mouse_up".
+        :param pos: The position of the mouse.
+        :param button: The button.
+        """
+        self._events.append((name, pos, button))
+
+    def _take(self, name: str, fps: Optional[float]) -> bool:
+        """
+        Checks if a function can be called without going over its frames per second, and if so, counts the call.
+
+        Not meant for user use.
+
+        :param name: The name of the function.
+        :param fps: The function's frames per second. None or 0 means there is no limit.
+
+        :return True: When the function can be called.
+        :return False: When it was called too recently.
+        """
+        scheduler = self._schedulers.get(name)
+        if scheduler is None:
+            scheduler = self._schedulers[name] = FrameScheduler(fps, clock=self.clock)
+        scheduler.fps = fps
+        if not scheduler.is_due():
+            return False
+        scheduler.advance()
+        return True
+
+    def flush(self, handlers: dict[str, Callable], rates: dict[str, Optional[float]]) -> None:
+        """
+        Calls the user's functions with the events that are due, in the order they came in. When an event is not due yet, it and every event after it wait for a later frame.
+
+        :param handlers: The user's functions by name.
+        :param rates: The frames per second for each function by name.
+        """
+        delivered = set()
+        while self._events:
+            name = self._events[0][0]
+            if (rates.get(name) and name in delivered) or not self._take(name, rates.get(name)):
+                break
+            delivered.add(name)
+            name, pos, extra = self._events.popleft()
+            if name == 'on_mouse_move':
+                self.path = tuple(extra) if extra is not None else ()
+                self.moves_delivered += 1
+                if name in handlers:
+                    handlers[name](pos)
+            elif name in handlers:
+                handlers[name](pos, extra)
@@ -0,0 +1,381 @@
+"""Retained drawing for pgzhelper. A DisplayList records draw commands instead of drawing them, so a scene can be drawn again later, built on another thread, or compared with the last frame to find what changed."""
+
+from __future__ import annotations
+from difflib import SequenceMatcher
+from .utilities import threading, pygame, Optional, Union
+from ._text import _text_cache
+from ._glyphs import get_atlas
+from ._gradient import draw_gradient_line, get_gradient_line_bounds
+from pgzero import loaders
+
+_recording = threading.local()
+"""The DisplayList each thread's Screen.draw functions record into, as its "display_list" attribute."""
+
+def _color(color: Union[tuple[int, ...], str]) -> tuple[int, int, int, int]:
+    """
+    Turns a color into an (r, g, b, a) tuple, so the same color always makes the same command.
+
+    Not meant for user use.
+
+    :param color: A color name, hex string or tuple.
+
+    :return tuple[int, int, int, int]: The color.
+    """
+    return tuple(pygame.Color(color))
+
+_TEXT_COLORS = (8, 9, 15, 17, 18)
+"""Where the color, background, ocolor, scolor and gcolor are in the arguments of a text command."""
+
+_DYNAMIC_TEXT_COLORS = (6, 8, 10)
+"""Where the color, ocolor and scolor are in the style of a dynamic_text command."""
+
+def _hashable(value: object) -> object:
+    """
+    Turns the lists in a value into tuples and pygame Colors into (r, g, b, a) tuples, so the value can be compared and hashed. Other values that cannot be hashed are kept as they are; diff() counts the commands holding them as always changed.
+
+    Not meant for user use.
+
+    :param value: The value.
+
+    :return object: The value, with tuples instead of lists and Colors.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(part) for part in value)
+    if isinstance(value, pygame.Color):
+        return tuple(value)
+    return value
+
+def _colors(args: tuple, indexes: tuple[int, ...]) -> tuple:
+    """
+    Turns the colors at some places in a tuple of arguments into (r, g, b, a) tuples, leaving None as it is.
+
+    Not meant for user use.
+
+    :param args: The arguments.
+    :param indexes: Where the colors are.
+
+    :return tuple: The arguments, with the colors turned into tuples.
+    """
+    args = list(args)
+    for index in indexes:
+        if index < len(args) and args[index] is not None:
+            args[index] = _color(args[index])
+    return tuple(args)
+
+def _diff_key(command: tuple) -> object:
+    """
+    Gets what diff() compares a command by: the command itself, or a new object when the command cannot be hashed, so it always counts as changed.
+
+    Not meant for user use.
+
+    :param command: The command.
+
+    :return object: The key.
+    """
+    try:
+        hash(command)
+    except TypeError:
+        return object()
+    return command
+
+def _points_bounds(points: tuple[tuple[float, float], ...], thickness: int) -> pygame.Rect:
+    """
+    Gets the Rect around some points, grown by a line's thickness.
+
+    Not meant for user use.
+
+    :param points: The points.
+    :param thickness: The thickness of the line through them.
+
+    :return pygame.Rect: The Rect.
+    """
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    left, top = int(min(xs)), int(min(ys))
+    rect = pygame.Rect(left, top, int(max(xs)) - left + 1, int(max(ys)) - top + 1)
+    return rect.inflate(2 * (thickness // 2 + 1), 2 * (thickness // 2 + 1))
+
+class DisplayList:
+    """A list of draw commands. Each command is a tuple of its name and its arguments, with colors, points and Rects turned into tuples, so two lists of the same scene are equal. DisplayLists can be recorded on any thread; only replay() touches a Surface."""
+    def __init__(self) -> None:
+        """Creates a new, empty DisplayList."""
+        self.commands = []
+        """The recorded commands, in the order they are drawn."""
+
+        self._bounds = None
+
+    def __len__(self) -> int:
+        """
+        Gets how many commands have been recorded.
+
+        :return int: The number of commands.
+        """
+        return len(self.commands)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Checks if two DisplayLists draw the same thing.
+
+        :param other: The other DisplayList.
+
+        :return True: When they have the same commands.
+        :return False: When they do not.
+        """
+        return isinstance(other, DisplayList) and self.commands == other.commands
+
+    def clear(self) -> None:
+        """Forgets every command."""
+        self.commands = []
+        self._bounds = None
+
+    def _record(self, command: tuple) -> None:
+        """
+        Adds a command.
+
+        Not meant for user use.
+
+        :param command: The command.
+        """
+        self.commands.append(command)
+        self._bounds = None
+
+    def fill(self, color: Union[tuple[int, int, int], str]) -> None:
+        """
+        Records filling the whole Surface with a color.
+
+        :param color: The color.
+        """
+        self._record(("fill", _color(color)))
+
+    def rect(self, rect: pygame.Rect, color: Union[tuple[int, int, int], str], thickness: int = 1) -> pygame.Rect:
+        """
+        Records drawing a rect.
+
+        :param rect: The rect.
+        :param color: The color.
+        :param thickness: The thickness of the outline. 0 fills the rect. Defaults to 1.
+
+        :return pygame.Rect: The area the rect will be drawn in.
+        """
+        rect = pygame.Rect(rect)
+        self._record(("rect", tuple(rect), _color(color), thickness))
+        return rect
+
+    def line(self, start: tuple[float, float], end: tuple[float, float], color: Union[tuple[int, int, int], str], thickness: int = 1) -> pygame.Rect:
+        """
+        Records drawing a line.
+
+        :param start: The start of the line.
+        :param end: The end of the line.
+        :param color: The color.
+        :param thickness: The thickness of the line. Defaults to 1.
+
+        :return pygame.Rect: The area the line will be drawn within.
+        """
+        start, end = tuple(start), tuple(end)
+        self._record(("line", start, end, _color(color), thickness))
+        return _points_bounds((start, end), thickness)
+
+    def polygon(self, points: list[tuple[float, float]], color: Union[tuple[int, int, int], str], thickness: int = 1) -> pygame.Rect:
+        """
+        Records drawing a polygon.
+
+        :param points: The points of the polygon.
+        :param color: The color.
+        :param thickness: The thickness of the outline. 0 fills the polygon. Defaults to 1.
+
+        :return pygame.Rect: The area the polygon will be drawn within.
+        """
+        points = tuple(tuple(point) for point in points)
+        self._record(("polygon", points, _color(color), thickness))
+        return _points_bounds(points, thickness)
+
+    def circle(self, center: tuple[float, float], radius: float, color: Union[tuple[int, int, int], str], thickness: int = 1) -> pygame.Rect:
+        """
+        Records drawing a circle.
+
+        :param center: The center of the circle.
+        :param radius: The radius of the circle.
+        :param color: The color.
+        :param thickness: The thickness of the outline. 0 fills the circle. Defaults to 1.
+
+        :return pygame.Rect: The area the circle will be drawn within.
+        """
+        center = tuple(center)
+        self._record(("circle", center, radius, _color(color), thickness))
+        return _points_bounds(((center[0] - radius, center[1] - radius), (center[0] + radius, center[1] + radius)), 1)
+
+    def gradient_line(self, start: tuple[float, float], end: tuple[float, float], start_color: Union[tuple[int, int, int], str], end_color: Union[tuple[int, int, int], str], thickness: int = 1,
+                      antialias: bool = False) -> pygame.Rect:
+        """
+        Records drawing a gradient line. See Screen.draw.gradient_line().
+
+        :param start: The start of the line.
+        :param end: The end of the line.
+        :param start_color: The color at the start.
+        :param end_color: The color at the end.
+        :param thickness: The thickness of the line. Defaults to 1.
+        :param antialias: Whether to blend the edges of the line. Defaults to False.
+
+        :return pygame.Rect: The area the line will be drawn within.
+        """
+        start, end = tuple(start), tuple(end)
+        self._record(("gradient_line", start, end, _color(start_color), _color(end_color), thickness, antialias))
+        return get_gradient_line_bounds(start, end, thickness, antialias)
+
+    def text(self, pos: tuple[float, float], *args) -> None:
+        """
+        Records drawing text through the text cache.
+
+        :param pos: The anchor point of the text.
+        :param args: The arguments for TextCache.render(): the text, its style, and its horizontal and vertical anchor fractions.
+        """
+        self._record(("text", tuple(pos), _hashable(_colors(args, _TEXT_COLORS))))
+
+    def dynamic_text(self, text: str, pos: tuple[float, float], anchor: tuple[float, float], *style) -> None:
+        """
+        Records drawing text from a glyph atlas. See Screen.draw.dynamic_text().
+
+        :param text: The text.
+        :param pos: The anchor point of the text.
+        :param anchor: The horizontal and vertical anchor fractions.
+        :param style: The arguments for the glyph atlas: fontname, fontsize, sysfontname, antialias, bold, italic, color, owidth, ocolor, shadow and scolor.
+        """
+        self._record(("dynamic_text", text, tuple(pos), tuple(anchor), _hashable(_colors(style, _DYNAMIC_TEXT_COLORS))))
+
+    def blit(self, image: Union[str, pygame.Surface], pos: Union[tuple[float, float], pygame.Rect]) -> None:
+        """
+        Records drawing an image. A Surface is compared by which Surface it is, so drawing on it does not count as a change.
+
+        :param image: The image name, or a Surface.
+        :param pos: The top left position of the image, or a Rect whose top left is used.
+        """
+        if isinstance(pos, pygame.Rect):
+            pos = pos.topleft
+        self._record(("blit", image, tuple(pos)))
+
+    def _command_bounds(self, command: tuple, screen_rect: pygame.Rect) -> pygame.Rect:
+        """
+        Works out the area a command draws in, without drawing it.
+
+        Not meant for user use.
+
+        :param command: The command.
+        :param screen_rect: The Rect of the whole Surface.
+
+        :return pygame.Rect: The area.
+        """
+        name = command[0]
+        if name == "fill":
+            return pygame.Rect(screen_rect)
+        if name == "rect":
+            return pygame.Rect(command[1])
+        if name == "line":
+            return _points_bounds((command[1], command[2]), command[-1])
+        if name == "gradient_line":
+            return get_gradient_line_bounds(command[1], command[2], command[5], command[6])
+        if name == "polygon":
+            return _points_bounds(command[1], command[3])
+        if name == "circle":
+            (x, y), radius = command[1], command[2]
+            return _points_bounds(((x - radius, y - radius), (x + radius, y + radius)), 1)
+        if name == "text":
+            surface, dx, dy = _text_cache.render(*command[2])
+            return pygame.Rect(int(round(command[1][0] + dx)), int(round(command[1][1] + dy)), *surface.get_size())
+        if name == "dynamic_text":
+            text, (x, y), (hanchor, vanchor), style = command[1:]
+            width, height = get_atlas(*style).get_size(text)
+            return pygame.Rect(int(round(x - hanchor * width)), int(round(y - vanchor * height)), width, height)
+        image = command[1]
+        if isinstance(image, str):
+            image = loaders.images.load(image)
+        return pygame.Rect(command[2], image.get_size())
+
+    def get_bounds(self, screen_rect: pygame.Rect) -> list[pygame.Rect]:
+        """
+        Gets the area every command draws in. The areas are worked out once, and again after a command is recorded.
+
+        :param screen_rect: The Rect of the Surface the list is drawn on.
+
+        :return list[pygame.Rect]: The area of each command, in order.
+        """
+        if self._bounds is None or self._bounds[0] != screen_rect:
+            self._bounds = (pygame.Rect(screen_rect), [self._command_bounds(command, screen_rect) for command in self.commands])
+        return self._bounds[1]
+
+    def diff(self, previous: Optional[DisplayList], screen_rect: pygame.Rect) -> list[pygame.Rect]:
+        """
+        Finds the areas where this list draws something different from another, like the last frame's. Commands that were added, removed, changed or moved count, in both lists.
+
+        :param previous: The other DisplayList. None is the same as an empty list.
+        :param screen_rect: The Rect of the Surface the lists are drawn on.
+
+        :return list[pygame.Rect]: The areas that changed, clipped to screen_rect. Empty when both lists draw the same thing.
+        """
+        old = previous.commands if previous is not None else []
+        if old == self.commands:
+            return []
+        old_bounds = previous.get_bounds(screen_rect) if previous is not None else []
+        new_bounds = self.get_bounds(screen_rect)
+        changed = []
+        matcher = SequenceMatcher(None, [_diff_key(command) for command in old], [_diff_key(command) for command in self.commands], autojunk=False)
+        for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+            if tag != "equal":
+                changed.extend(old_bounds[old_start:old_end])
+                changed.extend(new_bounds[new_start:new_end])
+        changed = [rect.clip(screen_rect) for rect in changed]
+        return [rect for rect in changed if rect.width and rect.height]
+
+    def replay(self, surface: pygame.Surface, area: Optional[pygame.Rect] = None) -> None:
+        """
+        Draws every command on a Surface. Must be called on the thread that owns the Surface, like the main thread for the screen.
+
+        :param surface: The Surface to draw on.
+        :param area: Only draw inside this area, and skip the commands that do not touch it. Defaults to None (draw everything).
+        """
+        commands = self.commands
+        if area is not None:
+            area = pygame.Rect(area)
+            commands = [command for command, bounds in zip(commands, self.get_bounds(surface.get_rect())) if bounds.colliderect(area)]
+            clip = surface.get_clip()
+            surface.set_clip(area.clip(clip))
+        try:
+            for command in commands:
+                _REPLAYERS[command[0]](surface, *command[1:])
+        finally:
+            if area is not None:
+                surface.set_clip(clip)
+
+_REPLAYERS = {
+    "fill": lambda surface, color: surface.fill(color),
+    "rect": lambda surface, rect, color, thickness: pygame.draw.rect(surface, color, rect, thickness),
+    "line": lambda surface, start, end, color, thickness: pygame.draw.line(surface, color, start, end, thickness),
+    "polygon": lambda surface, points, color, thickness: pygame.draw.polygon(surface, color, points, thickness),
+    "circle": lambda surface, center, radius, color, thickness: pygame.draw.circle(surface, color, center, radius, thickness),
+    "gradient_line": draw_gradient_line,
+    "text": lambda surface, pos, args: _text_cache.draw(surface, pos, *args),
+    "dynamic_text": lambda surface, text, pos, anchor, style: get_atlas(*style).draw(surface, text, pos, anchor),
+    "blit": lambda surface, image, pos: surface.blit(loaders.images.load(image) if isinstance(image, str) else image, pos),
+}
+"""The function that draws each kind of command on a Surface, by command name."""
+
+def get_recording() -> Optional[DisplayList]:
+    """
+    Gets the DisplayList this thread's Screen.draw functions are recording into.
+
+    Not meant for user use.
+
+    :return DisplayList: When this thread is recording.
+    :return None: When Screen.draw functions draw straight away.
+    """
+    return getattr(_recording, "display_list", None)
+
+def set_recording(display_list: Optional[DisplayList]) -> None:
+    """
+    Makes this thread's Screen.draw functions record into a DisplayList, or draw straight away again.
+
+    Not meant for user use. Use Screen.display_list.begin() and Screen.display_list.end() instead.
+
+    :param display_list: The DisplayList, or None to draw straight away.
+    """
+    _recording.display_list = display_list
@@ -0,0 +1,269 @@
+"""Glyph atlases for pgzhelper's text that changes every frame, like scores, timers and FPS counters. Each glyph is rendered once into an atlas Surface, and text is put together by blitting glyphs out of it."""
+
+from __future__ import annotations
+from collections import OrderedDict
+from .utilities import math, pygame, Optional, Union
+from pgzero import ptext
+
+DEFAULT_CHARSET = "0123456789 .,:;-+*/%()$#!?"
+"""The glyphs a GlyphAtlas renders straight away. Other glyphs are added the first time they are drawn."""
+
+_ATLAS_WIDTH = 512
+"""The width (in pixels) of an atlas Surface. Its height grows as glyphs are added."""
+
+class GlyphAtlas:
+    """Every glyph of one font, size and style, rendered once into a Surface. The outline and drop shadow are rendered into the atlas too, as their own glyphs, and drawn under all of the text, so outlines never cover the letter beside them."""
+    def __init__(self, fontname: Optional[str] = None, fontsize: Optional[int] = None, sysfontname: Optional[str] = None, antialias: bool = True, bold: bool = False, italic: bool = False,
+                 color: Union[tuple[int, int, int], str] = "black", owidth: Optional[float] = None, ocolor: Union[tuple[int, int, int], str, None] = None,
+                 shadow: Optional[tuple[float, float]] = None, scolor: Union[tuple[int, int, int], str, None] = None, charset: str = DEFAULT_CHARSET) -> None:
+        """
+        Creates a new GlyphAtlas. The glyphs are rendered the first time the atlas is drawn.
+
+        :param fontname: The font name. Font names must be in a font directory and in the .ttf format. Defaults to the sysfontname.
+        :param fontsize: The size of the font, in pixels. Defaults to 24.
+        :param sysfontname: The system font name to use if fontname is omitted. Defaults to the system font.
+        :param antialias: Whether to render with antialiasing. Defaults to True.
+        :param bold: Whether the text is bold. Defaults to False.
+        :param italic: Whether the text is italic. Defaults to False.
+        :param color: The color of the text. Defaults to "black".
+        :param owidth: The outline thickness, in the same outline units as Screen.draw.text(). Defaults to None (no outline).
+        :param ocolor: The outline color. Defaults to None ("black").
+        :param shadow: The (x, y) drop shadow offset, in the same shadow units as Screen.draw.text(). Defaults to None (no shadow).
+        :param scolor: The shadow color. Defaults to None ("black").
+        :param charset: The glyphs to render straight away. Defaults to DEFAULT_CHARSET (digits and the punctuation of scores and timers).
+        """
+        self.fontsize = ptext.DEFAULT_FONT_SIZE if fontsize is None else int(round(fontsize))
+        """The size of the font, in pixels."""
+
+        self.font = ptext.getfont(fontname, self.fontsize, sysfontname, bold, italic)
+        """The pygame Font the glyphs are rendered with."""
+
+        self.antialias = antialias
+        """Whether the glyphs are rendered with antialiasing."""
+
+        self.color = pygame.Color(color)
+        """The color of the text."""
+
+        self.outline = 0 if owidth is None else math.ceil(owidth * self.fontsize * ptext.OUTLINE_UNIT)
+        """The outline thickness, in pixels. 0 is no outline."""
+
+        self.ocolor = pygame.Color(ocolor or ptext.DEFAULT_OUTLINE_COLOR)
+        """The outline color."""
+
+        self.shadow = None if shadow is None else tuple(math.ceil(offset * self.fontsize * ptext.SHADOW_UNIT) for offset in shadow)
+        """The (x, y) drop shadow offset, in pixels. None is no shadow."""
+
+        self.scolor = pygame.Color(scolor or ptext.DEFAULT_SHADOW_COLOR)
+        """The shadow color."""
+
+        self.surface = None
+        """The atlas Surface. None until the first glyph is rendered."""
+
+        self.glyphs_rendered = 0
+        """How many glyphs have been rendered into the atlas."""
+
+        self._glyphs = {}
+        self._kerning = {}
+        self._x = 0
+        self._y = 0
+        self._row_height = 0
+        self._charset = charset
+
+        layers = []
+        if self.shadow is not None:
+            layers.append((self.scolor, self.outline, self.shadow[0] - self.outline, self.shadow[1] - self.outline))
+        if self.outline:
+            layers.append((self.ocolor, self.outline, -self.outline, -self.outline))
+        layers.append((self.color, 0, 0, 0))
+        self._layers = layers
+        self._pad_left = max(0, -min(layer[2] for layer in layers))
+        self._pad_top = max(0, -min(layer[3] for layer in layers))
+        self._pad_right = max(layer[2] + 2 * layer[1] for layer in layers)
+        self._pad_bottom = max(layer[3] + 2 * layer[1] for layer in layers)
+
+    def _place(self, glyph: pygame.Surface) -> pygame.Rect:
+        """
+        Copies a rendered glyph into the atlas, growing the atlas when it is full.
+
+        Not meant for user use.
+
+        :param glyph: The rendered glyph.
+
+        :return pygame.Rect: Where the glyph is in the atlas.
+        """
+        width, height = glyph.get_size()
+        if self._x + width > _ATLAS_WIDTH:
+            self._x, self._y, self._row_height = 0, self._y + self._row_height + 1, 0
+        atlas_height = 0 if self.surface is None else self.surface.get_height()
+        if self._y + height > atlas_height:
+            new_height = max(64, atlas_height * 2, self._y + height)
+            surface = pygame.Surface((max(_ATLAS_WIDTH, width), new_height), pygame.SRCALPHA)
+            if self.surface is not None:
+                surface.blit(self.surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.surface = surface
+        rect = pygame.Rect(self._x, self._y, width, height)
+        self.surface.blit(glyph, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        self._x += width + 1
+        self._row_height = max(self._row_height, height)
+        return rect
+
+    def _add_glyph(self, char: str) -> tuple:
+        """
+        Renders a glyph, with its outline and shadow, into the atlas.
+
+        Not meant for user use.
+
+        :param char: The character.
+
+        :return tuple: How far the pen moves after the glyph, then the atlas rect and (x, y) offset of each layer, from the bottom layer up.
+        """
+        advance = self.font.size(char)[0]
+        parts = [advance]
+        for color, spread, dx, dy in self._layers:
+            rendered = self.font.render(char, self.antialias, color)
+            if not rendered.get_flags() & pygame.SRCALPHA:
+                converted = pygame.Surface(rendered.get_size(), pygame.SRCALPHA)
+                converted.blit(rendered, (0, 0))
+                rendered = converted
+            if spread:
+                glyph = pygame.Surface((rendered.get_width() + 2 * spread, rendered.get_height() + 2 * spread), pygame.SRCALPHA)
+                for x, y in ptext._circlepoints(spread):
+                    glyph.blit(rendered, (x + spread, y + spread), special_flags=pygame.BLEND_RGBA_MAX)
+            else:
+                glyph = rendered
+            parts.append((self._place(glyph), dx, dy))
+        self._glyphs[char] = entry = tuple(parts)
+        self.glyphs_rendered += 1
+        return entry
+
+    def _kern(self, left: str, right: str) -> int:
+        """
+        Works out how much closer (negative) or further apart two glyphs are when they are next to each other, from the font's width of the pair and of each glyph.
+
+        Not meant for user use.
+
+        :param left: The first character.
+        :param right: The character after it.
+
+        :return int: The adjustment, in pixels.
+        """
+        pair = left + right
+        kerning = self._kerning.get(pair)
+        if kerning is None:
+            size = self.font.size
+            kerning = self._kerning[pair] = size(pair)[0] - size(left)[0] - size(right)[0]
+        return kerning
+
+    def get_size(self, text: str) -> tuple[int, int]:
+        """
+        Gets the size of some text, with its outline and shadow.
+
+        :param text: The text. Lines are split at "\\n".
+
+        :return tuple[int, int]: The width and height, in pixels.
+        """
+        if self.surface is None:
+            self._add_charset()
+        lines = text.split("\n")
+        width = 0
+        for line in lines:
+            line_width, previous = 0, None
+            for char in line:
+                glyph = self._glyphs.get(char) or self._add_glyph(char)
+                line_width += glyph[0] + (self._kern(previous, char) if previous is not None else 0)
+                previous = char
+            width = max(width, line_width)
+        height = (len(lines) - 1) * self.font.get_linesize() + self.font.get_height()
+        return (self._pad_left + width + self._pad_right, self._pad_top + height + self._pad_bottom)
+
+    def _add_charset(self) -> None:
+        """
+        Renders every glyph of the charset.
+
+        Not meant for user use.
+        """
+        for char in self._charset:
+            if char not in self._glyphs:
+                self._add_glyph(char)
+
+    def draw(self, surface: pygame.Surface, text: str, pos: tuple[float, float], anchor: tuple[float, float] = (0.0, 0.0)) -> pygame.Rect:
+        """
+        Draws text by blitting its glyphs out of the atlas, the shadow first, then the outline, then the text.
+
+        :param surface: The Surface to draw on.
+        :param text: The text. Lines are split at "\\n".
+        :param pos: Where to put the anchor point of the text.
+        :param anchor: The horizontal and vertical anchor fractions: (0, 0) is the top left, (1, 1) the bottom right. Defaults to (0, 0).
+
+        :return pygame.Rect: The area of the Surface that was drawn on.
+        """
+        if self.surface is None:
+            self._add_charset()
+        if anchor[0] or anchor[1]:
+            width, height = self.get_size(text)
+            left = int(round(pos[0] - anchor[0] * width))
+            top = int(round(pos[1] - anchor[1] * height))
+        else:
+            left, top = int(round(pos[0])), int(round(pos[1]))
+        layers = [[] for _ in self._layers]
+        atlas, glyphs, kerning, linesize = self.surface, self._glyphs, self._kerning, self.font.get_linesize()
+        y, right = top + self._pad_top, 0
+        for line in text.split("\n"):
+            x, previous = left + self._pad_left, None
+            for char in line:
+                glyph = glyphs.get(char) or self._add_glyph(char)
+                if previous is not None:
+                    kern = kerning.get(previous + char)
+                    x += self._kern(previous, char) if kern is None else kern
+                for blits, (rect, dx, dy) in zip(layers, glyph[1:]):
+                    blits.append((atlas, (x + dx, y + dy), rect))
+                x += glyph[0]
+                previous = char
+            right = max(right, x)
+            y += linesize
+        if self.surface is not atlas:
+            layers = [[(self.surface, dest, rect) for _, dest, rect in blits] for blits in layers]
+        for blits in layers:
+            surface.blits(blits, doreturn=False)
+        bounds = pygame.Rect(left, top, right + self._pad_right - left, y - linesize + self.font.get_height() + self._pad_bottom - top)
+        return bounds.clip(surface.get_rect())
+
+MAX_ATLASES = 32
+"""How many atlases get_atlas() keeps. The color is part of the style, so text whose color changes every frame makes a new atlas every frame; the least recently used atlases are dropped past this."""
+
+_atlases = OrderedDict()
+"""The GlyphAtlases made by get_atlas(), by style, least recently used first."""
+
+def get_atlas(fontname: Optional[str], fontsize: Optional[int], sysfontname: Optional[str], antialias: bool, bold: bool, italic: bool, color, owidth: Optional[float], ocolor,
+              shadow: Optional[tuple[float, float]], scolor) -> GlyphAtlas:
+    """
+    Gets the GlyphAtlas of a style, making it the first time the style is used. Only the MAX_ATLASES most recently used atlases are kept. See GlyphAtlas for the arguments.
+
+    Not meant for user use. Use Screen.draw.dynamic_text() instead.
+
+    :return GlyphAtlas: The atlas.
+    """
+    key = (fontname, fontsize, sysfontname, antialias, bold, italic, color, owidth, ocolor, shadow, scolor)
+    try:
+        atlas = _atlases.get(key)
+    except TypeError:
+        key = tuple(tuple(part) if isinstance(part, list) else part for part in key)
+        atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(fontname, fontsize, sysfontname, antialias, bold, italic, color, owidth, ocolor, shadow, scolor)
+        while len(_atlases) > MAX_ATLASES:
+            _atlases.popitem(last=False)
+    else:
+        _atlases.move_to_end(key)
+    return atlas
+
+def clear_atlases(fontname: Optional[str] = None) -> None:
+    """
+    Forgets the atlases made by get_atlas(), so their glyphs are rendered again.
+
+    Not meant for user use. Use Screen.text_cache.invalidate() instead.
+
+    :param fontname: Only forget the atlases of this fontname or sysfontname. Defaults to None (forget them all).
+    """
+    for key in [key for key in _atlases if fontname is None or fontname in (key[0], key[2])]:
+        del _atlases[key]
@@ -0,0 +1,137 @@
+"""Gradient lines for pgzhelper's Screen.draw.gradient_line. The colors and the pixels the line covers are worked out in one NumPy pass, and written to the Surface all at once."""
+
+from __future__ import annotations
+from .utilities import math, np, pygame, Union
+
+def _corners(start: tuple[float, float], end: tuple[float, float], thickness: float, antialias: bool) -> list[tuple[float, float]]:
+    """
+    Gets the corners of the strip a gradient line covers: its thickness across the line, and half a pixel past each end.
+
+    Not meant for user use.
+
+    :param start: The start of the line.
+    :param end: The end of the line. Must not be the same as start.
+    :param thickness: The thickness of the line.
+    :param antialias: Whether the line is antialiased, which covers half a pixel more on every side.
+
+    :return list[tuple[float, float]]: The four corners.
+    """
+    (x1, y1), (x2, y2) = start, end
+    length = math.hypot(x2 - x1, y2 - y1)
+    ux, uy = (x2 - x1) / length, (y2 - y1) / length
+    pad = 0.5 if antialias else 0.0
+    across, along = thickness / 2 + pad, 0.5 + pad
+    return [(x + a * ux - s * uy, y + a * uy + s * ux) for x, y, a in ((x1, y1, -along), (x2, y2, along)) for s in (-across, across)]
+
+def get_gradient_line_bounds(start: tuple[float, float], end: tuple[float, float], thickness: float, antialias: bool = False) -> pygame.Rect:
+    """
+    Gets the area a gradient line draws in, without drawing it.
+
+    Not meant for user use.
+
+    :param start: The start of the line.
+    :param end: The end of the line.
+    :param thickness: The thickness of the line.
+    :param antialias: Whether the line is antialiased. Defaults to False.
+
+    :return pygame.Rect: The area. Empty when start and end are the same point.
+    """
+    if tuple(start) == tuple(end) or thickness <= 0:
+        return pygame.Rect(int(start[0]), int(start[1]), 0, 0)
+    corners = _corners(start, end, thickness, antialias)
+    left, top = math.floor(min(x for x, _ in corners)), math.floor(min(y for _, y in corners))
+    right, bottom = math.ceil(max(x for x, _ in corners)), math.ceil(max(y for _, y in corners))
+    return pygame.Rect(left, top, right - left + 1, bottom - top + 1)
+
+def draw_gradient_line(surface: pygame.Surface, start: tuple[float, float], end: tuple[float, float], start_color: Union[tuple[int, int, int], str],
+                       end_color: Union[tuple[int, int, int], str], thickness: float = 1, antialias: bool = False) -> pygame.Rect:
+    """
+    Draws a line whose color fades from start_color to end_color. The line is thickness pixels wide across its direction, centered on the points, and ends half a pixel past each point, so a straight line covers the same pixels as pygame.draw.line().
+
+    Not meant for user use. Use Screen.draw.gradient_line() instead.
+
+    Only the pixels near the line are looked at: for every pixel along the line's longer axis, the few pixels across it that the strip can cover. Without antialiasing a pixel is drawn when its position is inside the strip; with it, the pixel is blended by how much of it the strip covers. The colors come from a ramp with one color per pixel of length.
+
+    :param surface: The Surface to draw on. Only its clip area is drawn on.
+    :param start: The start of the line.
+    :param end: The end of the line.
+    :param start_color: The color at start.
+    :param end_color: The color at end.
+    :param thickness: The thickness of the line. Defaults to 1.
+    :param antialias: Whether to blend the edges of the line. Defaults to False.
+
+    :return pygame.Rect: The area of the Surface that was drawn on.
+    """
+    bounds = get_gradient_line_bounds(start, end, thickness, antialias).clip(surface.get_clip())
+    if not bounds.width or not bounds.height:
+        return bounds
+    (x1, y1), (x2, y2) = start, end
+    dx, dy = x2 - x1, y2 - y1
+    length = math.hypot(dx, dy)
+    ux, uy = dx / length, dy / length
+    half = thickness / 2
+
+    steep = abs(dy) > abs(dx)
+    if steep:
+        majors = np.arange(bounds.top, bounds.bottom)
+        centers = x1 + (majors - y1) * (dx / dy)
+        minor_range = (bounds.left, bounds.right)
+    else:
+        majors = np.arange(bounds.left, bounds.right)
+        centers = y1 + (majors - x1) * (dy / dx)
+        minor_range = (bounds.top, bounds.bottom)
+    reach = math.ceil((half + 1.5) * length / max(abs(dx), abs(dy)))
+    minors = np.floor(centers).astype(np.intp)[:, None] + np.arange(-reach, reach + 1)
+    majors = majors[:, None]
+    xs, ys = (minors, majors) if steep else (majors, minors)
+
+    rx, ry = xs - x1, ys - y1
+    along = rx * ux + ry * uy
+    across = ry * ux - rx * uy
+    inside = (minors >= minor_range[0]) & (minors < minor_range[1])
+    if antialias:
+        coverage = (np.clip(np.minimum(across + 0.5, half) - np.maximum(across - 0.5, -half), 0, 1)
+                    * np.clip(np.minimum(along + 0.5, length + 0.5) - np.maximum(along - 0.5, -0.5), 0, 1))
+        inside &= coverage > 0
+        coverage = coverage[inside][:, None]
+    else:
+        inside &= (across >= -half) & (across < half) & (along >= -0.5) & (along < length + 0.5)
+    xs, ys = np.broadcast_to(xs, inside.shape)[inside], np.broadcast_to(ys, inside.shape)[inside]
+    if not len(xs):
+        return bounds
+
+    steps = max(1, math.ceil(length))
+    first = np.array(pygame.Color(start_color)[:3], dtype=np.float64)
+    last = np.array(pygame.Color(end_color)[:3], dtype=np.float64)
+    ramp = (first + np.linspace(0, 1, steps + 1)[:, None] * (last - first)).astype(np.uint8)
+    index = (np.clip(along[inside], 0, length) * (steps / length)).astype(np.intp)
+
+    if not antialias and surface.get_bytesize() != 3:
+        pixels = pygame.surfarray.pixels2d(surface)
+        pixels[xs, ys] = pygame.surfarray.map_array(surface, ramp[None])[0][index]
+        del pixels
+        return bounds
+
+    colors = ramp[index]
+    if surface.get_bytesize() < 3:
+        strip = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        pixels, alpha = pygame.surfarray.pixels3d(strip), pygame.surfarray.pixels_alpha(strip)
+        xs, ys = xs - bounds.left, ys - bounds.top
+        pixels[xs, ys] = colors
+        alpha[xs, ys] = (coverage[:, 0] * 255 + 0.5).astype(np.uint8)
+        del pixels, alpha
+        surface.blit(strip, bounds)
+        return bounds
+
+    pixels = pygame.surfarray.pixels3d(surface)
+    alpha = pygame.surfarray.pixels_alpha(surface) if surface.get_flags() & pygame.SRCALPHA else None
+    if antialias:
+        pixels[xs, ys] = (pixels[xs, ys] * (1 - coverage) + colors * coverage + 0.5).astype(np.uint8)
+        if alpha is not None:
+            alpha[xs, ys] = (alpha[xs, ys] * (1 - coverage[:, 0]) + 255 * coverage[:, 0] + 0.5).astype(np.uint8)
+    else:
+        pixels[xs, ys] = colors
+        if alpha is not None:
+            alpha[xs, ys] = 255
+    del pixels, alpha
+    return bounds
@@ -0,0 +1,139 @@
+"""Layouts for showing more than one camera at a time in pgzhelper."""
+
+from __future__ import annotations
+from .utilities import math, pygame
+from .errors import CameraError
+from ._dirty import mark_drawn
+
+LAYOUT_MODES = ("grid", "pip")
+"""The ways a CameraLayout can arrange its cameras. "grid" puts them side by side, "pip" (picture-in-picture) shows the first camera full size with the others small in the corner."""
+
+class CameraLayout:
+    """Draws several cameras together onto one Surface, in a grid or as picture-in-picture. A camera is only scaled again when it has a new frame."""
+    def __init__(self, cameras: list, size: tuple[int, int], mode: str = "grid", inset_scale: float = 0.25, margin: int = 10) -> None:
+        """
+        Creates a new CameraLayout.
+
+        :param cameras: The Cameras to show. Set their visible to False so pgzhelper_run.go() does not draw them as well.
+        :param size: The (width, height) of the layout.
+        :param mode: "grid" or "pip". Defaults to "grid".
+        :param inset_scale: In "pip" mode, how wide the small cameras are, as a fraction of the layout's width. Defaults to 0.25.
+        :param margin: In "pip" mode, the gap (in pixels) around the small cameras. Defaults to 10.
+
+        :raise CameraError: When mode is not "grid" or "pip".
+        """
+        self.cameras = list(cameras)
+        """The Cameras that are shown."""
+
+        self.size = size
+        """The (width, height) of the layout."""
+
+        self.inset_scale = inset_scale
+        """In "pip" mode, how wide the small cameras are, as a fraction of the layout's width."""
+
+        self.margin = margin
+        """In "pip" mode, the gap (in pixels) around the small cameras."""
+
+        self.surface = pygame.Surface(size)
+        """The Surface the cameras are drawn onto."""
+
+        self.mode = mode
+        """How the cameras are arranged: "grid" or "pip"."""
+
+        self._cells = []
+        self.set_mode(mode)
+
+    def set_mode(self, mode: str) -> None:
+        """
+        Changes how the cameras are arranged.
+
+        :param mode: "grid" or "pip".
+
+        :raise CameraError: When mode is not "grid" or "pip".
+        """
+        if mode not in LAYOUT_MODES:
+            raise CameraError(f"layout mode must be one of {LAYOUT_MODES}, not {mode!r}")
+        self.mode = mode
+        self._arrange()
+
+    def _fit(self, camera: object, area: pygame.Rect) -> pygame.Rect:
+        """
+        Gets the biggest rect with the camera's shape that fits in the middle of an area.
+
+        Not meant for user use.
+
+        :param camera: The Camera.
+        :param area: The area.
+
+        :return pygame.Rect: The rect.
+        """
+        scale = min(area.width / camera.width, area.height / camera.height)
+        rect = pygame.Rect(0, 0, max(1, int(camera.width * scale)), max(1, int(camera.height * scale)))
+        rect.center = area.center
+        return rect
+
+    def _arrange(self) -> None:
+        """
+        Works out where each camera goes and makes a Surface for each one that has to be scaled.
+
+        Not meant for user use.
+        """
+        width, height = self.size
+        rects = []
+        count = len(self.cameras)
+        if count and self.mode == "grid":
+            columns = math.ceil(math.sqrt(count))
+            rows = math.ceil(count / columns)
+            cell_width, cell_height = width // columns, height // rows
+            for index, camera in enumerate(self.cameras):
+                area = pygame.Rect(index % columns * cell_width, index // columns * cell_height, cell_width, cell_height)
+                rects.append(self._fit(camera, area))
+        elif count:
+            rects.append(self._fit(self.cameras[0], pygame.Rect(0, 0, width, height)))
+            right = width - self.margin
+            for camera in self.cameras[1:]:
+                inset_width = max(1, int(width * self.inset_scale))
+                inset_height = max(1, int(inset_width * camera.height / camera.width))
+                rect = pygame.Rect(right - inset_width, height - self.margin - inset_height, inset_width, inset_height)
+                rects.append(rect)
+                right = rect.left - self.margin
+
+        self._cells = []
+        for camera, rect in zip(self.cameras, rects):
+            scaled = None
+            if rect.size != camera.surface.get_size():
+                scaled = pygame.Surface(rect.size, 0, camera.surface)
+            self._cells.append([camera, rect, scaled, None])
+        self.surface.fill((0, 0, 0))
+
+    def update(self) -> bool:
+        """
+        Draws every camera that has a new frame onto the layout's Surface. In "pip" mode, the small cameras are drawn again (without scaling) when the big one changes.
+
+        :return True: When a camera was drawn.
+        :return False: When no camera had a new frame.
+        """
+        redrawn = False
+        for cell in self._cells:
+            camera, rect, scaled, last_frame = cell
+            fresh = camera.frames_processed != last_frame
+            if fresh:
+                cell[3] = camera.frames_processed
+                if scaled is not None:
+                    pygame.transform.scale(camera.surface, rect.size, scaled)
+            if fresh or (redrawn and self.mode == "pip"):
+                self.surface.blit(camera.surface if scaled is None else scaled, rect)
+                redrawn = True
+        return redrawn
+
+    def draw(self, screen: object, pos: tuple[int, int] = (0, 0)) -> None:
+        """
+        Draws the layout.
+
+        :param screen: The pgzero screen (or a pygame Surface) to draw on.
+        :param pos: The topleft position of the layout. Defaults to (0, 0).
+        """
+        redrawn = self.update()
+        screen.blit(self.surface, pos)
+        if redrawn:
+            mark_drawn(screen, pygame.Rect(pos, self.surface.get_size()))
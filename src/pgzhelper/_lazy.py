@@ -0,0 +1,118 @@
+"""Lazy imports for pgzhelper's heavy optional dependencies (OpenCV, MediaPipe, ...), so they are only loaded when they are used."""
+
+import importlib
+
+class LazyModule:
+    """Stands in for a module and imports it the first time one of its attributes is used."""
+    def __init__(self, name: str) -> None:
+        """
+        Creates a new LazyModule.
+
+        :param name: The full name of the module, like "mediapipe.tasks.python".
+        """
+        self._name = name
+        self._module = None
+
+    def _load(self) -> object:
+        """
+        Imports the module, if it is not imported yet.
+
+        Not meant for user use.
+
+        :return module: The module.
+        """
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def is_loaded(self) -> bool:
+        """
+        Checks if the module has been imported yet.
+
+        :return True: When the module has been imported.
+        :return False: When the module has not been used yet.
+        """
+        return self._module is not None
+
+    def __getattr__(self, attribute: str) -> object:
+        """
+        Gets an attribute of the module, importing the module first if needed. The attribute is then kept on the LazyModule, so later uses are as fast as using the module.
+
+        :param attribute: The name of the attribute.
+
+        :return object: The attribute.
+        """
+        value = getattr(self._load(), attribute)
+        setattr(self, attribute, value)
+        return value
+
+    def __repr__(self) -> str:
+        """
+        Gets a string for the LazyModule.
+
+        :return str: The string.
+        """
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+class LazyAttribute:
+    """Stands in for one attribute of a LazyModule, like mediapipe.Image, so it can be exported without importing the module. Calling it, using its attributes or using it with isinstance() imports the module."""
+    def __init__(self, module: LazyModule, attribute: str) -> None:
+        """
+        Creates a new LazyAttribute.
+
+        :param module: The LazyModule the attribute is in.
+        :param attribute: The name of the attribute.
+        """
+        self._lazy_module = module
+        self._attribute = attribute
+
+    def _load(self) -> object:
+        """
+        Gets the real attribute, importing its module if needed.
+
+        Not meant for user use.
+
+        :return object: The attribute.
+        """
+        return getattr(self._lazy_module, self._attribute)
+
+    def __getattr__(self, attribute: str) -> object:
+        """
+        Gets an attribute of the real attribute, like mediapipe.ImageFormat.SRGB.
+
+        :param attribute: The name of the attribute.
+
+        :return object: The attribute.
+        """
+        return getattr(self._load(), attribute)
+
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        """
+        Calls the real attribute.
+
+        :param args: The arguments.
+        :param kwargs: The keyword arguments.
+
+        :return object: What the real attribute returned.
+        """
+        return self._load()(*args, **kwargs)
+
+    def __instancecheck__(self, instance: object) -> bool:
+        """
+        Lets isinstance() be used with the LazyAttribute when the real attribute is a class.
+
+        :param instance: The object to check.
+
+        :return True: When the object is an instance of the real attribute.
+        :return False: When it is not.
+        """
+        return isinstance(instance, self._load())
+
+    def __repr__(self) -> str:
+        """
+        Gets a string for the LazyAttribute.
+
+        :return str: The string.
+        """
+        return f"<lazy attribute '{self._lazy_module._name}.{self._attribute}'>"
@@ -0,0 +1,56 @@
+"""Change detection for pgzhelper's camera. Lets the camera skip work when the picture has hardly changed."""
+
+from __future__ import annotations
+from .utilities import cv2, np
+
+class MotionDetector:
+    """Compares small copies of camera frames with reference frames kept for each stage of the camera pipeline."""
+    def __init__(self, size: tuple[int, int] = (80, 60)) -> None:
+        """
+        Creates a new MotionDetector.
+
+        :param size: The (width, height) frames are scaled down to before they are compared. Defaults to (80, 60).
+        """
+        self.size = size
+        """The (width, height) frames are scaled down to before they are compared."""
+
+        self._current = np.zeros((size[1], size[0], 3), np.uint8)
+        self._references = {}
+
+    def update(self, frame: np.ndarray) -> None:
+        """
+        Scales down the current frame, ready to be compared.
+
+        :param frame: The frame.
+        """
+        cv2.resize(frame, self.size, dst=self._current, interpolation=cv2.INTER_AREA)
+
+    def difference(self, stage: str) -> float:
+        """
+        Gets how different the current frame is from a stage's reference frame.
+
+        :param stage: The name of the stage.
+
+        :return float: The mean difference of each pixel's color channels, from 0 (the same) to 255.
+        :return float('inf'): When the stage has no reference frame yet.
+        """
+        reference = self._references.get(stage)
+        if reference is None:
+            return float('inf')
+        return cv2.norm(self._current, reference, cv2.NORM_L1) / self._current.size
+
+    def accept(self, stage: str) -> None:
+        """
+        Makes the current frame a stage's reference frame.
+
+        :param stage: The name of the stage.
+        """
+        reference = self._references.get(stage)
+        if reference is None:
+            self._references[stage] = self._current.copy()
+        else:
+            np.copyto(reference, self._current)
+
+    def reset(self) -> None:
+        """Forgets every reference frame, so the next frame is always different."""
+        self._references.clear()
@@ -0,0 +1,199 @@
+"""Frame pacing for pgzhelper. Used by pgzhelper_run.go() to keep the draw and update functions at their frames per second."""
+
+from __future__ import annotations
+from .utilities import time, Callable, Optional
+
+class FrameScheduler:
+    """Keeps a function running at a steady frames per second using absolute deadlines."""
+    def __init__(self, fps: Optional[float], max_lag_frames: int = 3, clock: Callable[[], float] = time.perf_counter, sleep: Callable[[float], None] = time.sleep) -> None:
+        """
+        Creates a new FrameScheduler.
+
+        :param fps: The frames per second to keep. None or 0 means there is no limit.
+        :param max_lag_frames: How many frames the scheduler may fall behind before it stops catching up and starts again from now. Defaults to 3.
+        :param clock: The function used to get the current time, in seconds. Defaults to time.perf_counter.
+        :param sleep: The function used to sleep, in seconds. Defaults to time.sleep.
+        """
+        self.fps = fps
+        """The frames per second to keep. None or 0 means there is no limit."""
+
+        self.max_lag_frames = max_lag_frames
+        """How many frames the scheduler may fall behind before it starts again from now."""
+
+        self.clock = clock
+        """The function used to get the current time, in seconds."""
+
+        self.sleep = sleep
+        """The function used to sleep, in seconds."""
+
+        self.last_sleep = 0.0
+        """How long the last call to wait() actually slept, in seconds."""
+
+        self.frames_dropped = 0
+        """How many frames were skipped because the scheduler fell too far behind."""
+
+        self._deadline = None
+
+    @property
+    def period(self) -> float:
+        """
+        Property to get the time between frames.
+
+        :return float: The time between frames, in seconds. 0 when there is no limit.
+        """
+        if not self.fps:
+            return 0.0
+        return 1 / self.fps
+
+    def reset(self) -> None:
+        """Forgets the current deadline. The next frame will be due straight away."""
+        self._deadline = None
+
+    def is_due(self) -> bool:
+        """
+        Checks if the next frame is due.
+
+        :return True: When the next frame's deadline has passed (or there is no limit).
+        :return False: When the next frame is not due yet.
+        """
+        if self._deadline is None or not self.fps:
+            return True
+        return self.clock() >= self._deadline
+
+    def advance(self) -> None:
+        """
+        Moves the deadline to the next frame.
+
+        When the scheduler is a little late, the next deadline stays on the original schedule so it catches up.
+        When it is more than max_lag_frames late, the missed frames are dropped instead of being rushed.
+        """
+        now = self.clock()
+        period = self.period
+        if self._deadline is None or not period:
+            self._deadline = now + period
+            return
+        self._deadline += period
+        if now - self._deadline > period * self.max_lag_frames:
+            missed = int((now - self._deadline) / period)
+            self.frames_dropped += missed
+            self._deadline = now + period
+
+    def wait(self) -> float:
+        """
+        Sleeps for the time left until the next frame's deadline, then moves the deadline to the following frame.
+
+        :return float: How long it slept, in seconds, as measured by the clock. This can be longer than the time left when the sleep overshoots.
+        """
+        slept = 0.0
+        if self._deadline is not None and self.fps:
+            before = self.clock()
+            remaining = self._deadline - before
+            if remaining > 0:
+                self.sleep(remaining)
+                slept = self.clock() - before
+        self.last_sleep = slept
+        self.advance()
+        return slept
+
+class FixedTimestep:
+    """Runs a function a whole number of times per frame so that, on average, it runs at a fixed frames per second."""
+    def __init__(self, fps: float, max_steps: int = 5, clock: Callable[[], float] = time.perf_counter) -> None:
+        """
+        Creates a new FixedTimestep.
+
+        :param fps: How many steps to run per second.
+        :param max_steps: The most steps that can be run in one frame. Any time past that is thrown away so a slow frame cannot cause a spiral of slower frames. Defaults to 5.
+        :param clock: The function used to get the current time, in seconds. Defaults to time.perf_counter.
+        """
+        self.fps = fps
+        """How many steps to run per second."""
+
+        self.max_steps = max_steps
+        """The most steps that can be run in one frame."""
+
+        self.clock = clock
+        """The function used to get the current time, in seconds."""
+
+        self.alpha = 0.0
+        """How far (0 to 1) the time left over is into the next step. Useful for smoothing what is drawn between steps."""
+
+        self.steps_dropped = 0
+        """How many steps were thrown away because a frame needed more than max_steps."""
+
+        self._accumulator = 0.0
+        self._last = None
+
+    @property
+    def step(self) -> float:
+        """
+        Property to get the length of one step.
+
+        :return float: The length of one step, in seconds.
+        """
+        return 1 / self.fps
+
+    def reset(self) -> None:
+        """Throws away any time that has built up."""
+        self._accumulator = 0.0
+        self._last = None
+
+    def steps(self) -> int:
+        """
+        Adds the time since the last call and works out how many steps are due.
+
+        :return int: The number of steps to run this frame.
+        """
+        now = self.clock()
+        if self._last is None:
+            self._last = now
+            self.alpha = 0.0
+            return 1
+        self._accumulator += now - self._last
+        self._last = now
+        step = self.step
+        count = int(self._accumulator // step)
+        if count > self.max_steps:
+            self.steps_dropped += count - self.max_steps
+            count = self.max_steps
+            self._accumulator = 0.0
+        else:
+            self._accumulator -= count * step
+        self.alpha = self._accumulator / step
+        return count
+
+UNLIMITED = None
+"""Use as the frames per second to remove the limit (the function runs as often as pgzero's loop does)."""
+
+class PacingConfig:
+    """The frames per second for each of the functions injected by pgzhelper_run.go(). The runner reads this every frame, so changes take effect straight away."""
+    def __init__(self, draw_fps: Optional[float] = 60, update_fps: Optional[float] = 60, on_mouse_down_fps: Optional[float] = 60, on_mouse_move_fps: Optional[float] = 60,
+                 on_mouse_up_fps: Optional[float] = 60) -> None:
+        """
+        Creates a new PacingConfig.
+
+        :param draw_fps: The draw function's frames per second. Defaults to 60.
+        :param update_fps: The update function's frames per second. Defaults to 60.
+        :param on_mouse_down_fps: The on_mouse_down function's frames per second. Defaults to 60.
+        :param on_mouse_move_fps: The on_mouse_move function's frames per second. Defaults to 60.
+        :param on_mouse_up_fps: The on_mouse_up function's frames per second. Defaults to 60.
+        """
+        self.draw_fps = draw_fps
+        """The draw function's frames per second. UNLIMITED means no limit."""
+
+        self.update_fps = update_fps
+        """The update function's frames per second. UNLIMITED means no limit."""
+
+        self.on_mouse_down_fps = on_mouse_down_fps
+        """The on_mouse_down function's frames per second. UNLIMITED means no limit."""
+
+        self.on_mouse_move_fps = on_mouse_move_fps
+        """The on_mouse_move function's frames per second. UNLIMITED means no limit."""
+
+        self.on_mouse_up_fps = on_mouse_up_fps
+        """The on_mouse_up function's frames per second. UNLIMITED means no limit."""
+
+        self.fixed_update = False
+        """Whether the update function runs with a fixed timestep."""
+
+        self.update_paused = False
+        """Whether the update function is paused."""
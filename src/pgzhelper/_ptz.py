@@ -0,0 +1,159 @@
+"""Digital pan, tilt and zoom for pgzhelper's camera. Works out which part of the frame is shown, animating between regions, and only works the crop out again when the region changes."""
+
+from __future__ import annotations
+from .utilities import time, np, Callable, Optional
+from .errors import CameraError
+from pgzero.animation import TWEEN_FUNCTIONS
+
+_MIN_SIZE = 8
+"""The smallest width or height (in pixels) of the region that is shown."""
+
+class PanTiltZoom:
+    """The region of a camera's frames that is shown. The region always has the frame's shape, so it is never stretched."""
+    def __init__(self, width: int, height: int, clock: Callable[[], float] = time.perf_counter) -> None:
+        """
+        Creates a new PanTiltZoom that shows the whole frame.
+
+        :param width: The width of the frames.
+        :param height: The height of the frames.
+        :param clock: The function used to get the current time, in seconds. Defaults to time.perf_counter.
+        """
+        self.width = width
+        """The width of the frames."""
+
+        self.height = height
+        """The height of the frames."""
+
+        self.clock = clock
+        """The function used to get the current time, in seconds."""
+
+        self.region = (0.0, 0.0, float(width), float(height))
+        """The (x, y, width, height) of the region shown right now, in frame pixels."""
+
+        self.target = self.region
+        """The (x, y, width, height) the region is moving to. The same as region when it is not moving."""
+
+        self.crop = (0, 0, width, height)
+        """The (left, top, right, bottom) whole pixels that are cut out of each frame."""
+
+        self.full = True
+        """Whether the crop is the whole frame, so nothing has to be cut out or scaled."""
+
+        self.crops_built = 0
+        """How many times the crop was worked out again because the region changed."""
+
+        self._start = self.region
+        self._start_time = 0.0
+        self._duration = 0.0
+        self._tween = TWEEN_FUNCTIONS["linear"]
+        self._built_region = self.region
+        self._buffer = np.empty(height * width * 3, np.uint8)
+
+        self.crop_buffer = self._buffer.reshape(height, width, 3)
+        """A buffer the size of the crop, for converting the crop's colors before it is scaled. It shares memory with a buffer made once for the whole frame, so no array is made when the crop changes."""
+
+    def _fit(self, region: tuple[float, float, float, float]) -> tuple[float, float, float, float]:
+        """
+        Grows a region to the frame's shape around its center, and moves it inside the frame.
+
+        Not meant for user use.
+
+        :param region: The (x, y, width, height).
+
+        :return tuple[float, float, float, float]: The fitted (x, y, width, height).
+        """
+        x, y, width, height = region
+        center_x, center_y = x + width / 2, y + height / 2
+        aspect = self.width / self.height
+        width, height = max(width, height * aspect, _MIN_SIZE), max(height, width / aspect, _MIN_SIZE)
+        scale = min(1.0, self.width / width, self.height / height)
+        width, height = width * scale, height * scale
+        x = min(max(center_x - width / 2, 0.0), self.width - width)
+        y = min(max(center_y - height / 2, 0.0), self.height - height)
+        return (x, y, width, height)
+
+    def set_region(self, region: tuple[float, float, float, float], duration: float = 0, tween: str = "accel_decel") -> None:
+        """
+        Shows a region of the frame. The region is grown to the frame's shape around its center, and kept inside the frame.
+
+        :param region: The (x, y, width, height) of the region, in frame pixels.
+        :param duration: How long (in seconds) to move from the current region. 0 jumps straight there. Defaults to 0.
+        :param tween: How the move speeds up and slows down, like pgzero's animate(): "linear", "accelerate", "decelerate", "accel_decel", "in_elastic", "out_elastic", "in_out_elastic", "bounce_end", "bounce_start" or "bounce_start_end". Defaults to "accel_decel".
+
+        :raise CameraError: When tween is not one of pgzero's tweens.
+        """
+        if tween not in TWEEN_FUNCTIONS:
+            raise CameraError(f"tween must be one of {tuple(TWEEN_FUNCTIONS)}, not {tween!r}")
+        self.target = self._fit(region)
+        self._start = self.region
+        self._start_time = self.clock()
+        self._duration = duration
+        self._tween = TWEEN_FUNCTIONS[tween]
+        if duration <= 0:
+            self.region = self.target
+
+    def set_zoom(self, factor: float, center: Optional[tuple[float, float]] = None, duration: float = 0, tween: str = "accel_decel") -> None:
+        """
+        Zooms into a point of the frame.
+
+        :param factor: How zoomed in it should be. 1 shows the whole frame, 2 shows half the width and height.
+        :param center: The (x, y) point to zoom into, in frame pixels. Defaults to None (the center of the region the zoom is moving to).
+        :param duration: How long (in seconds) to move from the current region. Defaults to 0.
+        :param tween: How the move speeds up and slows down. See set_region(). Defaults to "accel_decel".
+
+        :raise CameraError: When factor is not more than 0, or tween is not one of pgzero's tweens.
+        """
+        if factor <= 0:
+            raise CameraError(f"zoom factor must be more than 0, not {factor}")
+        if center is None:
+            x, y, width, height = self.target
+            center = (x + width / 2, y + height / 2)
+        width, height = self.width / factor, self.height / factor
+        self.set_region((center[0] - width / 2, center[1] - height / 2, width, height), duration, tween)
+
+    def get_zoom(self) -> float:
+        """
+        Gets how zoomed in the region shown right now is.
+
+        :return float: The zoom factor. 1 is the whole frame.
+        """
+        return self.width / self.region[2]
+
+    def is_moving(self) -> bool:
+        """
+        Checks if the region is moving to a new one.
+
+        :return True: When it is moving.
+        :return False: When it has reached its target.
+        """
+        return self.region != self.target
+
+    def update(self) -> bool:
+        """
+        Moves the region along its animation, and works out the crop again when the region changed. Tweens that overshoot (like "in_elastic") are kept inside the frame.
+
+        :return True: When the crop changed.
+        :return False: When it is the same as last time.
+        """
+        if self.region != self.target:
+            progress = (self.clock() - self._start_time) / self._duration if self._duration > 0 else 1.0
+            if progress >= 1:
+                self.region = self.target
+            else:
+                amount = self._tween(progress)
+                self.region = tuple(start + (end - start) * amount for start, end in zip(self._start, self.target))
+        if self.region == self._built_region:
+            return False
+        self._built_region = self.region
+        x, y, width, height = self.region
+        left = min(max(int(round(x)), 0), self.width - 1)
+        top = min(max(int(round(y)), 0), self.height - 1)
+        crop = (left, top, min(self.width, left + max(1, int(round(width)))), min(self.height, top + max(1, int(round(height)))))
+        if crop == self.crop:
+            return False
+        self.crop = crop
+        self.full = crop == (0, 0, self.width, self.height)
+        left, top, right, bottom = crop
+        self.crop_buffer = self._buffer[:(bottom - top) * (right - left) * 3].reshape(bottom - top, right - left, 3)
+        self.crops_built += 1
+        return True
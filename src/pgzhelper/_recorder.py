@@ -0,0 +1,347 @@
+"""Recording for pgzhelper. Writes the screen or a camera to a video file or a folder of PNG images on a background thread, so recording does not slow the game down."""
+
+from __future__ import annotations
+from .utilities import os, sys, time, threading, pygame, cv2, np, Optional
+from .errors import RecordingError
+
+RECORDING_POLICIES = ("drop", "block")
+"""What a Recorder does with a frame when its queue is full. "drop" skips the frame, "block" waits for the encoder to catch up."""
+
+_CONVERSIONS = {
+    "BGR": None,
+    "RGB": "COLOR_RGB2BGR",
+    "BGRA": "COLOR_BGRA2BGR",
+    "RGBA": "COLOR_RGBA2BGR",
+}
+"""The cv2 color conversion that turns each pixel order into the BGR that cv2 writes. Named, because cv2 is only imported when it is first used."""
+
+def _surface_order(surface: pygame.Surface) -> Optional[str]:
+    """
+    Works out the order of the bytes of each pixel in a Surface's memory.
+
+    Not meant for user use.
+
+    :param surface: The Surface.
+
+    :return str: "RGB", "BGR", "RGBA" or "BGRA".
+    :return None: When the Surface's pixels cannot be copied straight from its memory.
+    """
+    if sys.byteorder != "little":
+        return None
+    red, green, blue = surface.get_masks()[:3]
+    if green != 0xFF00:
+        return None
+    bytesize = surface.get_bytesize()
+    if bytesize == 4:
+        return {(0xFF0000, 0xFF): "BGRA", (0xFF, 0xFF0000): "RGBA"}.get((red, blue))
+    if bytesize == 3:
+        return {(0xFF0000, 0xFF): "BGR", (0xFF, 0xFF0000): "RGB"}.get((red, blue))
+    return None
+
+class Recorder:
+    """Hands frames to a background thread through a bounded queue. The thread writes them with a cv2.VideoWriter, or as a numbered PNG per frame."""
+    def __init__(self, path: str, fps: float = 30, queue_size: int = 8, policy: str = "drop", fourcc: str = "mp4v") -> None:
+        """
+        Creates a new Recorder and starts its thread.
+
+        :param path: The video file to write (like "game.mp4"), or a folder to write PNG images into (a path with no extension, or ending in a slash).
+        :param fps: The frames per second of the video. Defaults to 30.
+        :param queue_size: How many frames can wait for the encoder. Defaults to 8.
+        :param policy: "drop" to skip frames when the queue is full, so the game never waits, or "block" to wait, so every frame is kept. Defaults to "drop".
+        :param fourcc: The four letter video codec, like "mp4v" or "MJPG". Not used for PNG images. Defaults to "mp4v".
+
+        :raise RecordingError: When policy is not "drop" or "block", or fourcc is not four letters.
+        """
+        if policy not in RECORDING_POLICIES:
+            raise RecordingError(f"policy must be one of {RECORDING_POLICIES}, not {policy!r}")
+        if len(fourcc) != 4:
+            raise RecordingError(f"fourcc must be four letters, like \"mp4v\", not {fourcc!r}")
+
+        self.path = path
+        """The video file or PNG folder being written."""
+
+        self.fps = fps
+        """The frames per second of the video."""
+
+        self.queue_size = queue_size
+        """How many frames can wait for the encoder."""
+
+        self.policy = policy
+        """What happens when the queue is full: "drop" or "block"."""
+
+        self.fourcc = fourcc
+        """The four letter video codec."""
+
+        self.images = path.endswith(("/", os.sep)) or not os.path.splitext(path)[1]
+        """Whether frames are written as PNG images instead of a video."""
+
+        self.frames_submitted = 0
+        """How many frames were given to the recorder."""
+
+        self.frames_written = 0
+        """How many frames the encoder has written."""
+
+        self.frames_dropped = 0
+        """How many frames were skipped because the queue was full."""
+
+        self.blocked_time = 0.0
+        """The total time (in seconds) spent waiting for the encoder, with the "block" policy."""
+
+        self.submit_time = 0.0
+        """The total time (in seconds) spent copying frames for the encoder."""
+
+        self.error = None
+        """The RecordingError that stopped the encoder, like a file that could not be opened. None while it is writing."""
+
+        self._error_raised = False
+
+        self._queue = []
+        self._free = []
+        self._writer = None
+        self._converted = None
+        self._condition = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="pgzhelper-recorder", daemon=True)
+        self._thread.start()
+
+    def _take_buffer(self, shape: tuple[int, ...]) -> Optional[np.ndarray]:
+        """
+        Gets a free buffer to copy a frame into, waiting or giving up when the queue is full. Must be called with the condition held.
+
+        Not meant for user use.
+
+        :param shape: The shape of the buffer.
+
+        :return np.ndarray: The buffer.
+        :return None: When the frame has to be dropped, or the recorder stopped while waiting.
+        """
+        if len(self._queue) >= self.queue_size:
+            if self.policy == "drop":
+                self.frames_dropped += 1
+                return None
+            start = time.perf_counter()
+            while self._running and len(self._queue) >= self.queue_size:
+                self._condition.wait()
+            self.blocked_time += time.perf_counter() - start
+            if not self._running:
+                return None
+        for index, buffer in enumerate(self._free):
+            if buffer.shape == shape:
+                return self._free.pop(index)
+        return np.empty(shape, np.uint8)
+
+    def submit(self, frame: np.ndarray, order: str = "BGR") -> bool:
+        """
+        Copies a frame and queues it for the encoder.
+
+        :param frame: The frame, shape (height, width, 3 or 4).
+        :param order: The order of each pixel's colors: "BGR", "RGB", "BGRA" or "RGBA". Defaults to "BGR".
+
+        :return True: When the frame was queued.
+        :return False: When it was dropped, or the recorder is stopped.
+
+        :raise RecordingError: When the encoder failed. It is only raised once, by submit(), submit_surface() or stop().
+        """
+        start = time.perf_counter()
+        with self._condition:
+            if not self._running:
+                self._raise_error()
+                return False
+            self.frames_submitted += 1
+            buffer = self._take_buffer(frame.shape)
+            if buffer is None:
+                self._raise_error()
+                return False
+        np.copyto(buffer, frame)
+        with self._condition:
+            self._queue.append((buffer, order, buffer))
+            self._condition.notify_all()
+        self.submit_time += time.perf_counter() - start
+        return True
+
+    def submit_surface(self, surface: pygame.Surface) -> bool:
+        """
+        Copies a Surface's pixels and queues them for the encoder. 24 and 32 bit Surfaces are copied straight from their memory; the colors are put in order on the encoder's thread.
+
+        :param surface: The Surface, like screen.surface.
+
+        :return True: When the frame was queued.
+        :return False: When it was dropped, or the recorder is stopped.
+
+        :raise RecordingError: When the encoder failed. It is only raised once, by submit(), submit_surface() or stop().
+        """
+        order = _surface_order(surface)
+        if order is None:
+            return self.submit(pygame.surfarray.pixels3d(surface).swapaxes(0, 1), "RGB")
+        start = time.perf_counter()
+        width, height = surface.get_size()
+        pitch = surface.get_pitch()
+        with self._condition:
+            if not self._running:
+                self._raise_error()
+                return False
+            self.frames_submitted += 1
+            buffer = self._take_buffer((height, pitch))
+            if buffer is None:
+                self._raise_error()
+                return False
+        np.copyto(buffer, np.frombuffer(surface.get_buffer(), np.uint8).reshape(height, pitch))
+        frame = buffer[:, :width * len(order)].reshape(height, width, len(order))
+        with self._condition:
+            self._queue.append((frame, order, buffer))
+            self._condition.notify_all()
+        self.submit_time += time.perf_counter() - start
+        return True
+
+    def _write(self, frame: np.ndarray, order: str) -> None:
+        """
+        Writes one frame. Runs on the background thread.
+
+        Not meant for user use.
+
+        :param frame: The frame.
+        :param order: The order of each pixel's colors.
+
+        :raise RecordingError: When the video file cannot be opened, or an image cannot be written.
+        """
+        conversion = _CONVERSIONS[order]
+        if conversion is not None:
+            if self._converted is None or self._converted.shape[:2] != frame.shape[:2]:
+                self._converted = np.empty((frame.shape[0], frame.shape[1], 3), np.uint8)
+            frame = cv2.cvtColor(frame, getattr(cv2, conversion), dst=self._converted)
+        if self.images:
+            os.makedirs(self.path, exist_ok=True)
+            image_path = os.path.join(self.path, f"frame_{self.frames_written:06d}.png")
+            if not cv2.imwrite(image_path, frame):
+                raise RecordingError(f"could not write {image_path!r}")
+        else:
+            if self._writer is None:
+                height, width = frame.shape[:2]
+                self._writer = cv2.VideoWriter(self.path, cv2.VideoWriter_fourcc(*self.fourcc), self.fps, (width, height))
+                if not self._writer.isOpened():
+                    raise RecordingError(f"could not open {self.path!r} for writing with the {self.fourcc!r} codec")
+            self._writer.write(frame)
+        self.frames_written += 1
+
+    def _run(self) -> None:
+        """
+        Writes queued frames until stop() is called and the queue is empty. Runs on the background thread. When a frame cannot be written, the error is kept in error, the queued frames are thrown away and the recorder stops, waking up any submit() that is waiting.
+
+        Not meant for user use.
+        """
+        try:
+            while True:
+                with self._condition:
+                    while self._running and not self._queue:
+                        self._condition.wait()
+                    if not self._queue:
+                        break
+                    frame, order, buffer = self._queue.pop(0)
+                self._write(frame, order)
+                with self._condition:
+                    self._free.append(buffer)
+                    self._condition.notify_all()
+        except Exception as error:
+            if not isinstance(error, RecordingError):
+                error = RecordingError(f"could not write to {self.path!r}: {error}")
+            with self._condition:
+                self.error = error
+                self._running = False
+                self._free.extend(entry[2] for entry in self._queue)
+                self._queue.clear()
+                self._condition.notify_all()
+        finally:
+            if self._writer is not None:
+                self._writer.release()
+                self._writer = None
+
+    def _raise_error(self) -> None:
+        """
+        Raises the encoder's error, the first time it is asked to.
+
+        Not meant for user use.
+
+        :raise RecordingError: When the encoder failed and the error has not been raised yet.
+        """
+        if self.error is not None and not self._error_raised:
+            self._error_raised = True
+            raise self.error
+
+    def stop(self) -> None:
+        """
+        Stops taking frames, waits for the queued ones to be written, and closes the file.
+
+        :raise RecordingError: When the encoder failed and submit() has not raised the error yet.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join()
+        self._raise_error()
+
+    def is_recording(self) -> bool:
+        """
+        Checks if the recorder is taking frames.
+
+        :return True: When it is taking frames.
+        :return False: When it has been stopped.
+        """
+        return self._running
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Gets the recording counters.
+
+        :return dict[str, float]: The frames submitted, written and dropped, the frames waiting in the queue, the total time (ms) spent waiting for the encoder, and the mean time (ms) spent copying each frame.
+        """
+        queued = self.frames_submitted - self.frames_dropped
+        return {
+            "frames_submitted": self.frames_submitted,
+            "frames_written": self.frames_written,
+            "frames_dropped": self.frames_dropped,
+            "frames_queued": len(self._queue),
+            "blocked_ms": self.blocked_time * 1000,
+            "submit_ms": self.submit_time * 1000 / queued if queued else 0.0,
+        }
+
+_screen_recorder = None
+"""The Recorder that pgzhelper_run.go() gives the screen to at the end of every frame. None when the screen is not being recorded."""
+
+def start_screen_recording(path: str, fps: float = 30, queue_size: int = 8, policy: str = "drop", fourcc: str = "mp4v") -> Recorder:
+    """
+    Starts recording the screen, stopping any recording that was already running. See Recorder for the parameters.
+
+    Not meant for user use. Use Screen.recording.start() instead.
+
+    :return Recorder: The new Recorder.
+
+    :raise RecordingError: When policy is not "drop" or "block", or fourcc is not four letters.
+    """
+    global _screen_recorder
+    stop_screen_recording()
+    _screen_recorder = Recorder(path, fps, queue_size, policy, fourcc)
+    return _screen_recorder
+
+def stop_screen_recording() -> None:
+    """
+    Stops recording the screen, waiting for the queued frames to be written. Does nothing when the screen is not being recorded.
+
+    Not meant for user use. Use Screen.recording.stop() instead.
+
+    :raise RecordingError: When the recording could not be written, and the error has not been raised yet.
+    """
+    global _screen_recorder
+    recorder, _screen_recorder = _screen_recorder, None
+    if recorder is not None:
+        recorder.stop()
+
+def get_screen_recorder() -> Optional[Recorder]:
+    """
+    Gets the Recorder the screen is being recorded with.
+
+    Not meant for user use.
+
+    :return Recorder: When the screen is being recorded.
+    :return None: When it is not.
+    """
+    return _screen_recorder
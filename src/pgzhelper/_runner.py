@@ -1,114 +1,201 @@
 """Main runner for pgzhelper. Use pgzhelper.pgzhelper_run.go() instead of pgzhelper._runner.go()."""
 
 from ._core import *
-from ._core import _screen, _update_fps, _draw_fps, _init, _camera, _on_mouse_down_fps, _on_mouse_move_fps, _on_mouse_up_fps
+from ._core import _init, _camera, _recorder, _pacing_config, _input_coalescer, _frame_profiler
+from ._pacing import FrameScheduler, FixedTimestep
+from ._dispatch import Handler
+from ._dirty import _dirty_rects, install_flip, uninstall_flip
 
-def go() -> None:
-    """Runs the pgzero script."""
-    global _draw_fps, _screen, _update_fps
+_HANDLER_ARITIES = {
+    'draw': 0,
+    'update': 1,
+    'on_mouse_down': 2,
+    'on_mouse_move': 1,
+    'on_mouse_up': 2,
+    'on_quit': 0,
+}
+"""How many arguments each of the user's functions is called with. The user's function can take fewer."""
+
+_handlers = {}
+"""The user's functions, as Handlers, by name. Filled in by go()."""
+
+def get_stats() -> dict[str, dict[str, float]]:
+    """
+    Gets how often each of the user's functions is called and how long it takes.
+
+    :return dict[str, dict[str, float]]: For each function name, the calls, total time (ms), mean time (ms) and how many times its trampoline was built. The times are only kept after Screen.stats.time_handlers().
+    """
+    return {name: handler.get_stats() for name, handler in _handlers.items()}
+
+def go(fixed_update: Optional[bool] = None) -> None:
+    """
+    Runs the pgzero script.
+
+    :param fixed_update: Whether to run the update function with a fixed timestep. When True, update runs as many times per frame as needed to keep its frames per second, even when drawing is slower. Can be changed later with Screen.set_fixed_update(). Defaults to None (keep the current setting).
+    """
+    if fixed_update is not None:
+        _pacing_config.fixed_update = fixed_update
     caller_frame = sys._getframe(1)
     caller_globals = caller_frame.f_globals
 
     if '__main__' in caller_globals['__name__']:
+        _install(caller_globals)
+
+        import pgzrun
+        install_flip()
+        try:
+            pgzrun.go()
+        finally:
+            uninstall_flip()
+
+def _install(caller_globals: dict[str, object], functions: Optional[dict[str, Callable]] = None, clock: Callable[[], float] = time.perf_counter, sleep: Callable[[float], None] = time.sleep) -> None:
+    """
+    Injects the temporary draw, update, on_mouse_down, on_mouse_move, on_mouse_up and on_quit functions into the user's globals. Used by go(), and by the benchmarks to run frames without pgzero's loop.
+
+    Not meant for user use.
+
+    :param caller_globals: The globals of the user's file.
+    :param functions: The user's functions by name. Defaults to None (every function defined in the user's file).
+    :param clock: The function used to get the current time, in seconds. Defaults to time.perf_counter.
+    :param sleep: The function used to sleep, in seconds. Defaults to time.sleep.
+    """
+    if functions is None:
         functions = {}
         for name, obj in caller_globals.items():
             if inspect.isfunction(obj) and obj.__module__ == caller_globals['__name__']:
                 functions[name] = obj
 
-        def tdraw() -> None:
-            """The temporary draw function to be injected into the user's file."""
-            _init(screen)
-            if 'draw' in functions:
-                functions['draw']()
-            if _camera.is_camera_loaded():
-                _camera.camera_draw_func(_screen)
-            if _draw_fps:
-                time.sleep(1 / _draw_fps)
-
-        def ton_mouse_down(pos: tuple[int, int], button: PGZeroMouse) -> None:
-            """
-            The temporary on_mouse_down function to be injected into the user's file.
-
-            :param pos: The position of the click.
-            :param button: The button pressed.
-            """
-            if 'on_mouse_down' in functions:
-                func = functions['on_mouse_down']
-                sig = inspect.signature(func)
-                para_len = len(sig.parameters)
-                if para_len == 0:
-                    functions['on_mouse_down']()
-                elif para_len == 1:
-                    functions['on_mouse_down'](pos)
-                else:
-                    functions['on_mouse_down'](pos, button)
-            if _on_mouse_down_fps:
-                time.sleep(1 / _on_mouse_down_fps)
-
-        def ton_mouse_move(pos: tuple[int, int]) -> None:
-            """
-            The temporary on_mouse_move function to be injected into the user's file.
-
-            :param pos: The currentb position of the mouse.
-            """
-            if 'on_mouse_move' in functions:
-                func = functions['on_mouse_move']
-                sig = inspect.signature(func)
-                para_len = len(sig.parameters)
-                if para_len == 0:
-                    functions['on_mouse_move']()
-                else:
-                    functions['on_mouse_move'](pos)
-            if _on_mouse_move_fps:
-                time.sleep(1 / _on_mouse_move_fps)
-
-        def ton_mouse_up(pos: tuple[int, int], button: PGZeroMouse):
-            """
-            The temporary on_mouse_up function to be injected into the user's file.
-
-            :param pos: The position of the release.
-            :param button: The button released.
-            """
-            if 'on_mouse_up' in functions:
-                func = functions['on_mouse_up']
-                sig = inspect.signature(func)
-                para_len = len(sig.parameters)
-                if para_len == 0:
-                    functions['on_mouse_up']()
-                elif para_len == 1:
-                    functions['on_mouse_up'](pos)
-                else:
-                    functions['on_mouse_up'](pos, button)
-            if _on_mouse_up_fps:
-                time.sleep(1 / _on_mouse_up_fps)
-
-        def tupdate() -> None:
-            """The temporary update function to be injected into the user's file."""
-            if 'update' in functions:
-                functions['update']()
-            if _update_fps:
-                time.sleep(1 / _update_fps)
-            if _camera.is_camera_loaded():
-                _camera.camera_update_func()
-            if _update_fps:
-                time.sleep(1 / _update_fps)
-        
-        def ton_quit() -> None:
-            """The temporary on_quit function to be injected into the user's file."""
-            if 'on_quit' in functions:
-                functions['on_quit']()
-            if _camera.is_camera_loaded():
-                _camera.camera_on_quit_func()
-
-        caller_globals['draw'] = tdraw
-        caller_globals['on_mouse_down'] = ton_mouse_down
-        caller_globals["on_mouse_move"] = ton_mouse_move
-        caller_globals["on_mouse_up"] = ton_mouse_up
-        caller_globals['on_mouse_down'] = ton_mouse_down
-        caller_globals["on_mouse_move"] = ton_mouse_move
-        caller_globals["on_mouse_up"] = ton_mouse_up
-        caller_globals['update'] = tupdate
-        caller_globals['on_quit'] = ton_quit
+    _frame_profiler.clock = clock
+    _input_coalescer.clock = clock
+    _handlers.clear()
+    for name, arity in _HANDLER_ARITIES.items():
+        if name in functions:
+            _handlers[name] = Handler(functions[name], arity)
 
-        import pgzrun
-        pgzrun.go()
+    draw_scheduler = FrameScheduler(_pacing_config.draw_fps, clock=clock, sleep=sleep)
+    update_scheduler = FrameScheduler(_pacing_config.update_fps, clock=clock, sleep=sleep)
+    update_timestep = FixedTimestep(_pacing_config.update_fps or 60, clock=clock)
+    last_update = None
+
+    def refresh_handlers() -> None:
+        """Picks up functions the user has assigned to draw, update, ... since the last frame, and functions whose code was replaced. Runs once per frame, so calls to the handlers do not have to check."""
+        for name, arity in _HANDLER_ARITIES.items():
+            func = caller_globals.get(name)
+            handler = _handlers.get(name)
+            if func is injected[name] or not callable(func):
+                if handler is None:
+                    continue
+                func = handler.func
+            if handler is None:
+                handler = _handlers[name] = Handler(func, arity)
+            handler.set(func)
+            handler.timed = _frame_profiler.time_handlers
+
+    def tdraw() -> None:
+        """The temporary draw function to be injected into the user's file."""
+        screen = caller_globals['screen']
+        refresh_handlers()
+        _init(screen)
+        start = clock()
+        if 'draw' in _handlers:
+            _handlers['draw']()
+        after_draw = clock()
+        _frame_profiler.add('draw', after_draw - start)
+        cameras = _camera.get_cameras()
+        if cameras:
+            for camera in cameras:
+                if camera.visible:
+                    camera.draw(screen)
+            _frame_profiler.add('camera_draw', clock() - after_draw)
+        if _frame_profiler.overlay:
+            _dirty_rects.add(_frame_profiler.draw_overlay(screen.surface))
+        recorder = _recorder.get_screen_recorder()
+        if recorder is not None:
+            before_record = clock()
+            recorder.submit_surface(screen.surface)
+            _frame_profiler.add('record', clock() - before_record)
+        draw_scheduler.fps = _pacing_config.draw_fps
+        _frame_profiler.add('sleep', draw_scheduler.wait())
+        _frame_profiler.end_frame()
+
+    def ton_mouse_down(pos: tuple[int, int], button: PGZeroMouse) -> None:
+        """
+        The temporary on_mouse_down function to be injected into the user's file.
+
+        :param pos: The position of the click.
+        :param button: The button pressed.
+        """
+        _input_coalescer.push_button('on_mouse_down', pos, button)
+
+    def ton_mouse_move(pos: tuple[int, int]) -> None:
+        """
+        The temporary on_mouse_move function to be injected into the user's file. Only keeps the position; the user's on_mouse_move is called once per frame with the newest one.
+
+        :param pos: The currentb position of the mouse.
+        """
+        _input_coalescer.push_move(pos)
+
+    def ton_mouse_up(pos: tuple[int, int], button: PGZeroMouse):
+        """
+        The temporary on_mouse_up function to be injected into the user's file.
+
+        :param pos: The position of the release.
+        :param button: The button released.
+        """
+        _input_coalescer.push_button('on_mouse_up', pos, button)
+
+    def tupdate() -> None:
+        """The temporary update function to be injected into the user's file."""
+        nonlocal last_update
+        start = clock()
+        _input_coalescer.flush(_handlers, {
+            'on_mouse_down': _pacing_config.on_mouse_down_fps,
+            'on_mouse_move': _pacing_config.on_mouse_move_fps,
+            'on_mouse_up': _pacing_config.on_mouse_up_fps,
+        })
+        now = clock()
+        _frame_profiler.add('events', now - start)
+        if _pacing_config.fixed_update and _pacing_config.update_fps:
+            update_timestep.fps = _pacing_config.update_fps
+            steps = update_timestep.steps()
+            dt = update_timestep.step
+        else:
+            update_scheduler.fps = _pacing_config.update_fps
+            if update_scheduler.is_due():
+                update_scheduler.advance()
+                steps = 1
+            else:
+                steps = 0
+            dt = now - last_update if last_update is not None else 0.0
+        if steps:
+            last_update = now
+        if _pacing_config.update_paused:
+            update_timestep.reset()
+        elif 'update' in _handlers:
+            for _ in range(steps):
+                _handlers['update'](dt)
+        after_update = clock()
+        _frame_profiler.add('update', after_update - now)
+        cameras = _camera.get_cameras()
+        if steps and cameras:
+            for camera in cameras:
+                camera.update()
+            _frame_profiler.add('camera_update', clock() - after_update)
+
+    def ton_quit() -> None:
+        """The temporary on_quit function to be injected into the user's file."""
+        if 'on_quit' in _handlers:
+            _handlers['on_quit']()
+        if _camera.get_cameras():
+            _camera.camera_on_quit_func()
+        _recorder.stop_screen_recording()
+
+    injected = {
+        'draw': tdraw,
+        'update': tupdate,
+        'on_mouse_down': ton_mouse_down,
+        'on_mouse_move': ton_mouse_move,
+        'on_mouse_up': ton_mouse_up,
+        'on_quit': ton_quit,
+    }
+    caller_globals.update(injected)
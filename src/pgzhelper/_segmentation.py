@@ -0,0 +1,386 @@
+"""Background segmentation for pgzhelper's camera. Has the backends that find the person in a frame (MediaPipe, OpenCV background subtraction and chroma key), and can run them on a background thread so the game loop does not wait for them."""
+
+from __future__ import annotations
+from .utilities import os, time, threading, cv2, np, mediapipe, python, vision, Callable, Optional, Union
+from .errors import CameraError
+
+_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "image_segmenter.tflite")
+"""The path of the segmentation model bundled with pgzhelper."""
+
+BACKENDS = ("mediapipe", "mog2", "knn", "chroma")
+"""The names of the segmentation backends that remove_background() can make by name."""
+
+class SegmentationBackend:
+    """Finds the person in a frame. Subclasses only say how; this class times every frame and makes sure only one thread uses the backend at a time, so one backend can be shared."""
+    def __init__(self) -> None:
+        """Creates a new SegmentationBackend."""
+        self.frames_segmented = 0
+        """How many frames have been segmented."""
+
+        self.last_time = 0.0
+        """How long the last frame took, in seconds."""
+
+        self.total_time = 0.0
+        """How long every frame took together, in seconds."""
+
+        self.scales_with_size = True
+        """Whether the backend gets cheaper on smaller frames. When False, the camera ignores mask_scale, since segmenting a smaller copy would only lose detail."""
+
+        self.resizes_frames = False
+        """Whether the backend scales every frame to its own size before segmenting it. When True, the camera makes the smaller copy for mask_scale with nearest neighbour scaling, the cheapest, since the backend scales the frame again anyway."""
+
+        self._lock = threading.Lock()
+
+    def _segment(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Finds the person in a frame. Subclasses must override this.
+
+        Not meant for user use.
+
+        :param frame: The RGB frame, shape (height, width, 3).
+
+        :return np.ndarray: The confidence (0 to 1) that each pixel is a person, shape (height, width), dtype float32. It only has to stay valid until the next call.
+        """
+        raise NotImplementedError
+
+    def segment(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Finds the person in a frame, and times it.
+
+        :param frame: The RGB frame, shape (height, width, 3).
+
+        :return np.ndarray: The confidence (0 to 1) that each pixel is a person, shape (height, width). It is only valid until the next call.
+        """
+        with self._lock:
+            start = time.perf_counter()
+            mask = self._segment(frame)
+            self.last_time = time.perf_counter() - start
+            self.total_time += self.last_time
+            self.frames_segmented += 1
+        return mask
+
+    def reset(self) -> None:
+        """Forgets anything learned from earlier frames. Called when the camera's view changes. Does nothing for backends that look at each frame on its own."""
+
+    def close(self) -> None:
+        """Frees what the backend holds. It cannot be used after this. Does nothing for backends that hold nothing."""
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Gets the cost of the backend.
+
+        :return dict[str, float]: The frames segmented, and how long the last frame took and the mean time per frame (ms).
+        """
+        return {
+            "backend_frames": self.frames_segmented,
+            "backend_ms": self.last_time * 1000,
+            "backend_mean_ms": self.total_time * 1000 / self.frames_segmented if self.frames_segmented else 0.0,
+        }
+
+class MediaPipeBackend(SegmentationBackend):
+    """Finds the person with a MediaPipe image segmentation model. The most exact backend, and the slowest. The model scales every frame to its own size, so a smaller mask_scale only saves the cost of getting the frame to and from the model, which is small, and at 0.75 scaling the frame down can cost more than it saves."""
+    def __init__(self, model: Optional[Union[str, bytes]] = None) -> None:
+        """
+        Loads the model. MediaPipe is imported here, the first time it is needed.
+
+        :param model: The path of a .tflite segmentation model, or the model's bytes. Defaults to None (the model bundled with pgzhelper).
+
+        :raise CameraError: When the model cannot be loaded.
+        """
+        super().__init__()
+        self.resizes_frames = True
+        if isinstance(model, (bytes, bytearray)):
+            base_options = python.BaseOptions(model_asset_buffer=bytes(model))
+        else:
+            base_options = python.BaseOptions(model_asset_path=model or _MODEL_PATH)
+        options = vision.ImageSegmenterOptions(base_options=base_options, running_mode=vision.RunningMode.IMAGE)
+        try:
+            self.segmenter = vision.ImageSegmenter.create_from_options(options)
+            """The MediaPipe ImageSegmenter."""
+        except (RuntimeError, ValueError) as e:
+            raise CameraError(f"cannot load the segmentation model: {e}")
+
+    def _segment(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Runs the model on a frame.
+
+        Not meant for user use.
+
+        :param frame: The RGB frame.
+
+        :return np.ndarray: The model's confidence that each pixel is a person.
+        """
+        result = self.segmenter.segment(mediapipe.Image(image_format=mediapipe.ImageFormat.SRGB, data=frame))
+        return result.confidence_masks[0].numpy_view().squeeze()
+
+    def close(self) -> None:
+        """Closes the MediaPipe segmenter."""
+        self.segmenter.close()
+
+class BackgroundSubtractorBackend(SegmentationBackend):
+    """Finds whatever moves in front of a still background with OpenCV's MOG2 or KNN background subtractor. Its cost goes down with the number of pixels, so with a small mask_scale it is much cheaper than MediaPipe, but it needs a camera that does not move, learns the background over the first frames, and slowly fades out a person who stands still."""
+    def __init__(self, method: str = "mog2", history: int = 500, threshold: Optional[float] = None, learning_rate: float = -1, open_size: int = 3) -> None:
+        """
+        Creates the background subtractor.
+
+        :param method: "mog2" or "knn". Defaults to "mog2".
+        :param history: How many frames the background is learned from. Defaults to 500.
+        :param threshold: How different a pixel must be from the background to count as the person. Defaults to None (OpenCV's default: 16 for "mog2", 400 for "knn").
+        :param learning_rate: How fast (0 to 1) the background follows changes. 0 stops learning, -1 picks it from history. Defaults to -1.
+        :param open_size: The size (in pixels) of specks of noise that are removed from the mask. 0 keeps them. Defaults to 3.
+
+        :raise CameraError: When method is not "mog2" or "knn".
+        """
+        super().__init__()
+        if method not in ("mog2", "knn"):
+            raise CameraError(f"method must be \"mog2\" or \"knn\", not {method!r}")
+
+        self.method = method
+        """The background subtractor used: "mog2" or "knn"."""
+
+        self.history = history
+        """How many frames the background is learned from."""
+
+        self.threshold = threshold
+        """How different a pixel must be from the background to count as the person. None is OpenCV's default."""
+
+        self.learning_rate = learning_rate
+        """How fast (0 to 1) the background follows changes. -1 picks it from history."""
+
+        self.open_size = open_size
+        """The size (in pixels) of specks of noise that are removed from the mask."""
+
+        self._kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (open_size, open_size)) if open_size > 0 else None
+        self._foreground = None
+        self._mask = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Forgets the learned background, so it is learned again from the next frames."""
+        if self.method == "mog2":
+            self.subtractor = cv2.createBackgroundSubtractorMOG2(self.history, 16 if self.threshold is None else self.threshold, False)
+            """The OpenCV background subtractor."""
+        else:
+            self.subtractor = cv2.createBackgroundSubtractorKNN(self.history, 400 if self.threshold is None else self.threshold, False)
+
+    def _segment(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Compares a frame with the learned background, and learns from it.
+
+        Not meant for user use.
+
+        :param frame: The RGB frame.
+
+        :return np.ndarray: 1 where the frame differs from the background, 0 elsewhere.
+        """
+        if self._mask is None or self._mask.shape != frame.shape[:2]:
+            self._foreground = np.empty(frame.shape[:2], np.uint8)
+            self._mask = np.empty(frame.shape[:2], np.float32)
+        self.subtractor.apply(frame, self._foreground, self.learning_rate)
+        if self._kernel is not None:
+            cv2.morphologyEx(self._foreground, cv2.MORPH_OPEN, self._kernel, dst=self._foreground)
+        np.multiply(self._foreground, 1 / 255, out=self._mask, casting="unsafe")
+        return self._mask
+
+class ChromaKeyBackend(SegmentationBackend):
+    """Treats every pixel near a key color (like a green screen) as background. The cheapest backend, for a person in front of a plain, evenly lit backdrop."""
+    def __init__(self, color: tuple[int, int, int] = (0, 255, 0), hue_tolerance: int = 12, min_saturation: int = 80, min_value: int = 50) -> None:
+        """
+        Creates a new ChromaKeyBackend.
+
+        :param color: The RGB color of the backdrop. Defaults to (0, 255, 0) (green).
+        :param hue_tolerance: How far (in OpenCV hue steps, 0 to 90) a pixel's hue can be from the backdrop's and still count as backdrop. Defaults to 12.
+        :param min_saturation: How saturated (0 to 255) a pixel must be to count as backdrop, so gray and white clothes are kept. Defaults to 80.
+        :param min_value: How bright (0 to 255) a pixel must be to count as backdrop, so dark shadows are kept. Defaults to 50.
+        """
+        super().__init__()
+        self.color = tuple(color[:3])
+        """The RGB color of the backdrop."""
+
+        self.hue_tolerance = hue_tolerance
+        """How far a pixel's hue can be from the backdrop's and still count as backdrop."""
+
+        self.min_saturation = min_saturation
+        """How saturated a pixel must be to count as backdrop."""
+
+        self.min_value = min_value
+        """How bright a pixel must be to count as backdrop."""
+
+        self._hue = 0
+        self._hue_color = None
+        self._hsv = None
+        self._backdrop = None
+        self._wrapped = None
+        self._mask = None
+
+    def _segment(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Finds the pixels that are not the backdrop.
+
+        Not meant for user use.
+
+        :param frame: The RGB frame.
+
+        :return np.ndarray: 0 where the frame is the backdrop, 1 elsewhere.
+        """
+        if self._mask is None or self._mask.shape != frame.shape[:2]:
+            self._hsv = np.empty(frame.shape, np.uint8)
+            self._backdrop = np.empty(frame.shape[:2], np.uint8)
+            self._wrapped = np.empty(frame.shape[:2], np.uint8)
+            self._mask = np.empty(frame.shape[:2], np.float32)
+        if self._hue_color != self.color:
+            self._hue = int(cv2.cvtColor(np.uint8([[self.color]]), cv2.COLOR_RGB2HSV)[0, 0, 0])
+            self._hue_color = self.color
+        hue = self._hue
+        low, high = hue - self.hue_tolerance, hue + self.hue_tolerance
+        cv2.cvtColor(frame, cv2.COLOR_RGB2HSV, dst=self._hsv)
+        cv2.inRange(self._hsv, (max(low, 0), self.min_saturation, self.min_value), (min(high, 179), 255, 255), dst=self._backdrop)
+        if low < 0 or high > 179:
+            wrapped = (low + 180, 179) if low < 0 else (0, high - 180)
+            cv2.inRange(self._hsv, (wrapped[0], self.min_saturation, self.min_value), (wrapped[1], 255, 255), dst=self._wrapped)
+            cv2.bitwise_or(self._backdrop, self._wrapped, dst=self._backdrop)
+        cv2.bitwise_not(self._backdrop, dst=self._backdrop)
+        np.multiply(self._backdrop, 1 / 255, out=self._mask, casting="unsafe")
+        return self._mask
+
+def open_backend(backend: Union[str, SegmentationBackend]) -> SegmentationBackend:
+    """
+    Makes a segmentation backend from its name.
+
+    Not meant for user use.
+
+    :param backend: "mog2", "knn" or "chroma" (green screen), or a SegmentationBackend (used as it is).
+
+    :return SegmentationBackend: The backend.
+
+    :raise CameraError: When the name is not one of BACKENDS.
+    """
+    if isinstance(backend, SegmentationBackend):
+        return backend
+    if backend in ("mog2", "knn"):
+        return BackgroundSubtractorBackend(backend)
+    if backend == "chroma":
+        return ChromaKeyBackend()
+    if backend == "mediapipe":
+        return MediaPipeBackend()
+    raise CameraError(f"backend must be one of {BACKENDS} or a SegmentationBackend, not {backend!r}")
+
+class AsyncSegmenter:
+    """Runs a segmentation function on a background thread, always on the newest frame, and keeps the most recent mask."""
+    def __init__(self, segment: Callable[[np.ndarray], np.ndarray]) -> None:
+        """
+        Creates a new AsyncSegmenter and starts its thread.
+
+        :param segment: The function that takes an RGB frame and returns its mask (the confidence that each pixel is a person, from 0 to 1).
+        """
+        self.segment = segment
+        """The function that takes an RGB frame and returns its mask."""
+
+        self.masks_computed = 0
+        """How many masks the background thread has made."""
+
+        self.frames_skipped = 0
+        """How many submitted frames were replaced by a newer one before the thread got to them."""
+
+        self.sync_fallbacks = 0
+        """How many masks had to be made straight away with segment_now() because the newest one was too old."""
+
+        self.last_time = 0.0
+        """How long the last mask took to make, in seconds."""
+
+        self._pending = None
+        self._pending_timestamp = 0.0
+        self._has_pending = False
+        self._working = None
+        self._mask = None
+        self._mask_timestamp = 0.0
+        self._segment_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="pgzhelper-segmenter", daemon=True)
+        self._thread.start()
+
+    def submit(self, frame: np.ndarray, timestamp: float) -> None:
+        """
+        Gives the thread a new frame to segment. Replaces any frame it has not started on yet. The frame is copied, so it can be changed afterwards.
+
+        :param frame: The RGB frame.
+        :param timestamp: When the frame was captured (time.perf_counter() time).
+        """
+        with self._condition:
+            if self._pending is None or self._pending.shape != frame.shape:
+                self._pending = np.empty_like(frame)
+            np.copyto(self._pending, frame)
+            if self._has_pending:
+                self.frames_skipped += 1
+            self._pending_timestamp = timestamp
+            self._has_pending = True
+            self._condition.notify()
+
+    def latest(self) -> tuple[Optional[np.ndarray], float]:
+        """
+        Gets the most recent mask.
+
+        :return tuple[np.ndarray, float]: The mask and the capture time of the frame it was made from.
+        :return tuple[None, float]: When no mask has been made yet.
+        """
+        return self._mask, self._mask_timestamp
+
+    def segment_now(self, frame: np.ndarray, timestamp: float) -> np.ndarray:
+        """
+        Makes a mask straight away, on this thread. Used when the newest mask is too old.
+
+        :param frame: The RGB frame.
+        :param timestamp: When the frame was captured (time.perf_counter() time).
+
+        :return np.ndarray: The mask.
+        """
+        with self._segment_lock:
+            mask = self.segment(frame)
+        self.sync_fallbacks += 1
+        if timestamp >= self._mask_timestamp:
+            self._mask, self._mask_timestamp = mask, timestamp
+        return mask
+
+    def stop(self) -> None:
+        """Stops the background thread."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._thread.join(timeout=1)
+
+    def _run(self) -> None:
+        """
+        Segments the newest submitted frame until stop() is called. Runs on the background thread.
+
+        Not meant for user use.
+        """
+        while True:
+            with self._condition:
+                while self._running and not self._has_pending:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                self._pending, self._working = self._working, self._pending
+                timestamp = self._pending_timestamp
+                self._has_pending = False
+            start = time.perf_counter()
+            with self._segment_lock:
+                mask = self.segment(self._working)
+            self.last_time = time.perf_counter() - start
+            self.masks_computed += 1
+            if timestamp >= self._mask_timestamp:
+                self._mask, self._mask_timestamp = mask, timestamp
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Gets the segmentation counters.
+
+        :return dict[str, float]: The masks computed, frames skipped, fallbacks to segmenting straight away, and how long the last mask took (ms).
+        """
+        return {
+            "masks_computed": self.masks_computed,
+            "segment_frames_skipped": self.frames_skipped,
+            "segment_sync_fallbacks": self.sync_fallbacks,
+            "segment_ms": self.last_time * 1000,
+        }
@@ -0,0 +1,333 @@
+"""Shared-memory export of camera frames for pgzhelper. Other processes (like gesture tracking) can read the newest camera frame and background mask without opening the camera themselves."""
+
+from __future__ import annotations
+from .utilities import os, time, np, Optional
+from .errors import CameraError
+from multiprocessing import shared_memory, resource_tracker
+
+_MAGIC = 0x48505A50
+"""Marks a shared memory block as a pgzhelper frame ring ("PZPH")."""
+
+_VERSION = 1
+"""The layout version of the frame ring. Readers refuse other versions."""
+
+_HEADER_SIZE = 128
+"""The size (in bytes) of the ring's header: magic, version, width, height, slots and the newest sequence number, then the readers' heartbeat on its own cache line."""
+
+_SLOT_HEADER_SIZE = 64
+"""The size (in bytes) of each slot's header: its sequence number, timestamp and whether it has a mask."""
+
+_ALIGN = 64
+"""Every frame and mask starts on a multiple of this many bytes."""
+
+_HEARTBEAT_TIMEOUT = 1.0
+"""How long (in seconds) after a reader's last heartbeat frames are still published."""
+
+_published_names = set()
+"""The names of the frame rings this process created. A FrameReader in the same process must not take them off the resource tracker, since the publisher still removes them."""
+
+def _align(size: int) -> int:
+    """
+    Rounds a size up to a multiple of _ALIGN.
+
+    Not meant for user use.
+
+    :param size: The size, in bytes.
+
+    :return int: The rounded size.
+    """
+    return (size + _ALIGN - 1) // _ALIGN * _ALIGN
+
+class _Layout:
+    """Numpy views of the header and slots of a frame ring. Used by both FramePublisher and FrameReader, so they agree on where everything is."""
+    def __init__(self, buffer: memoryview, width: int, height: int, slots: int) -> None:
+        """
+        Makes the views.
+
+        Not meant for user use.
+
+        :param buffer: The shared memory.
+        :param width: The width of the frames.
+        :param height: The height of the frames.
+        :param slots: How many frames the ring holds.
+        """
+        frame_size = _align(height * width * 3)
+        slot_size = _SLOT_HEADER_SIZE + frame_size + _align(height * width * 4)
+        self.header = np.ndarray((8,), np.uint64, buffer, 0)
+        self.heartbeat = np.ndarray((1,), np.float64, buffer, _HEADER_SIZE // 2)
+        self.sequences = []
+        self.timestamps = []
+        self.has_mask = []
+        self.frames = []
+        self.masks = []
+        for slot in range(slots):
+            offset = _HEADER_SIZE + slot * slot_size
+            self.sequences.append(np.ndarray((1,), np.uint64, buffer, offset))
+            self.timestamps.append(np.ndarray((1,), np.float64, buffer, offset + 8))
+            self.has_mask.append(np.ndarray((1,), np.uint64, buffer, offset + 16))
+            self.frames.append(np.ndarray((height, width, 3), np.uint8, buffer, offset + _SLOT_HEADER_SIZE))
+            self.masks.append(np.ndarray((height, width), np.float32, buffer, offset + _SLOT_HEADER_SIZE + frame_size))
+
+    @staticmethod
+    def size(width: int, height: int, slots: int) -> int:
+        """
+        Gets the size of a frame ring.
+
+        Not meant for user use.
+
+        :param width: The width of the frames.
+        :param height: The height of the frames.
+        :param slots: How many frames the ring holds.
+
+        :return int: The size, in bytes.
+        """
+        return _HEADER_SIZE + slots * (_SLOT_HEADER_SIZE + _align(height * width * 3) + _align(height * width * 4))
+
+class FramePublisher:
+    """Writes camera frames and masks into a ring of slots in shared memory. Each slot has a sequence number that is odd while it is being written, so readers can tell when a frame changed under them. Frames are only written while a reader has sent a heartbeat in the last second."""
+    def __init__(self, width: int, height: int, name: Optional[str] = None, slots: int = 3) -> None:
+        """
+        Creates the shared memory.
+
+        :param width: The width of the frames.
+        :param height: The height of the frames.
+        :param name: The name readers open the shared memory by. Defaults to None (a name made from the process id).
+        :param slots: How many frames the ring holds. More slots give slow readers longer before their frame is overwritten. Defaults to 3.
+
+        :raise CameraError: When slots is less than 2.
+        """
+        if slots < 2:
+            raise CameraError(f"a frame ring needs at least 2 slots, not {slots}")
+        if name is None:
+            name = f"pgzhelper_{os.getpid()}_{id(self):x}"
+
+        self.name = name
+        """The name readers open the shared memory by."""
+
+        self.width = width
+        """The width of the frames."""
+
+        self.height = height
+        """The height of the frames."""
+
+        self.slots = slots
+        """How many frames the ring holds."""
+
+        self.frames_published = 0
+        """How many frames were written."""
+
+        self.frames_skipped = 0
+        """How many frames were not written because no reader was attached."""
+
+        self._memory = shared_memory.SharedMemory(name, create=True, size=_Layout.size(width, height, slots))
+        _published_names.add(self._memory.name)
+        self._layout = _Layout(self._memory.buf, width, height, slots)
+        self._layout.header[:6] = (_MAGIC, _VERSION, width, height, slots, 0)
+        self._layout.heartbeat[0] = -_HEARTBEAT_TIMEOUT
+        self._heartbeat = self._layout.heartbeat
+
+    def has_readers(self) -> bool:
+        """
+        Checks if a reader has sent a heartbeat in the last second.
+
+        :return True: When a reader is attached.
+        :return False: When nobody is reading.
+        """
+        return time.perf_counter() - self._heartbeat[0] < _HEARTBEAT_TIMEOUT
+
+    def publish(self, frame: np.ndarray, mask: Optional[np.ndarray] = None, timestamp: Optional[float] = None) -> bool:
+        """
+        Writes a frame (and mask) into the next slot, when a reader is attached.
+
+        :param frame: The RGB frame, shape (height, width, 3).
+        :param mask: The confidence (0 to 1) that each pixel is a person, shape (height, width). Defaults to None (no mask).
+        :param timestamp: When the frame was read from the camera (time.perf_counter() time). Defaults to None (now).
+
+        :return True: When the frame was written.
+        :return False: When nobody is reading, so nothing was written.
+        """
+        if time.perf_counter() - self._heartbeat[0] >= _HEARTBEAT_TIMEOUT:
+            self.frames_skipped += 1
+            return False
+        layout = self._layout
+        sequence = int(layout.header[5]) + 1
+        slot = sequence % self.slots
+        layout.sequences[slot][0] = 2 * sequence - 1
+        np.copyto(layout.frames[slot], frame)
+        if mask is not None:
+            np.copyto(layout.masks[slot], mask, casting="unsafe")
+        layout.has_mask[slot][0] = mask is not None
+        layout.timestamps[slot][0] = time.perf_counter() if timestamp is None else timestamp
+        layout.sequences[slot][0] = 2 * sequence
+        layout.header[5] = sequence
+        self.frames_published += 1
+        return True
+
+    def close(self) -> None:
+        """Removes the shared memory. Readers that are still attached keep their copy until they close."""
+        if self._memory is None:
+            return
+        self._layout = None
+        self._heartbeat = None
+        try:
+            self._memory.close()
+        except BufferError:
+            pass
+        self._memory.unlink()
+        _published_names.discard(self._memory.name)
+        self._memory = None
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Gets the publishing counters.
+
+        :return dict[str, float]: The frames published and skipped (because nobody was reading), and whether a reader is attached (1 or 0).
+        """
+        return {
+            "frames_published": self.frames_published,
+            "frames_skipped": self.frames_skipped,
+            "readers_attached": int(self._memory is not None and self.has_readers()),
+        }
+
+class SharedFrame:
+    """One frame read from a FrameReader. The frame and mask are views into the shared memory, so check is_valid() after using them."""
+    def __init__(self, reader: FrameReader, sequence: int, slot: int, timestamp: float, frame: np.ndarray, mask: Optional[np.ndarray]) -> None:
+        """
+        Creates a new SharedFrame.
+
+        Not meant for user use. Use FrameReader.latest() instead.
+
+        :param reader: The FrameReader the views belong to, or None for copies.
+        :param sequence: The frame's number.
+        :param slot: The slot the frame is in.
+        :param timestamp: When the frame was read from the camera.
+        :param frame: The RGB frame.
+        :param mask: The mask, or None.
+        """
+        self.sequence = sequence
+        """The frame's number. Goes up by 1 for every published frame."""
+
+        self.timestamp = timestamp
+        """When the frame was read from the camera (time.perf_counter() time, which is shared between processes on most systems)."""
+
+        self.frame = frame
+        """The RGB frame, shape (height, width, 3)."""
+
+        self.mask = mask
+        """The confidence (0 to 1) that each pixel is a person, shape (height, width). None when the background is not being removed."""
+
+        self._reader = reader
+        self._slot = slot
+
+    def is_valid(self) -> bool:
+        """
+        Checks if the frame is still in its slot. The publisher overwrites slots, oldest first, so a reader that takes too long can see a newer frame through the views.
+
+        :return True: When the frame and mask have not been overwritten (always True for copies).
+        :return False: When they have, so the results made from them should be thrown away.
+        """
+        if self._reader is None:
+            return True
+        return int(self._reader._layout.sequences[self._slot][0]) == 2 * self.sequence
+
+class FrameReader:
+    """Reads the newest camera frame and mask that a FramePublisher (in another process) wrote into shared memory. Every read is a heartbeat, which keeps the publisher writing."""
+    def __init__(self, name: str) -> None:
+        """
+        Opens the shared memory.
+
+        :param name: The name of the shared memory, from FramePublisher.name or Camera.start_publishing().
+
+        :raise FileNotFoundError: When nothing is published under the name.
+        :raise CameraError: When the shared memory is not a pgzhelper frame ring, or is from another version.
+        """
+        self.name = name
+        """The name of the shared memory."""
+
+        try:
+            self._memory = shared_memory.SharedMemory(name, track=False)
+        except TypeError:
+            self._memory = shared_memory.SharedMemory(name)
+            if self._memory.name not in _published_names:
+                resource_tracker.unregister(self._memory._name, "shared_memory")
+        header = np.ndarray((8,), np.uint64, self._memory.buf, 0)
+        if int(header[0]) != _MAGIC or int(header[1]) != _VERSION:
+            self._memory.close()
+            raise CameraError(f"{name!r} is not a pgzhelper frame ring of version {_VERSION}")
+
+        self.width = int(header[2])
+        """The width of the frames."""
+
+        self.height = int(header[3])
+        """The height of the frames."""
+
+        self.slots = int(header[4])
+        """How many frames the ring holds."""
+
+        self.last_sequence = 0
+        """The sequence number of the last frame returned by latest() or wait()."""
+
+        self._layout = _Layout(self._memory.buf, self.width, self.height, self.slots)
+        self.heartbeat()
+
+    def heartbeat(self) -> None:
+        """Tells the publisher a reader is attached. latest() and wait() do this; call it yourself when you stop reading for more than a second but want frames to keep coming."""
+        self._layout.heartbeat[0] = time.perf_counter()
+
+    def latest(self, copy: bool = False) -> Optional[SharedFrame]:
+        """
+        Gets the newest published frame.
+
+        :param copy: Whether to copy the frame and mask out of the shared memory. Without a copy nothing is copied, but check SharedFrame.is_valid() after using it. Defaults to False.
+
+        :return SharedFrame: The newest frame.
+        :return None: When no frame has been published since the reader's first heartbeat.
+        """
+        layout = self._layout
+        self.heartbeat()
+        while True:
+            sequence = int(layout.header[5])
+            if sequence == 0:
+                return None
+            slot = sequence % self.slots
+            if int(layout.sequences[slot][0]) != 2 * sequence:
+                continue
+            timestamp = float(layout.timestamps[slot][0])
+            frame = layout.frames[slot]
+            mask = layout.masks[slot] if layout.has_mask[slot][0] else None
+            if copy:
+                frame = frame.copy()
+                mask = None if mask is None else mask.copy()
+                if int(layout.sequences[slot][0]) != 2 * sequence:
+                    continue
+            self.last_sequence = sequence
+            return SharedFrame(None if copy else self, sequence, slot, timestamp, frame, mask)
+
+    def wait(self, timeout: Optional[float] = None, copy: bool = False) -> Optional[SharedFrame]:
+        """
+        Waits for a frame newer than the last one returned, then gets it.
+
+        :param timeout: The longest time (in seconds) to wait. Defaults to None (wait forever).
+        :param copy: Whether to copy the frame and mask out of the shared memory. See latest(). Defaults to False.
+
+        :return SharedFrame: The new frame.
+        :return None: When the timeout ran out first.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while int(self._layout.header[5]) <= self.last_sequence:
+            self.heartbeat()
+            if deadline is not None and time.perf_counter() >= deadline:
+                return None
+            time.sleep(0.001)
+        return self.latest(copy)
+
+    def close(self) -> None:
+        """Closes the shared memory. Frames read without a copy cannot be used after this. When such frames are still around, the memory is closed once they are deleted."""
+        if self._memory is None:
+            return
+        self._layout = None
+        try:
+            self._memory.close()
+        except BufferError:
+            pass
+        self._memory = None
@@ -0,0 +1,546 @@
+"""Frame sources for pgzhelper's camera. A Camera can read from a webcam, a video file, a folder of images, a stack of arrays or a generator, and every source goes through the same zoom, background removal and Surface path."""
+
+from __future__ import annotations
+from .utilities import os, cv2, np, Optional, Union, Callable, Iterable
+from .errors import CameraError
+from ._pacing import FrameScheduler
+
+PACING_MODES = ("realtime", "fast")
+"""How a FrameSource hands out frames. "realtime" waits for each frame at the source's frames per second, like a camera, and skips frames when the reader falls behind. "fast" hands them out as quickly as they are read."""
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".webp", ".tif", ".tiff")
+"""The file extensions ImageFolderSource reads."""
+
+def _configure_capture(capture: object, width: Optional[int], height: Optional[int], fps: Optional[float], fourcc: Optional[str], buffer_size: Optional[int]) -> None:
+    """
+    Asks the camera driver for a format. The fourcc is set first, because many drivers only offer some sizes and frame rates for some formats. The driver may pick something else; read the properties back to see what it chose.
+
+    Not meant for user use.
+
+    :param capture: The cv2.VideoCapture.
+    :param width: The width to ask for, or None.
+    :param height: The height to ask for, or None.
+    :param fps: The frames per second to ask for, or None.
+    :param fourcc: The four letter pixel format to ask for (like "MJPG" or "YUYV"), or None.
+    :param buffer_size: How many frames the driver may keep waiting, or None.
+
+    :raise CameraError: When fourcc is not four letters.
+    """
+    if fourcc is not None:
+        if len(fourcc) != 4:
+            raise CameraError(f"fourcc must be four letters, like \"MJPG\", not {fourcc!r}")
+        capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+    if width is not None:
+        capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    if height is not None:
+        capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    if fps is not None:
+        capture.set(cv2.CAP_PROP_FPS, fps)
+    if buffer_size is not None:
+        capture.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+
+class FrameSource:
+    """Hands out BGR frames with the same read(), get() and release() as a cv2.VideoCapture, so a Camera (and its capture thread) can read from it. Subclasses only say how to get the next frame."""
+    def __init__(self, fps: Optional[float] = 30, pacing: str = "realtime", loop: bool = False, order: str = "BGR") -> None:
+        """
+        Creates a new FrameSource.
+
+        :param fps: The frames per second of the source. Defaults to 30.
+        :param pacing: "realtime" or "fast". Defaults to "realtime".
+        :param loop: Whether to start again from the first frame after the last one. Defaults to False.
+        :param order: The order of each pixel's colors in the frames: "BGR" (like cv2) or "RGB" (like pygame). Defaults to "BGR".
+
+        :raise CameraError: When pacing is not "realtime" or "fast", or order is not "BGR" or "RGB".
+        """
+        if pacing not in PACING_MODES:
+            raise CameraError(f"pacing must be one of {PACING_MODES}, not {pacing!r}")
+        if order not in ("BGR", "RGB"):
+            raise CameraError(f"order must be \"BGR\" or \"RGB\", not {order!r}")
+
+        self.fps = fps or 0
+        """The frames per second of the source. 0 when it does not say."""
+
+        self.pacing = pacing
+        """How frames are handed out: "realtime" or "fast"."""
+
+        self.loop = loop
+        """Whether the source starts again from the first frame after the last one."""
+
+        self.order = order
+        """The order of each pixel's colors in the frames."""
+
+        self.width = 0
+        """The width of the frames."""
+
+        self.height = 0
+        """The height of the frames."""
+
+        self.frame_count = 0
+        """How many frames the source has. 0 when it does not know."""
+
+        self.position = 0
+        """The number of the next frame."""
+
+        self.frames_read = 0
+        """How many frames have been handed out."""
+
+        self.frames_skipped = 0
+        """How many frames were skipped because the reader fell behind, with "realtime" pacing."""
+
+        self._scheduler = FrameScheduler(self.fps if pacing == "realtime" else None)
+
+    def _next(self) -> Optional[np.ndarray]:
+        """
+        Gets the next frame. Subclasses must override this.
+
+        Not meant for user use.
+
+        :return np.ndarray: The frame, shape (height, width, 3). It only has to stay valid until the next call.
+        :return None: When there are no more frames.
+        """
+        raise NotImplementedError
+
+    def _rewind(self) -> bool:
+        """
+        Goes back to the first frame. Subclasses that can rewind override this.
+
+        Not meant for user use.
+
+        :return True: When the source was rewound.
+        :return False: When it cannot be.
+        """
+        return False
+
+    def _skip(self, count: int) -> None:
+        """
+        Skips frames without handing them out. Subclasses override this when they can skip without decoding.
+
+        Not meant for user use.
+
+        :param count: How many frames to skip.
+        """
+        for _ in range(count):
+            if self._next() is None:
+                break
+
+    def read(self, image: Optional[np.ndarray] = None) -> tuple[bool, Optional[np.ndarray]]:
+        """
+        Gets the next frame, waiting for it with "realtime" pacing, like cv2.VideoCapture.read().
+
+        :param image: A buffer to copy the frame into. Used when it has the frame's shape, so reading does not make a new array every frame. Defaults to None.
+
+        :return tuple[bool, np.ndarray]: True and the BGR frame, shape (height, width, 3). Gray and four channel frames are converted.
+        :return tuple[False, None]: When there are no more frames.
+        """
+        if self.pacing == "realtime":
+            dropped = self._scheduler.frames_dropped
+            self._scheduler.wait()
+            missed = self._scheduler.frames_dropped - dropped
+            if missed:
+                self._skip(missed)
+                self.position += missed
+                self.frames_skipped += missed
+        frame = self._next()
+        if frame is None and self.loop and self._rewind():
+            self.position = 0
+            frame = self._next()
+        if frame is None:
+            return False, None
+        self.position += 1
+        self.frames_read += 1
+        shape = (frame.shape[0], frame.shape[1], 3)
+        if image is None or image.shape != shape:
+            image = np.empty(shape, np.uint8)
+        rgb = self.order == "RGB"
+        if frame.ndim == 2:
+            cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR, dst=image)
+        elif frame.shape[2] == 4:
+            cv2.cvtColor(frame, cv2.COLOR_RGBA2BGR if rgb else cv2.COLOR_BGRA2BGR, dst=image)
+        elif rgb:
+            cv2.cvtColor(frame, cv2.COLOR_RGB2BGR, dst=image)
+        else:
+            np.copyto(image, frame)
+        return True, image
+
+    def get(self, prop: int) -> float:
+        """
+        Gets the width, height, frames per second, frame count or position, like cv2.VideoCapture.get().
+
+        :param prop: The cv2.CAP_PROP_ property.
+
+        :return float: The value, or 0 for any other property.
+        """
+        return {
+            cv2.CAP_PROP_FRAME_WIDTH: self.width,
+            cv2.CAP_PROP_FRAME_HEIGHT: self.height,
+            cv2.CAP_PROP_FPS: self.fps,
+            cv2.CAP_PROP_FRAME_COUNT: self.frame_count,
+            cv2.CAP_PROP_POS_FRAMES: self.position,
+        }.get(prop, 0)
+
+    def set(self, prop: int, value: float) -> bool:
+        """
+        Does nothing. Here to match cv2.VideoCapture.set().
+
+        :param prop: The cv2.CAP_PROP_ property.
+        :param value: The value.
+
+        :return False: Always, since no property can be changed.
+        """
+        return False
+
+    def isOpened(self) -> bool:
+        """
+        Checks if the source can be read, like cv2.VideoCapture.isOpened().
+
+        :return True: Always.
+        """
+        return True
+
+    def release(self) -> None:
+        """Lets go of anything the source holds. Subclasses that open files override this."""
+
+class DeviceSource(FrameSource):
+    """Reads frames from a webcam. The camera sets its own pace, so pacing is not used."""
+    def __init__(self, camera_number: int = 0, width: Optional[int] = None, height: Optional[int] = None, fps: Optional[float] = None, fourcc: Optional[str] = None, buffer_size: Optional[int] = 1) -> None:
+        """
+        Opens a webcam and asks it for a format. See Camera() for the parameters.
+
+        :raise CameraError: When the webcam cannot be opened or has no frame size, or fourcc is not four letters.
+        """
+        self.capture = cv2.VideoCapture(camera_number)
+        """The cv2.VideoCapture of the webcam."""
+
+        if not self.capture.isOpened():
+            self.capture.release()
+            raise CameraError(f"cannot open camera {camera_number}")
+        try:
+            _configure_capture(self.capture, width, height, fps, fourcc, buffer_size)
+        except CameraError:
+            self.capture.release()
+            raise
+        super().__init__(self.capture.get(cv2.CAP_PROP_FPS), "fast")
+        self.width = int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self.capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        if not self.width or not self.height:
+            self.capture.release()
+            raise CameraError(f"camera {camera_number} has no frame size ({self.width}x{self.height})")
+
+    def read(self, image: Optional[np.ndarray] = None) -> tuple[bool, Optional[np.ndarray]]:
+        """
+        Gets the next frame from the webcam, waiting for it.
+
+        :param image: A buffer for cv2 to read the frame into. Defaults to None.
+
+        :return tuple[bool, np.ndarray]: Whether a frame was read, and the BGR frame.
+        """
+        ok, frame = self.capture.read(image)
+        if ok:
+            self.frames_read += 1
+        return ok, frame
+
+    def get(self, prop: int) -> float:
+        """
+        Gets a property of the webcam, like cv2.VideoCapture.get().
+
+        :param prop: The cv2.CAP_PROP_ property.
+
+        :return float: The value.
+        """
+        return self.capture.get(prop)
+
+    def set(self, prop: int, value: float) -> bool:
+        """
+        Changes a property of the webcam, like cv2.VideoCapture.set().
+
+        :param prop: The cv2.CAP_PROP_ property.
+        :param value: The value.
+
+        :return True: When the webcam took the value.
+        :return False: When it did not.
+        """
+        return self.capture.set(prop, value)
+
+    def isOpened(self) -> bool:
+        """
+        Checks if the webcam is open.
+
+        :return True: When it is open.
+        :return False: When it could not be opened.
+        """
+        return self.capture.isOpened()
+
+    def release(self) -> None:
+        """Releases the webcam."""
+        self.capture.release()
+
+class VideoFileSource(FrameSource):
+    """Reads frames from a video file, at the file's frames per second with "realtime" pacing."""
+    def __init__(self, path: str, pacing: str = "realtime", loop: bool = False, fps: Optional[float] = None) -> None:
+        """
+        Opens a video file.
+
+        :param path: The path of the video file.
+        :param pacing: "realtime" or "fast". Defaults to "realtime".
+        :param loop: Whether to start again from the first frame after the last one. Defaults to False.
+        :param fps: The frames per second to play the video at. Defaults to None (the file's own, or 30 when it does not say).
+
+        :raise CameraError: When the file cannot be opened, or pacing is not "realtime" or "fast".
+        """
+        self.capture = cv2.VideoCapture(path)
+        """The cv2.VideoCapture of the file."""
+
+        if not self.capture.isOpened():
+            raise CameraError(f"cannot open the video file {path!r}")
+        super().__init__(fps or self.capture.get(cv2.CAP_PROP_FPS) or 30, pacing, loop)
+        self.path = path
+        """The path of the video file."""
+
+        self.width = int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self.capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.frame_count = int(self.capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        self._buffer = None
+
+    def _next(self) -> Optional[np.ndarray]:
+        """
+        Decodes the next frame of the file.
+
+        Not meant for user use.
+
+        :return np.ndarray: The frame.
+        :return None: When there are no more frames.
+        """
+        ok, frame = self.capture.read(self._buffer)
+        if not ok:
+            return None
+        self._buffer = frame
+        return frame
+
+    def _rewind(self) -> bool:
+        """
+        Goes back to the start of the file.
+
+        Not meant for user use.
+
+        :return True: When the file was rewound.
+        :return False: When it could not be.
+        """
+        return self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def _skip(self, count: int) -> None:
+        """
+        Skips frames without decoding them.
+
+        Not meant for user use.
+
+        :param count: How many frames to skip.
+        """
+        for _ in range(count):
+            if not self.capture.grab():
+                break
+
+    def release(self) -> None:
+        """Closes the video file."""
+        self.capture.release()
+
+class ImageFolderSource(FrameSource):
+    """Reads every image in a folder, in name order, as one frame each."""
+    def __init__(self, path: str, fps: float = 30, pacing: str = "realtime", loop: bool = True) -> None:
+        """
+        Finds the images in a folder.
+
+        :param path: The path of the folder.
+        :param fps: The frames per second to show the images at. Defaults to 30.
+        :param pacing: "realtime" or "fast". Defaults to "realtime".
+        :param loop: Whether to start again from the first image after the last one. Defaults to True.
+
+        :raise CameraError: When the folder has no images, or pacing is not "realtime" or "fast".
+        """
+        super().__init__(fps, pacing, loop)
+        self.path = path
+        """The path of the folder."""
+
+        self.files = sorted(os.path.join(path, name) for name in os.listdir(path) if name.lower().endswith(IMAGE_EXTENSIONS)) if os.path.isdir(path) else []
+        """The paths of the images, in the order they are shown."""
+
+        if not self.files:
+            raise CameraError(f"no images found in {path!r}")
+        first = cv2.imread(self.files[0])
+        if first is None:
+            raise CameraError(f"cannot read the image {self.files[0]!r}")
+        self.height, self.width = first.shape[:2]
+        self.frame_count = len(self.files)
+
+    def _next(self) -> Optional[np.ndarray]:
+        """
+        Loads the next image.
+
+        Not meant for user use.
+
+        :return np.ndarray: The frame.
+        :return None: When there are no more frames.
+        """
+        if self.position >= len(self.files):
+            return None
+        return cv2.imread(self.files[self.position], cv2.IMREAD_COLOR)
+
+    def _rewind(self) -> bool:
+        """
+        Goes back to the first image.
+
+        Not meant for user use.
+
+        :return True: Always.
+        """
+        return True
+
+    def _skip(self, count: int) -> None:
+        """
+        Skips images without loading them. read() moves the position.
+
+        Not meant for user use.
+
+        :param count: How many frames to skip.
+        """
+
+class ArraySource(FrameSource):
+    """Hands out frames from a stack of arrays, like frames made by a test or loaded beforehand."""
+    def __init__(self, frames: Union[np.ndarray, list[np.ndarray]], fps: float = 30, pacing: str = "realtime", loop: bool = True, order: str = "BGR") -> None:
+        """
+        Creates a new ArraySource.
+
+        :param frames: The frames: an array of shape (count, height, width, 3), a list of (height, width, 3) arrays, or a single (height, width, 3) array.
+        :param fps: The frames per second to hand the frames out at. Defaults to 30.
+        :param pacing: "realtime" or "fast". Defaults to "realtime".
+        :param loop: Whether to start again from the first frame after the last one. Defaults to True.
+        :param order: The order of each pixel's colors: "BGR" or "RGB". Defaults to "BGR".
+
+        :raise CameraError: When there are no frames, pacing is not "realtime" or "fast", or order is not "BGR" or "RGB".
+        """
+        super().__init__(fps, pacing, loop, order)
+        if isinstance(frames, np.ndarray) and frames.ndim == 3:
+            frames = frames[np.newaxis]
+        if len(frames) == 0:
+            raise CameraError("an ArraySource needs at least one frame")
+
+        self.frames = frames
+        """The frames."""
+
+        self.height, self.width = frames[0].shape[:2]
+        self.frame_count = len(frames)
+
+    def _next(self) -> Optional[np.ndarray]:
+        """
+        Gets the next frame of the stack.
+
+        Not meant for user use.
+
+        :return np.ndarray: The frame.
+        :return None: When there are no more frames.
+        """
+        if self.position >= len(self.frames):
+            return None
+        return self.frames[self.position]
+
+    def _rewind(self) -> bool:
+        """
+        Goes back to the first frame.
+
+        Not meant for user use.
+
+        :return True: Always.
+        """
+        return True
+
+    def _skip(self, count: int) -> None:
+        """
+        Skips frames. read() moves the position.
+
+        Not meant for user use.
+
+        :param count: How many frames to skip.
+        """
+
+class GeneratorSource(FrameSource):
+    """Hands out frames from a generator, or anything else that can be iterated over, like frames drawn by code."""
+    def __init__(self, frames: Union[Iterable[np.ndarray], Callable[[], Iterable[np.ndarray]]], fps: float = 30, pacing: str = "realtime", loop: bool = False, order: str = "BGR") -> None:
+        """
+        Creates a new GeneratorSource. The first frame is read straight away, to get the size.
+
+        :param frames: The frames, each shape (height, width, 3): an iterable, or a function that returns one. Only a function can be looped, since it is called again to start over.
+        :param fps: The frames per second to hand the frames out at. Defaults to 30.
+        :param pacing: "realtime" or "fast". Defaults to "realtime".
+        :param loop: Whether to call frames again after the last frame. Defaults to False.
+        :param order: The order of each pixel's colors: "BGR" or "RGB". Defaults to "BGR".
+
+        :raise CameraError: When there are no frames, pacing is not "realtime" or "fast", or order is not "BGR" or "RGB".
+        """
+        super().__init__(fps, pacing, loop, order)
+        self.frames = frames
+        """The frames, or the function that makes them."""
+
+        self._iterator = iter(frames() if callable(frames) else frames)
+        self._first = next(self._iterator, None)
+        if self._first is None:
+            raise CameraError("a GeneratorSource needs at least one frame")
+        self.height, self.width = self._first.shape[:2]
+
+    def _next(self) -> Optional[np.ndarray]:
+        """
+        Gets the next frame from the iterator, starting with the one read to get the size.
+
+        Not meant for user use.
+
+        :return np.ndarray: The frame.
+        :return None: When there are no more frames.
+        """
+        if self._first is not None:
+            frame, self._first = self._first, None
+            return frame
+        return next(self._iterator, None)
+
+    def _rewind(self) -> bool:
+        """
+        Calls frames again, when it is a function.
+
+        Not meant for user use.
+
+        :return True: When frames is a function.
+        :return False: When it cannot be.
+        """
+        if not callable(self.frames):
+            return False
+        self._iterator = iter(self.frames())
+        return True
+
+def open_source(source: Union[int, str, np.ndarray, list, Iterable, Callable, FrameSource], width: Optional[int] = None, height: Optional[int] = None, fps: Optional[float] = None, fourcc: Optional[str] = None, buffer_size: Optional[int] = 1, pacing: str = "realtime") -> FrameSource:
+    """
+    Makes the right FrameSource for something a Camera was given.
+
+    Not meant for user use.
+
+    :param source: A camera number, the path of a video file or a folder of images, an array or list of frames, a generator or function making frames, or a FrameSource (used as it is).
+    :param width: The width to ask a webcam for, or None.
+    :param height: The height to ask a webcam for, or None.
+    :param fps: The frames per second to ask a webcam for, or to hand the frames of any other source out at. None uses the source's own (30 when it does not say).
+    :param fourcc: The pixel format to ask a webcam for, or None.
+    :param buffer_size: How many frames a webcam's driver may keep waiting, or None.
+    :param pacing: "realtime" or "fast", for sources that are not webcams. Defaults to "realtime".
+
+    :return FrameSource: The source.
+
+    :raise CameraError: When the source cannot be opened, or is not something a FrameSource can be made from.
+    """
+    if isinstance(source, FrameSource):
+        return source
+    if isinstance(source, int):
+        return DeviceSource(source, width, height, fps, fourcc, buffer_size)
+    if isinstance(source, str):
+        if os.path.isdir(source):
+            return ImageFolderSource(source, fps or 30, pacing)
+        return VideoFileSource(source, pacing, fps=fps)
+    if isinstance(source, (np.ndarray, list, tuple)):
+        return ArraySource(source, fps or 30, pacing)
+    if callable(source) or isinstance(source, Iterable):
+        return GeneratorSource(source, fps or 30, pacing)
+    raise CameraError(f"cannot read frames from {source!r}")
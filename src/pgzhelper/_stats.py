@@ -0,0 +1,169 @@
+"""Frame-time profiling for pgzhelper. pgzhelper_run.go() times each part of every frame so Screen.stats can show where the time goes."""
+
+from __future__ import annotations
+from .utilities import time, pygame, Callable, Optional
+
+PHASES = ("draw", "camera_draw", "record", "update", "camera_update", "events", "sleep", "frame")
+"""The parts of a frame that are timed. "frame" is the whole frame, from the end of one draw to the end of the next."""
+
+class FrameProfiler:
+    """Keeps the time taken by each part of the last few hundred frames in a ring buffer."""
+    def __init__(self, size: int = 600, clock: Callable[[], float] = time.perf_counter) -> None:
+        """
+        Creates a new FrameProfiler.
+
+        :param size: How many frames to keep. Defaults to 600 (10 seconds at 60 frames per second).
+        :param clock: The function used to get the current time, in seconds. Defaults to time.perf_counter.
+        """
+        self.size = size
+        """How many frames are kept."""
+
+        self.clock = clock
+        """The function used to get the current time, in seconds."""
+
+        self.frames = 0
+        """How many frames have been recorded in total."""
+
+        self.overlay = False
+        """Whether pgzhelper_run.go() draws the overlay at the end of every frame."""
+
+        self.time_handlers = False
+        """Whether pgzhelper_run.go() times every call of the user's functions, for pgzhelper_run.get_stats(). The parts of the frame are always timed."""
+
+        self.overlay_interval = 0.25
+        """How often the overlay's numbers are worked out and rendered again, in seconds. In between, the last rendered overlay is blitted, so the overlay costs little in the frames it measures."""
+
+        self._buffers = {phase: [0.0] * size for phase in PHASES}
+        self._current = dict.fromkeys(PHASES, 0.0)
+        self._index = 0
+        self._last_frame_end = None
+        self._font = None
+        self._overlay_surface = None
+        self._overlay_time = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Adds time to a part of the current frame.
+
+        :param phase: The part of the frame. One of PHASES.
+        :param seconds: The time to add, in seconds.
+        """
+        self._current[phase] += seconds
+
+    def end_frame(self) -> None:
+        """Stores the current frame's times in the ring buffer and starts a new frame."""
+        now = self.clock()
+        if self._last_frame_end is not None:
+            self._current["frame"] = now - self._last_frame_end
+        self._last_frame_end = now
+        index = self._index
+        for phase in PHASES:
+            self._buffers[phase][index] = self._current[phase]
+            self._current[phase] = 0.0
+        self._index = (index + 1) % self.size
+        self.frames += 1
+
+    def reset(self) -> None:
+        """Forgets all of the recorded frames."""
+        for phase in PHASES:
+            self._buffers[phase] = [0.0] * self.size
+            self._current[phase] = 0.0
+        self._index = 0
+        self.frames = 0
+        self._last_frame_end = None
+        self._overlay_surface = None
+
+    def get_times(self, phase: str) -> list[float]:
+        """
+        Gets the recorded times for a part of the frame.
+
+        :param phase: The part of the frame. One of PHASES.
+
+        :return list[float]: The times, in seconds, oldest first.
+        """
+        buffer = self._buffers[phase]
+        if self.frames < self.size:
+            return buffer[:self.frames]
+        return buffer[self._index:] + buffer[:self._index]
+
+    def get_percentiles(self, phase: str, percentiles: tuple[float, ...] = (50, 95, 99)) -> dict[str, float]:
+        """
+        Gets percentiles of the recorded times for a part of the frame.
+
+        :param phase: The part of the frame. One of PHASES.
+        :param percentiles: The percentiles to get. Defaults to (50, 95, 99).
+
+        :return dict[str, float]: The times, in milliseconds, keyed "p50", "p95", ...
+        """
+        times = sorted(self.get_times(phase))
+        result = {}
+        for percentile in percentiles:
+            if times:
+                rank = min(len(times) - 1, max(0, int(round(percentile / 100 * len(times))) - 1))
+                result[f"p{percentile:g}"] = times[rank] * 1000
+            else:
+                result[f"p{percentile:g}"] = 0.0
+        return result
+
+    def get_summary(self) -> dict[str, dict[str, float]]:
+        """
+        Gets the p50, p95 and p99 times for every part of the frame.
+
+        :return dict[str, dict[str, float]]: For each part, the times in milliseconds.
+        """
+        return {phase: self.get_percentiles(phase) for phase in PHASES}
+
+    def dump_csv(self, path: str) -> None:
+        """
+        Writes every recorded frame to a CSV file, one row per frame and one column per part (in milliseconds).
+
+        :param path: The path of the CSV file.
+        """
+        columns = [self.get_times(phase) for phase in PHASES]
+        first_frame = self.frames - len(columns[0])
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("frame," + ",".join(f"{phase}_ms" for phase in PHASES) + "\n")
+            for row, times in enumerate(zip(*columns)):
+                file.write(str(first_frame + row) + "," + ",".join(f"{t * 1000:.4f}" for t in times) + "\n")
+
+    def _render_overlay(self) -> pygame.Surface:
+        """
+        Renders the overlay: the frames per second, and the p50 and p95 time of every part of the frame.
+
+        Not meant for user use.
+
+        :return pygame.Surface: The overlay.
+        """
+        if self._font is None:
+            self._font = pygame.font.SysFont("monospace", 14)
+        font = self._font
+        lines = []
+        frame = self.get_percentiles("frame", (50,))["p50"]
+        lines.append(f"fps {1000 / frame:.1f}" if frame else "fps -")
+        for phase, times in self.get_summary().items():
+            lines.append(f"{phase:<14}{times['p50']:6.2f} {times['p95']:6.2f} ms")
+        rendered = [font.render(line, True, (255, 255, 255)) for line in lines]
+        width = max(line.get_width() for line in rendered) + 8
+        height = sum(line.get_height() for line in rendered) + 8
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 160))
+        y = 4
+        for line in rendered:
+            overlay.blit(line, (4, y))
+            y += line.get_height()
+        return overlay
+
+    def draw_overlay(self, surface: pygame.Surface, pos: tuple[int, int] = (5, 5)) -> pygame.Rect:
+        """
+        Draws the p50 and p95 time of every part of the frame onto a surface. The overlay is only rendered again every overlay_interval seconds.
+
+        :param surface: The pygame Surface to draw on.
+        :param pos: The topleft position of the overlay. Defaults to (5, 5).
+
+        :return pygame.Rect: The area of the surface that was drawn on.
+        """
+        now = self.clock()
+        if self._overlay_surface is None or now - self._overlay_time >= self.overlay_interval:
+            self._overlay_surface = self._render_overlay()
+            self._overlay_time = now
+        return surface.blit(self._overlay_surface, pos)
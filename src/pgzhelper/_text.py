@@ -0,0 +1,208 @@
+"""Text rendering for pgzhelper's Screen.draw.text and Screen.draw.textbox. Keeps the rendered Surfaces in a size limited cache, so text that does not change is only blitted."""
+
+from __future__ import annotations
+from collections import OrderedDict
+from .utilities import math, pygame, Optional
+from pgzero import ptext
+
+TEXT_ANCHORS = {
+    "topleft": (0.0, 0.0),
+    "bottomleft": (0.0, 1.0),
+    "topright": (1.0, 0.0),
+    "bottomright": (1.0, 1.0),
+    "midtop": (0.5, 0.0),
+    "midleft": (0.0, 0.5),
+    "midbottom": (0.5, 1.0),
+    "midright": (1.0, 0.5),
+    "center": (0.5, 0.5),
+}
+"""The horizontal and vertical anchor fractions of each position argument of Screen.draw.text(), the same as pgzero's."""
+
+_FONTNAME = 1
+"""Where the fontname is in a cache key."""
+
+_SYSFONTNAME = 3
+"""Where the sysfontname is in a cache key."""
+
+class TextCache:
+    """Keeps rendered text Surfaces, keyed on the text and every style argument, and drops the least recently used ones when they take up too many bytes."""
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024) -> None:
+        """
+        Creates a new, empty TextCache.
+
+        :param max_bytes: How many bytes of Surfaces can be kept. Defaults to 32 MB.
+        """
+        self.max_bytes = max_bytes
+        """How many bytes of Surfaces can be kept."""
+
+        self.enabled = True
+        """Whether rendered text is kept. When False, all text is rendered again every time, like pgzero does."""
+
+        self.bytes = 0
+        """How many bytes the kept Surfaces take up."""
+
+        self.hits = 0
+        """How many times text was drawn with a kept Surface."""
+
+        self.misses = 0
+        """How many times text had to be rendered."""
+
+        self.evictions = 0
+        """How many Surfaces were dropped to stay under max_bytes."""
+
+        self._entries = OrderedDict()
+
+    def _render(self, key: tuple) -> tuple[pygame.Surface, float, float]:
+        """
+        Renders text with pgzero's ptext, and works out where the Surface goes from the anchor point, the way ptext.draw() does.
+
+        Not meant for user use.
+
+        :param key: The cache key: the text, then the style arguments in the order render() takes them.
+
+        :return tuple[pygame.Surface, float, float]: The Surface, and the x and y offset of its top left corner from the anchor point.
+        """
+        (text, fontname, fontsize, sysfontname, antialias, bold, italic, underline, color, background, width, widthem,
+         lineheight, align, owidth, ocolor, shadow, scolor, gcolor, alpha, angle, hanchor, vanchor) = key
+        if align is None:
+            align = hanchor
+        if isinstance(fontsize, tuple):
+            fontsize = ptext._fitsize(text, fontname, sysfontname, bold, italic, underline, fontsize[1], fontsize[2], lineheight, None)
+        surface = ptext.getsurf(text, fontname, fontsize, sysfontname, bold, italic, underline, width, widthem, None, color, background, antialias,
+                                ocolor, owidth, scolor, shadow, gcolor, alpha, align, lineheight, angle, cache=False)
+        angle = ptext._resolveangle(angle)
+        if angle:
+            width0, height0 = ptext._unrotated_size[(surface.get_size(), angle, text)]
+            sin, cos = math.sin(math.radians(angle)), math.cos(math.radians(angle))
+            dx, dy = (0.5 - hanchor) * width0, (0.5 - vanchor) * height0
+            return surface, dx * cos + dy * sin - 0.5 * surface.get_width(), -dx * sin + dy * cos - 0.5 * surface.get_height()
+        return surface, -hanchor * surface.get_width(), -vanchor * surface.get_height()
+
+    def render(self, text: str, fontname: Optional[str], fontsize: Optional[float], sysfontname: Optional[str], antialias: bool, bold: bool, italic: bool, underline: bool,
+               color, background, width: Optional[float], widthem: Optional[float], lineheight: Optional[float], align, owidth: Optional[float], ocolor,
+               shadow: Optional[tuple[float, float]], scolor, gcolor, alpha: float, angle: float, hanchor: float, vanchor: float) -> tuple[pygame.Surface, float, float]:
+        """
+        Gets the Surface for some text, rendering it when it is not kept. The arguments are the same as Screen.draw.text()'s.
+
+        :param fontsize: The size of the font, in pixels, or ("fit", width, height) for the biggest size whose wrapped text fits in width by height pixels.
+        :param hanchor: The horizontal anchor fraction: 0 is the left edge, 1 the right edge.
+        :param vanchor: The vertical anchor fraction: 0 is the top edge, 1 the bottom edge.
+
+        :return tuple[pygame.Surface, float, float]: The Surface, and the x and y offset of its top left corner from the anchor point.
+        """
+        key = (text, fontname, fontsize, sysfontname, antialias, bold, italic, underline, color, background, width, widthem,
+               lineheight, align, owidth, ocolor, shadow, scolor, gcolor, alpha, angle, hanchor, vanchor)
+        if not self.enabled:
+            self.misses += 1
+            return self._render(key)
+        try:
+            entry = self._entries.get(key)
+        except TypeError:
+            self.misses += 1
+            return self._render(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = self._render(key)
+        size = entry[0].get_pitch() * entry[0].get_height()
+        if size <= self.max_bytes:
+            self._entries[key] = entry
+            self.bytes += size
+            self._evict()
+        return entry
+
+    def draw(self, surface: pygame.Surface, pos: tuple[float, float], *args) -> pygame.Rect:
+        """
+        Draws text on a Surface. See render() for the arguments after pos.
+
+        :param surface: The Surface to draw on.
+        :param pos: The anchor point of the text.
+
+        :return pygame.Rect: The area of the Surface that was drawn on.
+        """
+        text_surface, dx, dy = self.render(*args)
+        return surface.blit(text_surface, (int(round(pos[0] + dx)), int(round(pos[1] + dy))))
+
+    def _evict(self) -> None:
+        """
+        Drops the least recently used Surfaces until the rest fit in max_bytes.
+
+        Not meant for user use.
+        """
+        while self.bytes > self.max_bytes and self._entries:
+            entry = self._entries.popitem(last=False)[1]
+            self.bytes -= entry[0].get_pitch() * entry[0].get_height()
+            self.evictions += 1
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """
+        Changes how many bytes of Surfaces can be kept, dropping the least recently used ones when they no longer fit.
+
+        :param max_bytes: How many bytes of Surfaces can be kept. 0 keeps nothing.
+        """
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def invalidate(self, fontname: Optional[str] = None) -> None:
+        """
+        Drops kept Surfaces, so their text is rendered again. Also drops pgzero's own loaded fonts, so a font file that changed is loaded again.
+
+        :param fontname: Only drop text drawn with this fontname or sysfontname. Defaults to None (drop everything).
+        """
+        if fontname is None:
+            self._entries.clear()
+            self.bytes = 0
+        else:
+            for key in [key for key in self._entries if fontname in (key[_FONTNAME], key[_SYSFONTNAME])]:
+                entry = self._entries.pop(key)
+                self.bytes -= entry[0].get_pitch() * entry[0].get_height()
+        for key in [key for key in ptext._font_cache if fontname is None or fontname in (key[0], key[2])]:
+            del ptext._font_cache[key]
+        ptext._fit_cache.clear()
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Gets the cache counters.
+
+        :return dict[str, float]: The hits, misses, hit rate (0 to 1), evictions, how many Surfaces are kept and how many bytes they take up.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+        }
+
+    def reset_stats(self) -> None:
+        """Sets the hits, misses and evictions back to 0."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+_text_cache = TextCache()
+"""The TextCache used by Screen.draw.text() and Screen.draw.textbox()."""
+
+def get_textbox_key(text: str, rect: pygame.Rect, fontname: Optional[str], sysfontname: Optional[str], lineheight: Optional[float], anchor: Optional[tuple[float, float]],
+                    bold: bool, italic: bool, underline: bool, antialias: bool, color, background, widthem: Optional[float], align, owidth: Optional[float], ocolor,
+                    shadow: Optional[tuple[float, float]], scolor, gcolor, alpha: float, angle: float) -> tuple[tuple[float, float], tuple]:
+    """
+    Works out how to draw text wrapped and sized to fit a Rect, like pgzero's textbox(), through the text cache. The font size is only worked out when the text is not kept.
+
+    Not meant for user use. Use Screen.draw.textbox() instead.
+
+    :return tuple[tuple[float, float], tuple]: The anchor point of the text, and the arguments for TextCache.render().
+    """
+    if fontname is None:
+        fontname = ptext.DEFAULT_FONT_NAME
+    if lineheight is None:
+        lineheight = ptext.DEFAULT_LINE_HEIGHT
+    hanchor, vanchor = anchor or (0.5, 0.5)
+    rect = pygame.Rect(rect)
+    key = (text, fontname, ("fit", rect.width, rect.height), sysfontname, antialias, bold, italic, underline, color, background, rect.width, widthem,
+           lineheight, align, owidth, ocolor, shadow, scolor, gcolor, alpha, angle, hanchor, vanchor)
+    return (rect.x + hanchor * rect.width, rect.y + vanchor * rect.height), key
@@ -79,3 +79,23 @@ class ImageLoadError(ScreenError):
         :param args: The messsage to be shown when error is raised.
         """
         super().__init__(*args)
+
+class CameraError(ScreenError):
+    """Error class for incorrect camera settings."""
+    def __init__(self, *args: object) -> None:
+        """
+        Error class for incorrect camera settings.
+
+        :param args: The messsage to be shown when error is raised.
+        """
+        super().__init__(*args)
+
+class RecordingError(ScreenError):
+    """Error class for incorrect recording settings."""
+    def __init__(self, *args: object) -> None:
+        """
+        Error class for incorrect recording settings.
+
+        :param args: The messsage to be shown when error is raised.
+        """
+        super().__init__(*args)
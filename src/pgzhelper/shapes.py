@@ -1,6 +1,6 @@
 from __future__ import annotations
 from .utilities import *
-from .utilities import Rect, pygame, rect_collides_with_circle, circle_collides_with_circle, Enum, overload, math, Union, Optional
+from .utilities import Rect, pygame, collide_circle, Enum, overload, math, Union, Optional
 
 TRIANGLE_CENTER = ("center")
 """Used to indicate the triangle center when pivoting"""
@@ -31,7 +31,7 @@ class Polygon(Shape):
             self.points = args[0]
             """The points of the polygon."""
         else:
-            self.points = list(args[0])
+            self.points = list(args)
             """The points of the polygon."""
 
 class Ellipse(Shape):
@@ -89,6 +89,8 @@ class Triangle(Polygon):
         self.point3 = point3
         """The third/last point in the Triangle"""
 
+        super().__init__(self.point1, self.point2, self.point3)
+
         self.centerx = (self.points[0][0] + self.points[1][0] + self.points[2][0]) / 3
         """The x position of the center of the Triangle."""
 
@@ -98,8 +100,6 @@ class Triangle(Polygon):
         self.center = (self.centerx, self.centery)
         """The center position of the Triangle."""
 
-        super().__init__(self.point1, self.point2, self.point3)
-
     def rotate(self, angle: int, pivot: Union[tuple[int, int], str] = TRIANGLE_CENTER) -> Triangle:
         """
         Rotates the Triangle around pivot. Returns a copy.
@@ -231,10 +231,10 @@ class Circle(Ellipse):
         return (x - self.center[0])**2 + (y - self.center[1])**2 <= self.radius**2
 
     def colliderect(self, rect: Rect):
-        return rect_collides_with_circle(rect, self.center, self.radius)
+        return collide_circle.rect_collides_with_circle(rect, self.center, self.radius)
 
     def collidecircle(self, circle: Circle):
-        return circle_collides_with_circle(*self.center, r1=self.radius, *circle.center, r2=circle.radius)
+        return collide_circle.circle_collides_with_circle(*self.center, self.radius, *circle.center, circle.radius)
 
 class HRect(Rect, Quadrilateral):
     def collidecircle(self, circle: Circle):
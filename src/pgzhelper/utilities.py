@@ -1,24 +1,34 @@
 import os
 import sys
-import cv2
 import math
 import time
 import pygame
 import inspect
+import threading
 import numpy as np
 from typing import *
-from . import _camera
 from enum import Enum
-from .shapes import *
 from .errors import *
-from collide_circle import *
+from ._lazy import LazyModule, LazyAttribute
 from pgzero.clock import clock
 from pgzero.actor import Actor
-from mediapipe.tasks import python
 from pgzero.rect import Rect
 from pgzero.animation import animate
 import pgzero.screen as _pgzero_screen
-from mediapipe import Image, ImageFormat
-from mediapipe.tasks.python import vision
 from pygame import Cursor as _pygame_cursor
 from pgzero.constants import mouse as PGZeroMouse
+
+cv2 = LazyModule("cv2")
+mediapipe = LazyModule("mediapipe")
+python = LazyModule("mediapipe.tasks.python")
+vision = LazyModule("mediapipe.tasks.python.vision")
+collide_circle = LazyModule("collide_circle")
+
+Image = LazyAttribute(mediapipe, "Image")
+ImageFormat = LazyAttribute(mediapipe, "ImageFormat")
+rect_collides_with_circle = LazyAttribute(collide_circle, "rect_collides_with_circle")
+circle_collides_with_circle = LazyAttribute(collide_circle, "circle_collides_with_circle")
+
+from .shapes import *
+from . import _camera
+from . import _recorder
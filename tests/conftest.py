@@ -0,0 +1,20 @@
+"""Shared fixtures for the pgzhelper tests. The tests run headless, on SDL's dummy video and audio drivers."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pgzero.screen
+import pytest
+from pgzhelper import _core
+
+@pytest.fixture
+def screen() -> pgzero.screen.Screen:
+    """Opens a dummy 200 by 150 display and initializes pgzhelper's Screen with it."""
+    pygame.init()
+    screen = pgzero.screen.Screen(pygame.display.set_mode((200, 150)))
+    _core._init(screen)
+    yield screen
+    _core.set_recording(None)
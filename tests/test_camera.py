@@ -0,0 +1,60 @@
+import numpy as np
+import pygame
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from pgzhelper import _camera
+from pgzhelper._sources import ArraySource, GeneratorSource, DeviceSource
+from pgzhelper.errors import CameraError
+
+def solid_frames(colors: list, width: int = 32, height: int = 24) -> np.ndarray:
+    frames = np.empty((len(colors), height, width, 3), np.uint8)
+    for frame, color in zip(frames, colors):
+        frame[...] = color
+    return frames
+
+@pytest.fixture
+def cameras():
+    made = []
+    yield made
+    for camera in made:
+        camera.close()
+
+def test_array_source_frames_come_out_in_order(cameras):
+    bgr = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    camera = _camera.Camera(ArraySource(solid_frames(bgr), 0, "fast", loop=False), threaded=False)
+    cameras.append(camera)
+    seen = []
+    for _ in range(4):
+        camera.update()
+        seen.append(tuple(camera.surface.get_at((5, 5)))[:3])
+    assert seen == [(0, 0, 255), (0, 255, 0), (255, 0, 0), (255, 0, 0)]
+    assert camera.frames_processed == 3
+    assert camera.surface.get_size() == (32, 24)
+
+def test_generator_source_through_update(cameras):
+    def frames():
+        for value in range(0, 250, 50):
+            yield np.full((24, 32, 3), value, np.uint8)
+    camera = _camera.Camera(GeneratorSource(frames, 0, "fast", loop=True), threaded=False)
+    cameras.append(camera)
+    seen = []
+    for _ in range(7):
+        camera.update()
+        seen.append(camera.surface.get_at((0, 0)).r)
+    assert seen == [0, 50, 100, 150, 200, 0, 50]
+
+def test_threaded_camera_delivers_frames(cameras):
+    camera = _camera.Camera(ArraySource(solid_frames([(10, 20, 30)]), 0, "fast"), threaded=True)
+    cameras.append(camera)
+    for _ in range(200):
+        camera.update()
+        if camera.frames_processed:
+            break
+        pygame.time.wait(5)
+    assert tuple(camera.surface.get_at((0, 0)))[:3] == (30, 20, 10)
+
+def test_missing_device_raises_camera_error():
+    with pytest.raises(CameraError):
+        DeviceSource(99)
@@ -0,0 +1,51 @@
+import threading
+import numpy as np
+from pgzhelper._capture import CaptureThread
+
+class BlockingCapture:
+    """A capture whose read() waits until it is let through, and which records if release() happened mid-read."""
+    def __init__(self) -> None:
+        self.go = threading.Event()
+        self.reading = threading.Event()
+        self.released = threading.Event()
+        self.released_while_reading = False
+        self._in_read = False
+
+    def read(self, out=None):
+        self._in_read = True
+        self.reading.set()
+        self.go.wait()
+        self._in_read = False
+        return True, np.zeros((2, 2, 3), np.uint8)
+
+    def release(self) -> None:
+        self.released_while_reading = self._in_read
+        self.released.set()
+
+def test_stop_never_releases_during_read():
+    capture = BlockingCapture()
+    thread = CaptureThread(capture)
+    thread.start()
+    assert capture.reading.wait(1)
+    assert thread.stop(release=True, timeout=0.05) is False
+    assert not capture.released.is_set()
+    capture.go.set()
+    assert capture.released.wait(1)
+    assert not capture.released_while_reading
+
+def test_stop_releases_when_thread_finishes():
+    capture = BlockingCapture()
+    capture.go.set()
+    thread = CaptureThread(capture)
+    thread.start()
+    assert thread.stop(release=True) is True
+    assert capture.released.is_set()
+    assert not thread.is_running()
+
+def test_stop_without_release_keeps_capture_open():
+    capture = BlockingCapture()
+    capture.go.set()
+    thread = CaptureThread(capture)
+    thread.start()
+    assert thread.stop() is True
+    assert not capture.released.is_set()
@@ -0,0 +1,72 @@
+import pygame
+import pytest
+from pgzero.actor import Actor
+from pgzhelper import Screen
+from pgzhelper._dirty import DirtyRects, _dirty_rects, install_flip, uninstall_flip
+
+SCREEN_RECT = pygame.Rect(0, 0, 200, 150)
+
+def test_merge_joins_overlapping_and_close_rects():
+    dirty = DirtyRects(merge_gap=4)
+    merged = dirty.merge([pygame.Rect(10, 10, 10, 10), pygame.Rect(15, 15, 10, 10), pygame.Rect(28, 10, 5, 5)], SCREEN_RECT)
+    assert merged == [pygame.Rect(10, 10, 23, 15)]
+
+def test_merge_keeps_far_rects_apart():
+    dirty = DirtyRects(merge_gap=4)
+    merged = dirty.merge([pygame.Rect(10, 10, 10, 10), pygame.Rect(100, 100, 10, 10)], SCREEN_RECT)
+    assert sorted(merged) == [pygame.Rect(10, 10, 10, 10), pygame.Rect(100, 100, 10, 10)]
+
+def test_merge_repeats_until_no_rects_touch():
+    dirty = DirtyRects(merge_gap=0)
+    merged = dirty.merge([pygame.Rect(0, 0, 10, 10), pygame.Rect(40, 0, 10, 10), pygame.Rect(5, 0, 40, 10)], SCREEN_RECT)
+    assert merged == [pygame.Rect(0, 0, 50, 10)]
+
+def test_merge_clips_and_drops_offscreen_rects():
+    dirty = DirtyRects()
+    merged = dirty.merge([pygame.Rect(190, 140, 20, 20), pygame.Rect(300, 300, 10, 10)], SCREEN_RECT)
+    assert merged == [pygame.Rect(190, 140, 10, 10)]
+
+def test_present_shows_whole_screen_past_coverage_threshold(screen):
+    dirty = DirtyRects(coverage_threshold=0.5)
+    dirty.enabled = True
+    flips = []
+    dirty.present(lambda: flips.append(1))
+    dirty.add(pygame.Rect(0, 0, 20, 20))
+    assert dirty.present(lambda: flips.append(1)) == [pygame.Rect(0, 0, 20, 20)]
+    dirty.add(pygame.Rect(0, 0, 150, 150))
+    assert dirty.present(lambda: flips.append(1)) is None
+    assert len(flips) == 2
+
+@pytest.fixture
+def tracking(screen):
+    install_flip()
+    Screen.dirty_rects.enable()
+    _dirty_rects.full, _dirty_rects.rects = False, []
+    yield screen
+    Screen.dirty_rects.disable()
+    uninstall_flip()
+
+def test_actor_draw_marks_its_area(tracking, tmp_path, monkeypatch):
+    import pgzero.game
+    from pgzero import loaders
+    (tmp_path / "images").mkdir()
+    pygame.image.save(pygame.Surface((8, 6)), str(tmp_path / "images" / "box.png"))
+    monkeypatch.setattr(loaders, "root", str(tmp_path))
+    monkeypatch.setattr(pgzero.game, "screen", tracking, raising=False)
+    Actor("box", topleft=(30, 40)).draw()
+    assert _dirty_rects.rects == [pygame.Rect(30, 40, 8, 6)]
+    assert not _dirty_rects.full
+
+def test_pgzero_draw_and_fill_mark_whole_screen(tracking):
+    tracking.draw.line((0, 0), (10, 10), "red")
+    assert _dirty_rects.full
+    _dirty_rects.full = False
+    tracking.fill("black")
+    assert _dirty_rects.full
+
+def test_uninstall_puts_pgzero_screen_back(screen):
+    import pgzero.screen
+    blit, line = pgzero.screen.Screen.blit, pgzero.screen.SurfacePainter.line
+    install_flip()
+    uninstall_flip()
+    assert pgzero.screen.Screen.blit is blit and pgzero.screen.SurfacePainter.line is line
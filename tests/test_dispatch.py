@@ -0,0 +1,64 @@
+from pgzhelper._dispatch import InputCoalescer
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def recording_handlers(events: list) -> dict:
+    return {
+        "on_mouse_down": lambda pos, button: events.append(("down", pos)),
+        "on_mouse_up": lambda pos, button: events.append(("up", pos)),
+        "on_mouse_move": lambda pos: events.append(("move", pos)),
+    }
+
+def test_events_arrive_in_order():
+    coalescer, events = InputCoalescer(), []
+    coalescer.push_move((1, 1))
+    coalescer.push_move((2, 2))
+    coalescer.push_button("on_mouse_down", (2, 2), 1)
+    coalescer.push_move((3, 3))
+    coalescer.push_button("on_mouse_up", (3, 3), 1)
+    coalescer.flush(recording_handlers(events), {})
+    assert events == [("move", (2, 2)), ("down", (2, 2)), ("move", (3, 3)), ("up", (3, 3))]
+    assert coalescer.moves_received == 3
+    assert coalescer.moves_delivered == 2
+
+def test_rate_limited_move_holds_back_later_buttons():
+    clock = FakeClock()
+    coalescer, events = InputCoalescer(clock=clock), []
+    handlers, rates = recording_handlers(events), {"on_mouse_move": 10}
+    coalescer.push_move((1, 1))
+    coalescer.flush(handlers, rates)
+    coalescer.push_move((2, 2))
+    coalescer.push_button("on_mouse_down", (2, 2), 1)
+    coalescer.flush(handlers, rates)
+    assert events == [("move", (1, 1))]
+    clock.now = 0.1
+    coalescer.flush(handlers, rates)
+    assert events == [("move", (1, 1)), ("move", (2, 2)), ("down", (2, 2))]
+
+def test_path_keeps_newest_positions():
+    coalescer = InputCoalescer(path_length=3)
+    for x in range(6):
+        coalescer.push_move((x, 0))
+    coalescer.flush({}, {})
+    assert coalescer.path == ((3, 0), (4, 0), (5, 0))
+    coalescer.push_move((9, 9))
+    coalescer.flush({}, {})
+    assert coalescer.path == ((9, 9),)
+
+def test_get_path_returns_a_copy(screen):
+    from pgzhelper import Screen
+    from pgzhelper._core import _input_coalescer
+    Screen.mouse.set_path_length(2)
+    try:
+        _input_coalescer.push_move((5, 5))
+        _input_coalescer.flush({}, {})
+        path = Screen.mouse.get_path()
+        path.clear()
+        assert Screen.mouse.get_path() == [(5, 5)]
+    finally:
+        Screen.mouse.set_path_length(0)
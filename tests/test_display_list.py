@@ -0,0 +1,57 @@
+import pygame
+from pgzhelper import Screen, DisplayList
+
+def record(draw) -> DisplayList:
+    display_list = Screen.display_list.begin()
+    try:
+        draw()
+    finally:
+        Screen.display_list.end()
+    return display_list
+
+def test_same_scene_has_no_diff(screen):
+    scene = lambda: (Screen.fill("black"), Screen.draw.filled_rect(pygame.Rect(10, 10, 20, 20), "red"))
+    first, second = record(scene), record(scene)
+    assert first == second
+    assert second.diff(first, screen.surface.get_rect()) == []
+
+def test_diff_covers_old_and_new_position(screen):
+    first = record(lambda: Screen.draw.filled_rect(pygame.Rect(10, 10, 20, 20), "red"))
+    second = record(lambda: Screen.draw.filled_rect(pygame.Rect(50, 10, 20, 20), "red"))
+    changed = second.diff(first, screen.surface.get_rect())
+    assert pygame.Rect(10, 10, 20, 20).collidelist(changed) != -1
+    assert pygame.Rect(50, 10, 20, 20).collidelist(changed) != -1
+
+def test_color_valued_text_can_be_diffed(screen):
+    first = record(lambda: Screen.draw.text("one", topleft=(10, 10), color=pygame.Color("red"), ocolor=pygame.Color("blue"), owidth=1))
+    same = record(lambda: Screen.draw.text("one", topleft=(10, 10), color=pygame.Color("red"), ocolor=pygame.Color("blue"), owidth=1))
+    second = record(lambda: Screen.draw.text("two", topleft=(10, 10), color=pygame.Color("red"), ocolor=pygame.Color("blue"), owidth=1))
+    screen_rect = screen.surface.get_rect()
+    assert same.diff(first, screen_rect) == []
+    assert second.diff(first, screen_rect)
+    Screen.display_list.replay(first)
+    assert Screen.display_list.replay_changes(second, first)
+
+def test_color_valued_dynamic_text_can_be_diffed(screen):
+    first = record(lambda: Screen.draw.dynamic_text("1", topleft=(10, 10), color=pygame.Color("red")))
+    second = record(lambda: Screen.draw.dynamic_text("2", topleft=(10, 10), color=pygame.Color("red")))
+    assert second.diff(first, screen.surface.get_rect())
+
+def test_unhashable_command_always_changes(screen):
+    class UnhashableSurface(pygame.Surface):
+        __hash__ = None
+    image = UnhashableSurface((5, 5))
+    first, second = DisplayList(), DisplayList()
+    first.blit(image, (1, 1))
+    second.blit(image, (1, 1))
+    second.fill("black")
+    assert pygame.Rect(1, 1, 5, 5).collidelist(second.diff(first, screen.surface.get_rect())) != -1
+
+def test_partial_replay_matches_full_replay(screen):
+    first = record(lambda: (Screen.fill("black"), Screen.draw.circle((50, 50), 10, "white"), Screen.draw.text("hi", topleft=(100, 100))))
+    second = record(lambda: (Screen.fill("black"), Screen.draw.circle((70, 50), 10, "white"), Screen.draw.text("hi", topleft=(100, 100))))
+    Screen.display_list.replay(first)
+    Screen.display_list.replay_changes(second, first)
+    partial = pygame.surfarray.array3d(screen.surface)
+    Screen.display_list.replay(second)
+    assert (partial == pygame.surfarray.array3d(screen.surface)).all()
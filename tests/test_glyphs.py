@@ -0,0 +1,25 @@
+from pgzhelper import _glyphs
+from pgzhelper._glyphs import MAX_ATLASES, get_atlas, clear_atlases
+
+STYLE = (None, 20, None, True, False, False)
+
+def atlas(color):
+    return get_atlas(*STYLE, color, None, None, None, None)
+
+def test_changing_color_keeps_atlases_bounded(screen):
+    clear_atlases()
+    for red in range(MAX_ATLASES * 3):
+        atlas((red, 0, 0)).draw(screen.surface, "123", (0, 0))
+    assert len(_glyphs._atlases) == MAX_ATLASES
+    clear_atlases()
+
+def test_recently_used_atlas_is_kept(screen):
+    clear_atlases()
+    first = atlas("red")
+    for red in range(MAX_ATLASES - 1):
+        atlas((red, 1, 1))
+    assert atlas("red") is first
+    atlas((255, 1, 1))
+    assert atlas("red") is first
+    assert (None, 20, None, True, False, False, (0, 1, 1), None, None, None, None) not in _glyphs._atlases
+    clear_atlases()
@@ -0,0 +1,41 @@
+import pygame
+import pytest
+from pgzhelper._gradient import draw_gradient_line, get_gradient_line_bounds
+
+def test_horizontal_line_fades_between_colors():
+    surface = pygame.Surface((40, 10))
+    bounds = draw_gradient_line(surface, (5, 5), (35, 5), (255, 0, 0), (0, 0, 255))
+    assert tuple(surface.get_at((5, 5)))[:3] == (255, 0, 0)
+    assert tuple(surface.get_at((35, 5)))[:3] == (0, 0, 255)
+    middle = surface.get_at((20, 5))
+    assert 100 < middle.r < 155 and 100 < middle.b < 155
+    assert surface.get_at((20, 3)) == pygame.Color(0, 0, 0)
+    assert bounds.contains(pygame.Rect(5, 5, 31, 1))
+
+def covered(surface: pygame.Surface) -> set:
+    width, height = surface.get_size()
+    return {(x, y) for x in range(width) for y in range(height) if surface.get_at((x, y)).r}
+
+@pytest.mark.parametrize("start, end, thickness", [((5, 20), (45, 20), 1), ((5, 20), (45, 20), 3), ((20, 5), (20, 45), 4), ((5, 5), (45, 45), 1)])
+def test_straight_lines_cover_the_same_pixels_as_pygame(start, end, thickness):
+    expected, surface = pygame.Surface((50, 50)), pygame.Surface((50, 50))
+    pygame.draw.line(expected, "white", start, end, thickness)
+    draw_gradient_line(surface, start, end, "white", "white", thickness)
+    assert covered(surface) == covered(expected)
+
+def test_sloped_line_has_no_gaps():
+    surface = pygame.Surface((50, 50))
+    draw_gradient_line(surface, (5, 40), (45, 8), "white", "white")
+    assert {x for x, _ in covered(surface)} == set(range(5, 46))
+
+def test_drawing_stays_inside_bounds():
+    surface = pygame.Surface((60, 60))
+    bounds = draw_gradient_line(surface, (10, 10), (50, 30), "red", "yellow", thickness=6, antialias=True)
+    assert bounds == get_gradient_line_bounds((10, 10), (50, 30), 6, True)
+    outside = [(x, y) for x in range(60) for y in range(60) if not bounds.collidepoint(x, y) and surface.get_at((x, y)) != pygame.Color(0, 0, 0)]
+    assert outside == []
+
+def test_same_start_and_end_draws_nothing():
+    surface = pygame.Surface((10, 10))
+    bounds = draw_gradient_line(surface, (5, 5), (5, 5), "red", "blue", thickness=3)
+    assert bounds.width == 0 and bounds.height == 0
@@ -0,0 +1,40 @@
+import json
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ("cv2", "mediapipe", "collide_circle")
+LAZY_NAMES = ("Image", "ImageFormat", "rect_collides_with_circle", "circle_collides_with_circle")
+MAX_IMPORT_MS = 1000.0
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from pgzhelper import *
+import_ms = (time.perf_counter() - start) * 1000
+names = [name for name in %r if name in globals()]
+import pygame, pgzero.screen
+from pgzhelper import _core
+pygame.init()
+_core._init(pgzero.screen.Screen(pygame.display.set_mode((200, 200))))
+Screen.fill("black")
+Screen.draw.rect(Rect(10, 10, 50, 50), "red", 2)
+Screen.draw.circle((100, 100), 20, "blue")
+Screen.draw.text("hello", topleft=(5, 5))
+heavy = [name for name in %r if name in sys.modules]
+print(json.dumps({"import_ms": import_ms, "names": names, "heavy": heavy}))
+"""
+
+def run_import() -> dict:
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env = dict(os.environ, PYTHONPATH=src + os.pathsep + os.environ.get("PYTHONPATH", ""), SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    output = subprocess.run([sys.executable, "-c", SCRIPT % (LAZY_NAMES, HEAVY_MODULES)], env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def test_star_import_is_fast_and_complete():
+    results = [run_import() for _ in range(2)]
+    assert results[0]["names"] == list(LAZY_NAMES)
+    assert min(result["import_ms"] for result in results) < MAX_IMPORT_MS
+
+def test_drawing_does_not_import_heavy_modules():
+    assert run_import()["heavy"] == []
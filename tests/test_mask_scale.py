@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from pgzhelper import _camera
+from pgzhelper._segmentation import SegmentationBackend
+from pgzhelper._sources import ArraySource
+
+class SizeBackend(SegmentationBackend):
+    """Records the size of every frame it is given."""
+    def __init__(self, scales_with_size: bool, resizes_frames: bool = False) -> None:
+        super().__init__()
+        self.scales_with_size = scales_with_size
+        self.resizes_frames = resizes_frames
+        self.sizes = []
+        self.frames = []
+
+    def _segment(self, frame: np.ndarray) -> np.ndarray:
+        self.sizes.append(frame.shape[:2])
+        self.frames.append(frame.copy())
+        return np.zeros(frame.shape[:2], np.float32)
+
+def disk(width: int = 320, height: int = 240) -> tuple[np.ndarray, np.ndarray]:
+    y, x = np.mgrid[0:height, 0:width]
+    mask = ((x - width // 2) ** 2 + (y - height // 2) ** 2 < (height // 4) ** 2).astype(np.float32)
+    frame = np.empty((height, width, 3), np.uint8)
+    frame[...] = (128, 0, 0)
+    frame[..., 1] = y * 255 // (height - 1)
+    frame[..., 2] = x * 255 // (width - 1)
+    frame[mask > 0] = (200, 90, 60)
+    return frame, mask
+
+def edge_error(mask: np.ndarray, truth: np.ndarray) -> float:
+    kernel = np.ones((9, 9), np.uint8)
+    band = cv2.dilate(truth, kernel) != cv2.erode(truth, kernel)
+    return float(np.abs(mask - truth)[band].mean())
+
+@pytest.fixture
+def camera():
+    frames = np.zeros((2, 240, 320, 3), np.uint8)
+    camera = _camera.Camera(ArraySource(frames, 0, "fast"), threaded=False)
+    yield camera
+    camera.close()
+
+@pytest.mark.parametrize("scales_with_size, expected", [(True, (120, 160)), (False, (240, 320))])
+def test_mask_scale_only_shrinks_frames_for_backends_that_scale(camera, scales_with_size, expected):
+    camera.backend = SizeBackend(scales_with_size)
+    camera.mask_scale = 0.5
+    mask = camera._segment_scaled(np.zeros((240, 320, 3), np.uint8))
+    assert camera.backend.sizes == [expected]
+    assert mask.shape == (240, 320)
+
+@pytest.mark.parametrize("resizes_frames, interpolation", [(True, cv2.INTER_NEAREST), (False, cv2.INTER_LINEAR)])
+def test_backends_that_resize_get_a_nearest_neighbour_copy(camera, resizes_frames, interpolation):
+    frame, _ = disk()
+    camera.backend = SizeBackend(True, resizes_frames)
+    camera.mask_scale = 0.75
+    camera._segment_scaled(frame)
+    assert np.array_equal(camera.backend.frames[0], cv2.resize(frame, (240, 180), interpolation=interpolation))
+
+def test_mediapipe_uses_mask_scale(camera):
+    pytest.importorskip("mediapipe")
+    backend = _camera._create_segmenter()
+    try:
+        sizes = []
+        segment = backend._segment
+        backend._segment = lambda frame: sizes.append(frame.shape[:2]) or segment(frame)
+        camera.backend = backend
+        camera.mask_scale = 0.5
+        assert camera._segment_scaled(np.zeros((240, 320, 3), np.uint8)).shape == (240, 320)
+        assert sizes == [(120, 160)]
+    finally:
+        backend.close()
+
+@pytest.mark.parametrize("scale", [0.75, 0.5, 0.25])
+def test_refined_edges_beat_bilinear(scale):
+    frame, truth = disk()
+    size = (round(320 * scale), round(240 * scale))
+    small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+    small_mask = cv2.resize(truth, size, interpolation=cv2.INTER_AREA)
+    bilinear = _camera._upsample_mask(small_mask, small, frame, edge_aware=False)
+    refined = _camera._upsample_mask(small_mask, small, frame, edge_aware=True)
+    assert refined.shape == truth.shape
+    assert 0 <= refined.min() and refined.max() <= 1
+    assert edge_error(refined, truth) < edge_error(bilinear, truth)
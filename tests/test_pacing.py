@@ -0,0 +1,69 @@
+from pgzhelper._pacing import FrameScheduler, FixedTimestep
+
+class FakeClock:
+    """A clock that only moves when slept on, optionally sleeping longer than asked."""
+    def __init__(self, oversleep: float = 0.0) -> None:
+        self.now = 0.0
+        self.oversleep = oversleep
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds + self.oversleep
+
+def test_deadlines_stay_on_schedule():
+    clock = FakeClock()
+    scheduler = FrameScheduler(10, clock=clock, sleep=clock.sleep)
+    scheduler.wait()
+    deadlines = []
+    for work in (0.02, 0.05, 0.0):
+        clock.now += work
+        scheduler.wait()
+        deadlines.append(round(clock.now, 9))
+    assert deadlines == [0.1, 0.2, 0.3]
+
+def test_late_frame_catches_up_without_sleeping():
+    clock = FakeClock()
+    scheduler = FrameScheduler(10, clock=clock, sleep=clock.sleep)
+    scheduler.wait()
+    clock.now += 0.15
+    assert scheduler.wait() == 0.0
+    assert abs(scheduler.wait() - 0.05) < 1e-9
+    assert scheduler.frames_dropped == 0
+
+def test_far_behind_drops_frames_and_restarts():
+    clock = FakeClock()
+    scheduler = FrameScheduler(10, max_lag_frames=3, clock=clock, sleep=clock.sleep)
+    scheduler.wait()
+    clock.now += 1.0
+    scheduler.wait()
+    assert scheduler.frames_dropped == 8
+    assert abs(scheduler.wait() - 0.1) < 1e-9
+
+def test_wait_reports_oversleep():
+    clock = FakeClock(oversleep=0.004)
+    scheduler = FrameScheduler(10, clock=clock, sleep=clock.sleep)
+    scheduler.wait()
+    clock.now += 0.03
+    slept = scheduler.wait()
+    assert abs(slept - 0.074) < 1e-9
+    assert scheduler.last_sleep == slept
+
+def test_no_limit_never_sleeps():
+    clock = FakeClock()
+    scheduler = FrameScheduler(None, clock=clock, sleep=clock.sleep)
+    assert scheduler.wait() == 0.0
+    assert scheduler.wait() == 0.0
+    assert clock.now == 0.0
+
+def test_fixed_timestep_runs_whole_steps():
+    clock = FakeClock()
+    timestep = FixedTimestep(8, max_steps=5, clock=clock)
+    assert timestep.steps() == 1
+    clock.now = 0.3125
+    assert timestep.steps() == 2
+    assert timestep.alpha == 0.5
+    clock.now = 2.0
+    assert timestep.steps() == 5
+    assert timestep.steps_dropped == 9
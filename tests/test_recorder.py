@@ -0,0 +1,88 @@
+import os
+import threading
+import numpy as np
+import pytest
+from pgzhelper._recorder import Recorder
+from pgzhelper.errors import RecordingError
+
+FRAME = np.zeros((8, 10, 3), np.uint8)
+
+def gate_writes(recorder: Recorder) -> tuple[threading.Event, threading.Event]:
+    """Makes the encoder wait before writing each frame until it is let through."""
+    entered, go = threading.Event(), threading.Event()
+    write = recorder._write
+    def gated(frame, order):
+        entered.set()
+        go.wait()
+        write(frame, order)
+    recorder._write = gated
+    return entered, go
+
+def run_in_thread(func) -> tuple[threading.Thread, list]:
+    outcome = []
+    def run():
+        try:
+            outcome.append(func())
+        except Exception as error:
+            outcome.append(error)
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread, outcome
+
+def test_drop_policy_skips_frames_when_queue_is_full(tmp_path):
+    recorder = Recorder(str(tmp_path / "frames"), queue_size=2, policy="drop")
+    entered, go = gate_writes(recorder)
+    assert recorder.submit(FRAME)
+    assert entered.wait(1)
+    results = [recorder.submit(FRAME) for _ in range(4)]
+    go.set()
+    recorder.stop()
+    assert results == [True, True, False, False]
+    stats = recorder.get_stats()
+    assert (stats["frames_submitted"], stats["frames_written"], stats["frames_dropped"]) == (5, 3, 2)
+    assert len(os.listdir(tmp_path / "frames")) == 3
+
+def test_block_policy_waits_and_keeps_every_frame(tmp_path):
+    recorder = Recorder(str(tmp_path / "frames"), queue_size=1, policy="block")
+    entered, go = gate_writes(recorder)
+    recorder.submit(FRAME)
+    assert entered.wait(1)
+    thread, outcome = run_in_thread(lambda: [recorder.submit(FRAME) for _ in range(3)])
+    thread.join(0.2)
+    assert thread.is_alive()
+    go.set()
+    thread.join(1)
+    recorder.stop()
+    assert outcome == [[True, True, True]]
+    assert recorder.get_stats()["frames_written"] == 4
+    assert recorder.frames_dropped == 0
+    assert recorder.blocked_time > 0
+
+def test_failed_write_wakes_blocked_submitter(tmp_path):
+    (tmp_path / "file").write_text("")
+    recorder = Recorder(str(tmp_path / "file" / "frames") + os.sep, queue_size=1, policy="block")
+    thread, outcome = run_in_thread(lambda: [recorder.submit(FRAME) for _ in range(5)])
+    thread.join(2)
+    assert not thread.is_alive()
+    assert isinstance(outcome[0], RecordingError)
+    assert not recorder.is_recording()
+    recorder.stop()
+    assert recorder.frames_written == 0
+
+def test_unopened_video_raises_from_stop(tmp_path):
+    recorder = Recorder(str(tmp_path / "missing" / "video.avi"), fourcc="MJPG")
+    recorder.submit(FRAME)
+    with pytest.raises(RecordingError):
+        recorder.stop()
+    assert recorder.frames_written == 0
+    assert isinstance(recorder.error, RecordingError)
+
+def test_video_is_written(tmp_path):
+    path = tmp_path / "video.avi"
+    recorder = Recorder(str(path), fourcc="MJPG")
+    for _ in range(3):
+        recorder.submit(FRAME)
+    recorder.stop()
+    assert recorder.frames_written == 3
+    assert recorder.error is None
+    assert path.stat().st_size > 0
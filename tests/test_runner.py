@@ -0,0 +1,57 @@
+import pytest
+from pgzhelper import Screen, _runner
+from pgzhelper._core import _frame_profiler
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+@pytest.fixture
+def game(screen):
+    clock = FakeClock()
+    calls = []
+    namespace = {"__name__": "__main__", "screen": screen}
+    functions = {"draw": lambda: calls.append("draw"), "update": lambda: calls.append("update")}
+    _runner._install(namespace, functions, clock=clock, sleep=clock.sleep)
+    yield namespace, calls
+    Screen.stats.time_handlers(False)
+    _runner._handlers.clear()
+
+def frame(namespace: dict) -> None:
+    namespace["update"]()
+    namespace["draw"]()
+
+def test_assigned_handler_is_used_from_next_frame(game):
+    namespace, calls = game
+    frame(namespace)
+    namespace["update"] = lambda dt: calls.append(("new update", dt))
+    namespace["draw"]()
+    _runner._handlers["update"](0.5)
+    assert calls == ["update", "draw", "draw", ("new update", 0.5)]
+    assert _runner._handlers["update"].rebuilds == 2
+
+def test_replaced_code_rebuilds_once(game):
+    namespace, calls = game
+    user_draw = _runner._handlers["draw"].func
+    user_draw.__code__ = (lambda: calls.append("new draw")).__code__
+    frame(namespace)
+    frame(namespace)
+    assert [call for call in calls if "draw" in call] == ["new draw", "new draw"]
+    assert _runner._handlers["draw"].rebuilds == 2
+
+def test_calls_are_only_timed_when_asked(game):
+    namespace, calls = game
+    frame(namespace)
+    assert _runner.get_stats()["draw"]["calls"] == 1
+    assert _runner.get_stats()["draw"]["total_ms"] == 0
+    Screen.stats.time_handlers()
+    frame(namespace)
+    frame(namespace)
+    assert _runner._handlers["draw"].timed
+    assert _runner.get_stats()["draw"]["calls"] == 3
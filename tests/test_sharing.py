@@ -0,0 +1,70 @@
+import time
+from multiprocessing import shared_memory
+import numpy as np
+import pytest
+from pgzhelper import _sharing
+from pgzhelper._sharing import FramePublisher, FrameReader
+from pgzhelper.errors import CameraError
+
+WIDTH, HEIGHT = 8, 6
+
+def solid(value: int) -> np.ndarray:
+    return np.full((HEIGHT, WIDTH, 3), value, np.uint8)
+
+@pytest.fixture
+def publisher():
+    publisher = FramePublisher(WIDTH, HEIGHT, slots=2)
+    yield publisher
+    publisher.close()
+
+@pytest.fixture
+def reader(publisher):
+    reader = FrameReader(publisher.name)
+    yield reader
+    reader.close()
+
+def test_publish_without_reader_is_skipped(publisher):
+    assert publisher.publish(solid(1)) is False
+    assert publisher.get_stats() == {"frames_published": 0, "frames_skipped": 1, "readers_attached": 0}
+
+def test_latest_returns_views_of_the_newest_frame(publisher, reader):
+    assert reader.latest() is None
+    mask = np.full((HEIGHT, WIDTH), 0.5, np.float32)
+    assert publisher.publish(solid(7), mask, timestamp=1.5) is True
+    shared = reader.latest()
+    assert (shared.sequence, shared.timestamp) == (1, 1.5)
+    assert np.array_equal(shared.frame, solid(7)) and np.array_equal(shared.mask, mask)
+    assert not shared.frame.flags.owndata and not shared.mask.flags.owndata
+    copied = reader.latest(copy=True)
+    assert copied.frame.flags.owndata and copied.mask.flags.owndata
+    publisher.publish(solid(8))
+    assert reader.latest().mask is None
+
+def test_frame_is_invalid_once_its_slot_is_reused(publisher, reader):
+    publisher.publish(solid(1))
+    shared, copied = reader.latest(), reader.latest(copy=True)
+    publisher.publish(solid(2))
+    assert shared.is_valid()
+    publisher.publish(solid(3))
+    assert not shared.is_valid()
+    assert np.array_equal(shared.frame, solid(3))
+    assert copied.is_valid() and np.array_equal(copied.frame, solid(1))
+
+def test_wait_times_out_without_a_new_frame(publisher, reader):
+    publisher.publish(solid(1))
+    assert reader.wait(timeout=1).sequence == 1
+    start = time.perf_counter()
+    assert reader.wait(timeout=0.05) is None
+    assert time.perf_counter() - start >= 0.05
+    publisher.publish(solid(2))
+    assert reader.wait(timeout=1).sequence == 2
+
+def test_reader_refuses_memory_that_is_not_a_frame_ring(monkeypatch):
+    memory = shared_memory.SharedMemory(create=True, size=256)
+    monkeypatch.setattr(_sharing, "_published_names", {memory.name})
+    try:
+        with pytest.raises(CameraError):
+            FrameReader(memory.name)
+    finally:
+        memory.close()
+        memory.unlink()
@@ -0,0 +1,31 @@
+import pygame
+from pgzhelper._stats import FrameProfiler
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def test_percentiles_of_recorded_frames():
+    profiler = FrameProfiler(size=4)
+    for ms in (1, 2, 3, 4, 5):
+        profiler.add("draw", ms / 1000)
+        profiler.end_frame()
+    assert profiler.get_times("draw") == [0.002, 0.003, 0.004, 0.005]
+    assert profiler.get_percentiles("draw", (50, 100)) == {"p50": 3.0, "p100": 5.0}
+
+def test_overlay_is_only_rendered_every_interval(screen, monkeypatch):
+    clock = FakeClock()
+    profiler = FrameProfiler(clock=clock)
+    renders = []
+    render = profiler._render_overlay
+    monkeypatch.setattr(profiler, "_render_overlay", lambda: renders.append(clock.now) or render())
+    first = profiler.draw_overlay(screen.surface)
+    clock.now = profiler.overlay_interval / 2
+    assert profiler.draw_overlay(screen.surface) == first
+    clock.now = profiler.overlay_interval
+    profiler.draw_overlay(screen.surface)
+    assert renders == [0.0, profiler.overlay_interval]
+    assert screen.surface.get_rect().contains(first)
@@ -0,0 +1,40 @@
+from pgzhelper._text import TextCache
+
+def render(cache: TextCache, text: str):
+    return cache.render(text, None, 20, None, True, False, False, False, "white", None, None, None, None, None,
+                        None, None, None, None, None, 1.0, 0, 0.0, 0.0)
+
+def surface_bytes(surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+def test_kept_text_is_reused(screen):
+    cache = TextCache()
+    first = render(cache, "score")
+    assert render(cache, "score") is first
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+def test_least_recently_used_text_is_evicted(screen):
+    sizes = {text: surface_bytes(render(TextCache(), text)[0]) for text in ("aaaa", "bbbb", "cccc")}
+    cache = TextCache(max_bytes=max(sizes["aaaa"] + sizes["bbbb"], sizes["aaaa"] + sizes["cccc"]))
+    render(cache, "aaaa")
+    render(cache, "bbbb")
+    render(cache, "aaaa")
+    render(cache, "cccc")
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= cache.max_bytes
+    misses = cache.misses
+    render(cache, "aaaa")
+    assert cache.misses == misses
+    render(cache, "bbbb")
+    assert cache.misses == misses + 1
+
+def test_shrinking_max_bytes_evicts(screen):
+    cache = TextCache()
+    for text in ("one", "two", "three"):
+        render(cache, text)
+    cache.set_max_bytes(0)
+    assert cache.get_stats()["entries"] == 0
+    assert cache.bytes == 0